@@ -2,12 +2,16 @@ import asyncio
 import base64
 import os
 import random
+import sqlite3
+import time
 from multiprocessing import Pool
+from unittest import mock
 from urllib.parse import urlparse
 
 import pytest
 import wandb
 from wandb.sdk import wandb_artifacts
+from wandb.sdk.interface.artifacts import artifact_cache
 from wandb.sdk.internal.artifact_saver import get_staging_dir
 
 
@@ -176,6 +180,159 @@ def test_artifacts_cache_cleanup_tmp_files(cache):
     assert reclaimed_bytes == 1000
 
 
+def _write_cache_object(cache, digest, size):
+    path, _, opener = cache.check_md5_obj_path(b64_md5=digest, size=size)
+    with opener() as f:
+        f.write(size * "a")
+    return path
+
+
+def test_artifacts_cache_evicts_over_max_size(tmp_path):
+    cache = wandb_artifacts.ArtifactsCache(tmp_path, max_size=2500)
+
+    path_1 = _write_cache_object(cache, "aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+    path_2 = _write_cache_object(cache, "bbbbbbbbbbbbbbbbbbbbbb==", 1000)
+    # Using an object makes it the most recently used.
+    _, hit, _ = cache.check_md5_obj_path("aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+    assert hit
+    path_3 = _write_cache_object(cache, "cccccccccccccccccccccc==", 1000)
+
+    assert os.path.exists(path_1)
+    assert not os.path.exists(path_2)
+    assert os.path.exists(path_3)
+    assert cache._index.total_size() == 2000
+
+
+def test_artifacts_cache_cleanup_uses_index(cache, monkeypatch):
+    path_1 = _write_cache_object(cache, "aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+    path_2 = _write_cache_object(cache, "bbbbbbbbbbbbbbbbbbbbbb==", 1000)
+
+    # Once the index exists, cleanup doesn't need to walk the cache.
+    monkeypatch.setattr(os, "walk", mock.Mock(side_effect=AssertionError))
+    assert cache.cleanup(1500) == 1000
+    assert not os.path.exists(path_1)
+    assert os.path.exists(path_2)
+
+
+def test_artifacts_cache_works_while_index_is_locked(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_cache._CacheIndex, "_TIMEOUT", 0.1)
+    cache = wandb_artifacts.ArtifactsCache(tmp_path)
+    path = _write_cache_object(cache, "aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+
+    other = sqlite3.connect(cache._index._db_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        # Index maintenance is skipped, but using the cache still works.
+        _, hit, _ = cache.check_md5_obj_path("aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+        assert hit
+        new_path = _write_cache_object(cache, "bbbbbbbbbbbbbbbbbbbbbb==", 500)
+        assert os.path.exists(new_path)
+        assert cache._index.total_size() is None
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+    assert os.path.exists(path)
+    assert cache._index.total_size() == 1000
+
+
+def test_artifacts_cache_index_built_in_batches(cache, monkeypatch):
+    _write_cache_object(cache, "aaaaaaaaaaaaaaaaaaaaaa==", 1000)
+    _write_cache_object(cache, "bbbbbbbbbbbbbbbbbbbbbb==", 500)
+    os.remove(cache._index._db_path)
+
+    monkeypatch.setattr(artifact_cache._CacheIndex, "_BUILD_BATCH_SIZE", 1)
+    transaction = mock.Mock(wraps=artifact_cache._transaction)
+    monkeypatch.setattr(artifact_cache, "_transaction", transaction)
+    rebuilt = wandb_artifacts.ArtifactsCache(cache._cache_dir)
+    assert rebuilt._index.total_size() == 1500
+    # one transaction per object, and one for the total
+    assert transaction.call_count == 3
+
+
+def test_file_digest_cache(cache, tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+    old = time.time() - 60
+    os.utime(file, (old, old))
+    stat = os.stat(file)
+
+    digests = cache.file_digests
+    assert digests.get(file, stat) is None
+    digests.put(file, stat, "my-digest")
+    digests.commit()
+    assert digests.get(file, stat) == "my-digest"
+
+    # A fresh cache object reads the persisted entry.
+    reopened = wandb_artifacts.ArtifactsCache(cache._cache_dir).file_digests
+    assert reopened.get(file, stat) == "my-digest"
+
+    file.write_text("hello, world")
+    os.utime(file, (old, old + 1))
+    assert digests.get(file, os.stat(file)) is None
+
+
+def test_file_digest_cache_writes_in_batches(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_cache.FileDigestCache, "_WRITE_BATCH_SIZE", 2)
+    old = time.time() - 60
+    stats = {}
+    for i in range(3):
+        file = tmp_path / f"{i}.txt"
+        file.write_text(str(i))
+        os.utime(file, (old, old))
+        stats[file] = os.stat(file)
+
+    digests = cache.file_digests
+    for i, (file, stat) in enumerate(stats.items()):
+        digests.put(file, stat, f"digest-{i}")
+
+    # Full batches are written right away, the rest on commit.
+    reader = wandb_artifacts.ArtifactsCache(cache._cache_dir).file_digests
+    assert [reader.get(file, stat) for file, stat in stats.items()] == [
+        "digest-0",
+        "digest-1",
+        None,
+    ]
+    digests.commit()
+    assert [reader.get(file, stat) for file, stat in stats.items()] == [
+        "digest-0",
+        "digest-1",
+        "digest-2",
+    ]
+
+
+def test_file_digest_cache_skips_recently_modified_files(cache, tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("hello")
+    stat = os.stat(file)
+
+    cache.file_digests.put(file, stat, "my-digest")
+    assert cache.file_digests.get(file, stat) is None
+
+
+def test_add_dir_reuses_cached_digests(cache, tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    old = time.time() - 60
+    for i in range(3):
+        file = data_dir / f"{i}.txt"
+        file.write_text(str(i))
+        os.utime(file, (old, old))
+
+    monkeypatch.setattr(wandb_artifacts, "get_artifacts_cache", lambda: cache)
+    md5_file_b64 = mock.Mock(wraps=wandb_artifacts.md5_file_b64)
+    monkeypatch.setattr(wandb_artifacts, "md5_file_b64", md5_file_b64)
+
+    first = wandb.Artifact(type="dataset", name="data")
+    first.add_dir(data_dir)
+    assert md5_file_b64.call_count == 3
+
+    md5_file_b64.reset_mock()
+    second = wandb.Artifact(type="dataset", name="data")
+    second.add_dir(data_dir)
+    assert md5_file_b64.call_count == 0
+    assert second.digest == first.digest
+
+
 def test_local_file_handler_load_path_uses_cache(cache, tmp_path):
     file = tmp_path / "file.txt"
     file.write_text("hello")
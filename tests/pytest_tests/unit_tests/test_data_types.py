@@ -1,7 +1,11 @@
+import copy
 import glob
+import hashlib
 import io
 import os
+import pickle
 import platform
+import threading
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -14,6 +18,7 @@ import wandb
 from bokeh.plotting import figure
 from PIL import Image
 from wandb import data_types
+from wandb.sdk.data_types import _media_encoder
 from wandb.sdk.data_types.base_types.media import _numpy_arrays_to_lists
 
 
@@ -268,6 +273,96 @@ def test_image_seq_to_json(
     assert os.path.exists(os.path.join(run.dir, "media", "images", "test_0_0.png"))
 
 
+def test_image_hashed_while_encoding(mock_run, image):
+    run = mock_run()
+    wb_image = wandb.Image(image)
+    tmp_path = wb_image._path
+    # the encoded image isn't kept in memory until it's bound to a run
+    assert os.path.exists(tmp_path)
+
+    wb_image.bind_to_run(run, "test", 0, 0)
+    path = os.path.join(run.dir, "media", "images", "test_0_0.png")
+    assert wb_image._path == path
+    assert not os.path.exists(tmp_path)
+    with open(path, "rb") as f:
+        assert hashlib.sha256(f.read()).hexdigest() == wb_image._sha256
+
+
+@pytest.mark.parametrize(
+    "file_type,pil_format",
+    [("png", "PNG"), ("jpg", "JPEG"), ("webp", "WEBP")],
+)
+def test_image_file_type(mock_run, image, file_type, pil_format):
+    run = mock_run()
+    wb_image = wandb.Image(image, file_type=file_type, quality=50, compress_level=1)
+    wb_image.bind_to_run(run, "test", 0, 0)
+    assert wb_image.to_json(run)["format"] == file_type
+    path = os.path.join(run.dir, "media", "images", f"test_0_0.{file_type}")
+    assert Image.open(path).format == pil_format
+
+
+def test_image_bad_file_type(image):
+    with pytest.raises(ValueError, match="file_type must be one of"):
+        wandb.Image(image, file_type="tiff")
+
+
+def test_image_async_encoding(mock_run, image, monkeypatch):
+    run = mock_run()
+    sync_image = wandb.Image(image)
+    monkeypatch.setenv("WANDB_MEDIA_ENCODING_THREADS", "2")
+    pil_image = Image.fromarray(image.astype(np.uint8))
+    wb_image = wandb.Image(pil_image)
+    # the caller's image is copied before being encoded in the background
+    pil_image.paste(255, (0, 0, 10, 10))
+    assert wb_image._encoding is not None
+
+    wb_image.bind_to_run(run, "test", 0, 0)
+    assert wb_image._encoding is None
+    assert wb_image._sha256 == sync_image._sha256
+    assert os.path.exists(os.path.join(run.dir, "media", "images", "test_0_0.png"))
+    assert wb_image == sync_image
+
+
+def test_image_async_encoding_pickle_and_copy(image, monkeypatch):
+    sync_image = wandb.Image(image)
+    monkeypatch.setenv("WANDB_MEDIA_ENCODING_THREADS", "2")
+
+    restored = pickle.loads(pickle.dumps(wandb.Image(image)))
+    assert restored._encoding is None
+    assert restored._sha256 == sync_image._sha256
+
+    copied = copy.deepcopy(wandb.Image(image))
+    assert copied._encoding is None
+    assert copied._sha256 == sync_image._sha256
+
+
+def test_media_encoder_backpressure():
+    encoder = _media_encoder.MediaEncoder(max_workers=1, max_pending_bytes=10)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocked():
+        started.set()
+        release.wait()
+
+    first = encoder.submit(8, blocked)
+    started.wait()
+    submitted = threading.Event()
+
+    def submit_second():
+        encoder.submit(8, lambda: None).result()
+        submitted.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+    # over the cap: the second submit waits for the first to finish
+    assert not submitted.wait(0.2)
+    release.set()
+    first.result()
+    thread.join()
+    assert submitted.is_set()
+
+
 def test_max_images(mock_run):
     run = mock_run()
     large_image = np.random.randint(255, size=(10, 10))
@@ -142,3 +142,53 @@ def test_data_write_fill(with_datastore):
         expected_records=records,
         expected_record_sizes=lengths,
     )
+
+
+def _write_chunks(fname, chunks, **kwargs):
+    s = datastore.DataStore(**kwargs)
+    s.open_for_write(fname)
+    for chunk in chunks:
+        s._write_data(chunk)
+    s.close()
+    with open(fname, "rb") as f:
+        return f.read()
+
+
+def test_group_commit_same_format(tmp_path):
+    """Group commit must produce a byte-identical transaction log."""
+    wandb._set_internal_process()
+    chunks = [bytes([i % 251]) * (i * 37 % 5000) for i in range(200)]
+    chunks.append(b"\x03" * (32768 * 2 + 11))
+    plain = _write_chunks(str(tmp_path / "plain.dat"), chunks)
+    grouped = _write_chunks(
+        str(tmp_path / "grouped.dat"), chunks, group_commit=True, sync_seconds=60
+    )
+    assert plain == grouped
+
+    s = datastore.DataStore()
+    s.open_for_scan(str(tmp_path / "grouped.dat"))
+    scanned = []
+    while True:
+        data = s.scan_data()
+        if data is None:
+            break
+        scanned.append(data)
+    s.close()
+    assert scanned == chunks
+
+
+def test_group_commit_buffers_partial_block(tmp_path):
+    """Only whole blocks are written until the log is flushed."""
+    wandb._set_internal_process()
+    fname = str(tmp_path / "test.dat")
+    s = datastore.DataStore(group_commit=True, sync_seconds=60)
+    s.open_for_write(fname)
+    _, end_offset, _ = s._write_data(b"\x01" * 100)
+    assert os.stat(fname).st_size < end_offset
+
+    _, end_offset, _ = s._write_data(b"\x02" * 32768)
+    assert os.stat(fname).st_size == 32768
+
+    s.ensure_flushed(end_offset)
+    assert os.stat(fname).st_size == end_offset
+    s.close()
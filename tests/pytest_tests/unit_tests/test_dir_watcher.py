@@ -1,6 +1,7 @@
 """dir_watcher tests."""
 
 import os
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -11,6 +12,7 @@ import pytest
 import wandb.filesync.dir_watcher
 from wandb.filesync.dir_watcher import DirWatcher, PolicyEnd, PolicyLive, PolicyNow
 from wandb.sdk.internal.file_pusher import FilePusher
+from wandb.sdk.internal.sender import SendManager
 
 if TYPE_CHECKING:
     from wandb.sdk.interface.interface import PolicyName
@@ -159,6 +161,64 @@ def test_dirwatcher_finish_skips_ignoreglob_files(
     assert file_pusher.file_changed.called == (not ignore)
 
 
+def test_dirwatcher_finish_uploads_only_unreported_media_files(
+    tempdir: Path, file_pusher: FilePusher, dir_watcher: DirWatcher
+):
+    (tempdir / "media" / "images").mkdir(parents=True)
+    reported = tempdir / "media" / "images" / "reported.png"
+    unreported = tempdir / "media" / "images" / "unreported.png"
+    write_with_mtime(reported, b"content", mtime=0)
+    write_with_mtime(unreported, b"content", mtime=0)
+
+    dir_watcher.update_policy("media/images/reported.png", "now")
+    file_pusher.file_changed.assert_called_once_with(
+        "media/images/reported.png", str(reported)
+    )
+    file_pusher.reset_mock()
+
+    dir_watcher.finish()
+    file_pusher.file_changed.assert_called_once_with(
+        "media/images/unreported.png", str(unreported)
+    )
+
+
+def test_dirwatcher_polling_scan_skips_media_dir(
+    tempdir: Path, dir_watcher: DirWatcher
+):
+    (tempdir / "media" / "images").mkdir(parents=True)
+    (tempdir / "my-file.txt").write_bytes(b"content")
+
+    assert dir_watcher._listdir(str(tempdir)) == ["my-file.txt"]
+    assert dir_watcher._listdir(str(tempdir / "media")) == ["images"]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux only")
+def test_dirwatcher_inotify_observer(tempdir: Path, file_pusher: FilePusher):
+    settings = Mock(ignore_globs=[], _disable_inotify=False)
+    dir_watcher = DirWatcher(settings, file_pusher, file_dir=str(tempdir))
+    assert not dir_watcher._polling
+
+    f = tempdir / "my-file.txt"
+    dir_watcher.update_policy(str(f), "now")
+    f.write_bytes(b"content")
+    for _ in range(50):
+        if file_pusher.file_changed.called:
+            break
+        time.sleep(0.1)
+    file_pusher.file_changed.assert_called_once_with("my-file.txt", str(f))
+
+    dir_watcher.finish()
+    assert not dir_watcher._file_observer.is_alive()
+
+
+def test_dirwatcher_with_sync_settings(tempdir: Path, file_pusher: FilePusher):
+    # `wandb sync` builds its settings in SendManager.setup, not wandb.Settings
+    settings = SendManager.setup(str(tempdir), resume=None)._settings
+    dir_watcher = DirWatcher(settings, file_pusher, file_dir=str(tempdir))
+    dir_watcher.finish()
+    assert not dir_watcher._file_observer.is_alive()
+
+
 @pytest.mark.skip(
     reason="Live *should* take precedence over Now, I think, but I don't want to change the existing behavior yet"
 )
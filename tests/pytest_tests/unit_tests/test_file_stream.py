@@ -1,10 +1,17 @@
+import gzip
 import itertools
+import json
 import os
 import random
 import string
+import time
 from dataclasses import dataclass
+from unittest.mock import MagicMock
 
+import pytest
+import requests
 from wandb import util
+from wandb.sdk.internal import file_stream
 from wandb.sdk.internal.file_stream import CRDedupeFilePolicy
 from wandb.sdk.lib.file_stream_utils import split_files
 
@@ -193,3 +200,114 @@ def test_crdedupe_process_chunks():
     files["output.log"] = ret
     file_requests = list(split_files(files, max_bytes=util.MAX_LINE_BYTES))
     assert 2 == len(file_requests)
+
+
+@pytest.fixture
+def file_stream_api():
+    def make(**kwargs):
+        api = MagicMock()
+        api.api_key = "key"
+        api.user_agent = "agent"
+        api.settings.return_value = dict(
+            base_url="http://localhost", entity="entity", project="project"
+        )
+        api.dynamic_settings = {"heartbeat_seconds": 30}
+        fs = file_stream.FileStreamApi(api, "run", time.time(), **kwargs)
+        fs._client = MagicMock()
+        return fs
+
+    return make
+
+
+def test_file_stream_gzip_payload(file_stream_api):
+    fs = file_stream_api(compression="gzip")
+    payload = {"files": {"output.log": {"offset": 0, "content": ["hi\n"]}}}
+    fs._post(payload)
+
+    _, kwargs = fs._client.post.call_args
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == payload
+
+
+def test_file_stream_uncompressed_payload(file_stream_api):
+    fs = file_stream_api()
+    fs._post({"complete": False})
+
+    _, kwargs = fs._client.post.call_args
+    assert kwargs["json"] == {"complete": False}
+    assert "data" not in kwargs
+
+
+def test_file_stream_read_queue_by_bytes(file_stream_api):
+    fs = file_stream_api(max_bytes=100)
+    for _ in range(10):
+        fs.push("wandb-history.jsonl", "x" * 30)
+
+    assert len(fs._read_queue()) == 4
+    assert len(fs._read_queue()) == 4
+    assert len(fs._read_queue()) == 2
+
+
+def test_file_stream_adaptive_rate(file_stream_api):
+    fs = file_stream_api(adaptive_rate=True)
+    base = fs.rate_limit_seconds()
+
+    fs._rate_limited = True
+    fs._update_rate_limit(latency=0.1)
+    fs._rate_limited = True
+    fs._update_rate_limit(latency=0.1)
+    assert base < 4.0
+    assert fs.rate_limit_seconds() == 4.0
+
+    for _ in range(10):
+        fs._update_rate_limit(latency=0.1)
+    assert fs.rate_limit_seconds() == base
+
+    fs._update_rate_limit(latency=100)
+    assert fs.rate_limit_seconds() > base
+
+
+def test_file_stream_latency_excludes_retries(file_stream_api, monkeypatch):
+    fs = file_stream_api(adaptive_rate=True)
+    fs._update_rate_limit = MagicMock()
+    real_sleep = time.sleep
+    monkeypatch.setattr(file_stream.time, "sleep", lambda _: real_sleep(0.2))
+
+    fs._client.post.side_effect = [requests.ConnectionError(), MagicMock()]
+    fs._post({"complete": False})
+    ((latency,), _) = fs._update_rate_limit.call_args
+    assert latency < 0.2
+
+    rejected = MagicMock()
+    rejected.raise_for_status.side_effect = requests.HTTPError(
+        response=MagicMock(status_code=400)
+    )
+    fs._client.post.side_effect = None
+    fs._client.post.return_value = rejected
+    fs._post({"complete": False})
+    fs._update_rate_limit.assert_called_with(None)
+
+
+def test_file_stream_wait_flushed(file_stream_api):
+    fs = file_stream_api()
+    fs.start()
+    fs.push("wandb-history.jsonl", '{"a": 1}')
+
+    assert fs.wait_flushed(timeout=10)
+    posted = [
+        kwargs["json"]["files"]
+        for _, kwargs in fs._client.post.call_args_list
+        if "files" in kwargs.get("json", {})
+    ]
+    assert posted == [{"wandb-history.jsonl": {"offset": 0, "content": ['{"a": 1}']}}]
+    fs.finish(0)
+
+
+def test_file_stream_wait_flushed_after_dropped_chunk(file_stream_api):
+    fs = file_stream_api()
+    fs._post = MagicMock(return_value=requests.ConnectionError())
+    fs.start()
+    fs.push("wandb-history.jsonl", '{"a": 1}')
+
+    assert not fs.wait_flushed(timeout=10)
+    fs.finish(0)
@@ -0,0 +1,186 @@
+import json
+import queue
+import threading
+
+import pytest
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.interface.interface_queue import InterfaceQueue
+from wandb.sdk.internal import context
+from wandb.sdk.internal.handler import HandleManager
+from wandb.sdk.internal.settings_static import SettingsStatic
+
+
+@pytest.fixture
+def writer_q():
+    return queue.Queue()
+
+
+@pytest.fixture
+def handle_manager(writer_q):
+    return HandleManager(
+        settings=SettingsStatic({"_offline": False}),
+        record_q=queue.Queue(),
+        result_q=queue.Queue(),
+        stopped=threading.Event(),
+        writer_q=writer_q,
+        interface=InterfaceQueue(record_q=queue.Queue(), process_check=False),
+        context_keeper=context.ContextKeeper(),
+    )
+
+
+def _log(handle_manager, row):
+    history = pb.HistoryRecord()
+    for k, v in row.items():
+        history.item.add(key=k, value_json=json.dumps(v))
+    handle_manager.handle(pb.Record(history=history))
+
+
+def _define(handle_manager, name="", glob_name="", goal=None, **summary):
+    metric = pb.MetricRecord(name=name, glob_name=glob_name)
+    if goal is not None:
+        metric.goal = goal
+    for option, value in summary.items():
+        setattr(metric.summary, option, value)
+    handle_manager.handle(pb.Record(metric=metric))
+
+
+def _summary_updates(writer_q):
+    """Return the summary updates sent on to the writer, and whether each is final."""
+    updates = []
+    while not writer_q.empty():
+        record = writer_q.get_nowait()
+        if record.HasField("summary"):
+            summary, final = record.summary, True
+        elif record.request.HasField("summary_record"):
+            summary, final = record.request.summary_record.summary, False
+        else:
+            continue
+        updates.append(
+            ({u.key: json.loads(u.value_json) for u in summary.update}, final)
+        )
+    return updates
+
+
+def test_metric_aggregates(handle_manager):
+    _define(handle_manager, name="loss", min=True, max=True, mean=True, last=True)
+    _define(handle_manager, name="acc", goal=pb.MetricRecord.GOAL_MAXIMIZE, best=True)
+    _define(handle_manager, name="err", best=True)
+    _define(handle_manager, name="lr", none=True)
+    _define(handle_manager, name="epoch", copy=True)
+
+    for row in [
+        {"loss": 3, "acc": 0.5, "err": 0.5, "lr": 0.1, "epoch": 0},
+        {"loss": 1, "acc": 0.75, "err": 0.25, "lr": 0.01, "epoch": 1},
+        {"loss": float("nan"), "acc": 0.25, "err": 0.75},
+        {"loss": "diverged", "acc": "n/a", "err": "n/a"},
+        {"loss": 2},
+    ]:
+        _log(handle_manager, row)
+
+    summary = handle_manager._consolidated_summary
+    # NaN and non-numeric values are ignored
+    assert summary["loss"] == {"min": 1, "max": 3, "mean": 2.0, "last": 2}
+    assert summary["acc"] == {"best": 0.75}
+    # best defaults to minimizing
+    assert summary["err"] == {"best": 0.25}
+    assert "lr" not in summary
+    assert summary["epoch"] == 1
+
+
+def test_metric_aggregates_recompiled_on_redefine(handle_manager):
+    _define(handle_manager, name="loss", min=True)
+    _log(handle_manager, {"loss": 2})
+    _log(handle_manager, {"loss": 1})
+    _define(handle_manager, name="loss", max=True)
+    _log(handle_manager, {"loss": 3})
+
+    assert handle_manager._consolidated_summary["loss"] == {"min": 1, "max": 3}
+
+
+def test_metric_glob_definitions_dont_recompile_aggregates(handle_manager):
+    _define(handle_manager, name="loss", min=True)
+    _define(handle_manager, glob_name="val_*", max=True)
+    _log(handle_manager, {"loss": 1})
+    version = handle_manager._metric_version
+
+    _log(handle_manager, {"val_a": 1, "val_b": 2})
+    assert handle_manager._metric_version == version
+    # redefining with the same options changes nothing either
+    _define(handle_manager, name="loss", min=True)
+    assert handle_manager._metric_version == version
+
+    _log(handle_manager, {"val_a": 3, "loss": 0})
+    summary = handle_manager._consolidated_summary
+    assert summary["val_a"] == {"max": 3}
+    assert summary["val_b"] == {"max": 2}
+    assert summary["loss"] == {"min": 0}
+
+
+def test_summary_updates_coalesced_until_debounce(handle_manager, writer_q):
+    _define(handle_manager, name="loss", min=True)
+    _summary_updates(writer_q)
+    for loss in [3, 1, 2]:
+        _log(handle_manager, {"loss": loss, "acc": loss / 4})
+    assert _summary_updates(writer_q) == []
+
+    handle_manager.debounce()
+    assert _summary_updates(writer_q) == [
+        ({"loss": {"min": 1}, "acc": 0.5, "_step": 2}, False)
+    ]
+    handle_manager.debounce()
+    assert _summary_updates(writer_q) == []
+
+
+def test_summary_updates_flushed_on_exit(handle_manager, writer_q):
+    _log(handle_manager, {"loss": 3})
+    _log(handle_manager, {"loss": 1})
+
+    defer = pb.DeferRequest(state=pb.DeferRequest.FLUSH_SUM)
+    handle_manager.handle(pb.Record(request=pb.Request(defer=defer)))
+    # the whole summary is sent once, as the final summary record
+    assert _summary_updates(writer_q) == [({"loss": 1, "_step": 1}, True)]
+    handle_manager.debounce()
+    assert _summary_updates(writer_q) == []
+
+
+def test_metric_glob_first_defined_wins(handle_manager):
+    _define(handle_manager, glob_name="val_*", max=True)
+    _define(handle_manager, glob_name="val_loss*", min=True)
+    _log(handle_manager, {"val_loss": 2})
+    _log(handle_manager, {"val_loss": 1})
+
+    assert handle_manager._consolidated_summary["val_loss"] == {"max": 2}
+
+
+def test_metric_glob_miss_cached_until_globs_change(handle_manager):
+    _define(handle_manager, glob_name="val_*", max=True)
+    _log(handle_manager, {"loss": 2})
+    assert "loss" in handle_manager._metric_glob_misses
+    metric_glob_re = handle_manager._metric_glob_re
+    _log(handle_manager, {"loss": 3})
+    assert handle_manager._metric_glob_re is metric_glob_re
+
+    # a glob defined after the miss still matches the key
+    _define(handle_manager, glob_name="lo*", none=True)
+    assert handle_manager._metric_glob_misses == set()
+    assert handle_manager._metric_glob_re is None
+    _log(handle_manager, {"loss": 1})
+
+    assert handle_manager._metric_defines["loss"].summary.none
+    assert handle_manager._consolidated_summary["loss"] == 3
+
+
+def test_partial_history_with_batch_marker_key_is_a_plain_row(handle_manager, writer_q):
+    partial_history = pb.PartialHistoryRequest()
+    partial_history.item.add(key="_wandb_batch", value_json="1")
+    partial_history.item.add(key="loss", value_json="0.5")
+    partial_history.action.flush = True
+    handle_manager.handle(
+        pb.Record(request=pb.Request(partial_history=partial_history))
+    )
+
+    (history,) = (r.history for r in writer_q.queue if r.HasField("history"))
+    row = {item.key: json.loads(item.value_json) for item in history.item}
+    assert row["_wandb_batch"] == 1
+    assert row["loss"] == 0.5
+    assert row["_step"] == 0
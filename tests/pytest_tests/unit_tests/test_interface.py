@@ -0,0 +1,39 @@
+import queue
+
+import numpy as np
+import pytest
+from wandb import util
+from wandb.sdk.data_types.utils import history_dict_to_json
+from wandb.sdk.interface.interface_queue import InterfaceQueue
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        0.25,
+        float("nan"),
+        float("-inf"),
+        -3,
+        True,
+        "é\n",
+        None,
+        np.float64("nan"),
+        np.float32(0.1),
+        np.float16("nan"),
+        np.float32("inf"),
+        np.uint64(2**64 - 1),
+        np.int8(-3),
+        np.bool_(False),
+        np.str_("s"),
+    ],
+)
+def test_publish_partial_history_scalar_encoding(value):
+    record_q = queue.Queue()
+    interface = InterfaceQueue(record_q=record_q, process_check=False)
+
+    interface.publish_partial_history({"_step": 0, "x": value}, user_step=0)
+    items = record_q.get_nowait().request.partial_history.item
+
+    expected = history_dict_to_json(None, {"x": value}, step=0)["x"]
+    assert [item.key for item in items] == ["x", "_timestamp"]
+    assert items[0].value_json == util.json_dumps_safer_history(expected)
@@ -0,0 +1,35 @@
+import json
+
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.lib import proto_util
+
+
+def _history(*items):
+    history = pb.HistoryRecord()
+    for key, value_json in items:
+        item = history.item.add()
+        item.key = key
+        item.value_json = value_json
+    return history
+
+
+def test_jsonl_from_proto_list_matches_dict():
+    history = _history(
+        ("loss", json.dumps(0.25)),
+        ("nested", json.dumps({"a": [1, 2, {"b": "c"}]})),
+        ('quoted "key"', json.dumps("value")),
+        ("_step", json.dumps(3)),
+    )
+    line = proto_util.jsonl_from_proto_list(history.item)
+    assert json.loads(line) == proto_util.dict_from_proto_list(history.item)
+    assert line == json.dumps(proto_util.dict_from_proto_list(history.item))
+
+
+def test_jsonl_from_proto_list_duplicate_keys():
+    history = _history(("a", "1"), ("b", "2"), ("a", "3"))
+    line = proto_util.jsonl_from_proto_list(history.item)
+    assert line == json.dumps({"a": 3, "b": 2})
+
+
+def test_jsonl_from_proto_list_empty():
+    assert proto_util.jsonl_from_proto_list(pb.HistoryRecord().item) == "{}"
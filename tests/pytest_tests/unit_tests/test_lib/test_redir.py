@@ -202,3 +202,30 @@ def test_print_torch_model(cls, capfd):
         overhead = t2 - t1
         assert overhead < 0.2
         r.uninstall()
+
+
+def test_emulator_styles():
+    emulator = wandb.wandb_sdk.lib.redirect.TerminalEmulator()
+    emulator.write("plain   \n\x1b[31mred\x1b[1m bold\x1b[0m done\n")
+    emulator.write("\x1b[44m  \x1b[0m\n")
+    assert emulator.read() == os.linesep.join(
+        [
+            "plain",
+            "\x1b[31mred\x1b[1m bold\x1b[39m\x1b[22m done",
+            # trailing blanks are kept when they are styled
+            "\x1b[44m  ",
+            "",
+        ]
+    )
+    emulator.write("\r\x1b[1Aabc\x1b[K")
+    assert emulator.read() == "\rabc" + os.linesep
+
+
+def test_emulator_max_lines():
+    emulator = wandb.wandb_sdk.lib.redirect.TerminalEmulator()
+    emulator.write("".join(f"line {i}\n" for i in range(150)))
+    assert emulator.read().splitlines()[-1] == "line 149"
+    assert emulator.num_lines == emulator._MAX_LINES
+    assert len(emulator.buffer) <= emulator._MAX_LINES
+    emulator.write("next\n")
+    assert emulator.read() == "next" + os.linesep
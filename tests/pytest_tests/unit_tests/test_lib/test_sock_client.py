@@ -1,4 +1,8 @@
+import socket
+import threading
+
 import pytest
+from wandb.proto import wandb_internal_pb2 as pb
 from wandb.sdk.lib import sock_client
 
 
@@ -86,3 +90,69 @@ def test_get_index_error():
     assert buffer.length == 7
     with pytest.raises(IndexError):
         buffer.get(3, 8)
+
+
+def _history_record(value):
+    record = pb.Record()
+    record.history.item.add(key="x", value_json=str(value))
+    return record
+
+
+def test_coalesced_records_stay_ahead_of_direct_sends():
+    a, b = socket.socketpair()
+    client = sock_client.SockClient()
+    client.set_socket(a)
+    server = sock_client.SockClient()
+    server.set_socket(b)
+    client.enable_coalescing(seconds=60)
+
+    for i in range(3):
+        client.send_record_publish(_history_record(i))
+    client.send_record_communicate(pb.Record(exit=pb.RunExitRecord(exit_code=1)))
+
+    requests = [server.read_server_request() for _ in range(4)]
+    assert [r.record_publish.history.item[0].value_json for r in requests[:3]] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert requests[3].record_communicate.exit.exit_code == 1
+    client.close()
+    server.close()
+
+
+def test_coalesced_records_flushed_after_window():
+    a, b = socket.socketpair()
+    client = sock_client.SockClient()
+    client.set_socket(a)
+    server = sock_client.SockClient()
+    server.set_socket(b)
+    client.enable_coalescing(seconds=0.01)
+
+    client.send_record_publish(_history_record(7))
+    request = server.read_server_request()
+    assert request.record_publish.history.item[0].value_json == "7"
+    client.close()
+    server.close()
+
+
+def test_sendmsg_partial_writes():
+    a, b = socket.socketpair()
+    client = sock_client.SockClient()
+    client.set_socket(a)
+    buffers = [bytes([i]) * 100_000 for i in range(1, 30)]
+
+    received = bytearray()
+
+    def read():
+        while len(received) < sum(map(len, buffers)):
+            received.extend(b.recv(65536))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    with client._lock:
+        client._sendmsg_with_error_handle(buffers)
+    reader.join()
+    assert received == b"".join(buffers)
+    a.close()
+    b.close()
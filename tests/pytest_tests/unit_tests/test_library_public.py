@@ -177,6 +177,7 @@ SYMBOLS_RUN = {
     "config",
     "config_static",
     "log",
+    "log_batch",
     "log_artifact",
     "link_artifact",
     "upsert_artifact",
@@ -0,0 +1,63 @@
+import json
+import queue
+import time
+
+from wandb.sdk.internal.overhead import STATS_PREFIX, OverheadProfiler
+
+
+def test_profiler_measures_sections():
+    profiler = OverheadProfiler()
+    for _ in range(3):
+        with profiler.measure("handle.history"):
+            time.sleep(0.01)
+    with profiler.measure("send.request.defer"):
+        pass
+
+    stats = profiler.stats()
+    assert stats[STATS_PREFIX + "handle.history.count"] == 3
+    assert stats[STATS_PREFIX + "handle.history.wallMs"] >= 30
+    assert stats[STATS_PREFIX + "handle.history.maxWallMs"] >= 10
+    assert stats[STATS_PREFIX + "send.request.defer.count"] == 1
+
+    # interval counters are reset on every emit, totals are not
+    with profiler.measure("handle.history"):
+        pass
+    assert profiler.stats()[STATS_PREFIX + "handle.history.count"] == 1
+    assert STATS_PREFIX + "handle.history.count" not in profiler.stats()
+    assert profiler.summary()["sections"]["handle.history"]["count"] == 4
+
+
+def test_profiler_samples_queue_depths(tmp_path):
+    q = queue.Queue()
+    profiler = OverheadProfiler()
+    profiler.add_gauge("record_q", q.qsize)
+
+    def broken_gauge():
+        raise NotImplementedError
+
+    profiler.add_gauge("broken_q", broken_gauge)
+
+    for i in range(5):
+        q.put(i)
+    profiler.sample_gauges()
+    q.get()
+
+    stats = profiler.stats()
+    assert stats[STATS_PREFIX + "record_q.depth"] == 4
+    assert stats[STATS_PREFIX + "record_q.maxDepth"] == 5
+    assert STATS_PREFIX + "broken_q.depth" not in stats
+
+    path = tmp_path / "profile.json"
+    profiler.dump(str(path))
+    with open(path) as f:
+        summary = json.load(f)
+    assert summary["queues"] == {"record_q": {"max_depth": 5}}
+
+
+def test_profiler_emits_on_interval():
+    profiler = OverheadProfiler(emit_interval=0.05)
+    assert not profiler.due()
+    time.sleep(0.06)
+    assert profiler.due()
+    profiler.stats()
+    assert not profiler.due()
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -150,3 +151,96 @@ def test_artifact_download_logger():
             assert termlog.call_args == call
         else:
             termlog.assert_not_called()
+
+
+def test_artifact_download_nested_submit_runs_inline():
+    public = wandb.apis.public
+
+    def outer():
+        # Submitted from a download worker, so it must not wait on the pool.
+        return public._submit_download(lambda: "inner").result(timeout=5)
+
+    futures = [public._submit_download(outer) for _ in range(64)]
+    public._wait_downloads(futures)
+    assert [f.result() for f in futures] == ["inner"] * 64
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_history_scan_prefetch(prefetch):
+    def execute(query, variable_values):
+        steps = range(variable_values["minStep"], variable_values["maxStep"])
+        history = [json.dumps({"_step": step, "loss": step / 2}) for step in steps]
+        return {"project": {"run": {"history": history}}}
+
+    client = mock.Mock(execute=mock.Mock(side_effect=execute))
+    run = mock.Mock(entity="entity", project="project", id="run")
+    scan = wandb.apis.public.HistoryScan(
+        client=client, run=run, min_step=0, max_step=25, page_size=10, prefetch=prefetch
+    )
+
+    assert [row["_step"] for row in scan] == list(range(25))
+    assert client.execute.call_count == 3
+    # Iterating again restarts the scan from min_step.
+    assert [row["_step"] for row in scan][:3] == [0, 1, 2]
+
+
+def test_history_scan_to_columns():
+    def execute(query, variable_values):
+        rows = [{"_step": 0, "loss": 1.0}, {"_step": 1, "acc": 0.5}]
+        return {"project": {"run": {"sampledHistory": [rows]}}}
+
+    client = mock.Mock(execute=mock.Mock(side_effect=execute))
+    run = mock.Mock(entity="entity", project="project", id="run")
+    scan = wandb.apis.public.SampledHistoryScan(
+        client=client, run=run, keys=["loss"], min_step=0, max_step=2, prefetch=2
+    )
+
+    assert scan.to_columns() == {
+        "_step": [0, 1],
+        "loss": [1.0, None],
+        "acc": [None, 0.5],
+    }
+
+
+def test_history_scan_to_columns_returns_remaining_rows():
+    def execute(query, variable_values):
+        steps = range(variable_values["minStep"], variable_values["maxStep"])
+        history = [json.dumps({"_step": step}) for step in steps]
+        return {"project": {"run": {"history": history}}}
+
+    client = mock.Mock(execute=mock.Mock(side_effect=execute))
+    run = mock.Mock(entity="entity", project="project", id="run")
+    scan = wandb.apis.public.HistoryScan(
+        client=client, run=run, min_step=0, max_step=25, page_size=10, prefetch=2
+    )
+
+    rows = iter(scan)
+    assert [next(rows)["_step"] for _ in range(12)] == list(range(12))
+    assert scan.to_columns() == {"_step": list(range(12, 25))}
+    assert scan._executor is None
+    assert scan.to_columns() == {}
+    assert client.execute.call_count == 3
+
+
+def test_history_scan_close_stops_prefetch():
+    def execute(query, variable_values):
+        steps = range(variable_values["minStep"], variable_values["maxStep"])
+        history = [json.dumps({"_step": step}) for step in steps]
+        return {"project": {"run": {"history": history}}}
+
+    client = mock.Mock(execute=mock.Mock(side_effect=execute))
+    run = mock.Mock(entity="entity", project="project", id="run")
+    scan = wandb.apis.public.HistoryScan(
+        client=client, run=run, min_step=0, max_step=100, page_size=10, prefetch=3
+    )
+
+    for row in scan:
+        if row["_step"] == 5:
+            break
+    executor = scan._executor
+    assert executor is not None
+
+    scan.close()
+    assert scan._executor is None
+    assert len(scan._pending) == 0
+    assert executor._shutdown
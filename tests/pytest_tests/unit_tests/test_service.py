@@ -0,0 +1,66 @@
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+import pytest
+import wandb
+from wandb.sdk.service import port_file, service
+
+
+def test_port_file_round_trip(tmp_path):
+    fname = str(tmp_path / "port.txt")
+    port_file.PortFile(sock_port=1234, sock_path="/tmp/a-b/service.sock").write(fname)
+
+    pf = port_file.PortFile()
+    pf.read(fname)
+    assert pf.is_valid
+    assert (pf.sock_port, pf.sock_path, pf.grpc_port) == (
+        1234,
+        "/tmp/a-b/service.sock",
+        None,
+    )
+
+    partial = port_file.PortFile()
+    partial.loads("sock=1234\n")
+    assert not partial.is_valid
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="uses the ready pipe")
+def test_service_start_reads_ports_from_ready_pipe():
+    svc = service._Service(settings=wandb.Settings(_executable=sys.executable))
+    svc.start()
+    try:
+        assert svc.sock_port
+        assert svc._is_listening(port_file.PortFile(sock_port=svc.sock_port))
+    finally:
+        svc._internal_proc.kill()
+        svc._internal_proc.wait()
+
+
+@pytest.mark.skipif(not port_file.shared_supported(), reason="needs flock")
+def test_shared_service_listens_in_private_dir(monkeypatch):
+    # short, unix socket paths are limited to ~100 characters
+    tmpdir = tempfile.mkdtemp(prefix="wb-")
+    monkeypatch.setattr(tempfile, "tempdir", tmpdir)
+    settings = wandb.Settings(
+        _executable=sys.executable, _service_shared=True, _service_transport="tcp"
+    )
+    svc = service._Service(settings=settings)
+    svc.start()
+    try:
+        private_dir = os.path.join(tmpdir, f"wandb-service-{os.getuid()}")
+        assert svc.sock_port is None
+        assert os.path.dirname(svc.sock_path) == private_dir
+        assert "--debug" not in svc._internal_proc.args
+
+        # another process finds the running service
+        other = service._Service(settings=settings)
+        other.start()
+        assert other._internal_proc is None
+        assert other.sock_path == svc.sock_path
+    finally:
+        svc._internal_proc.kill()
+        svc._internal_proc.wait()
+        shutil.rmtree(tmpdir, ignore_errors=True)
@@ -0,0 +1,67 @@
+import os
+import threading
+
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+from wandb.sdk.service.streams import StreamMux
+
+
+def _history_rows(path):
+    ds = datastore.DataStore()
+    ds.open_for_scan(path)
+    rows = []
+    while True:
+        data = ds.scan_data()
+        if data is None:
+            return rows
+        record = pb.Record()
+        record.ParseFromString(data)
+        if record.WhichOneof("record_type") == "history":
+            rows.append({item.key: item.value_json for item in record.history.item})
+
+
+def test_stream_mux_runs_streams_in_worker_process(tmp_path):
+    settings = wandb.Settings(mode="offline", root_dir=str(tmp_path), run_id="abc123")
+    settings._set_run_start_time()
+    for path in (settings.files_dir, os.path.dirname(settings.log_internal)):
+        os.makedirs(path, exist_ok=True)
+
+    mux = StreamMux(workers=1)
+    mux_thread = threading.Thread(target=mux.loop, daemon=True)
+    mux_thread.start()
+    mux.add_stream("abc123", settings.make_static())
+    interface = mux.get_stream("abc123").interface
+    interface.publish_history({"loss": 0.5}, step=0)
+    assert interface.communicate_status()
+    assert mux._workers[0].num_streams == 1
+
+    mux.teardown(0)
+    mux_thread.join()
+
+    assert not mux._workers
+    assert [row["loss"] for row in _history_rows(settings.sync_file)] == ["0.5"]
+
+
+def test_stream_mux_finish_streams_keeps_shared_mux_running(tmp_path):
+    settings = wandb.Settings(mode="offline", root_dir=str(tmp_path), run_id="abc123")
+    settings._set_run_start_time()
+    for path in (settings.files_dir, os.path.dirname(settings.log_internal)):
+        os.makedirs(path, exist_ok=True)
+
+    mux = StreamMux(workers=1, shared=True)
+    mux_thread = threading.Thread(target=mux.loop, daemon=True)
+    mux_thread.start()
+    mux.add_connection()
+    mux.add_stream("abc123", settings.make_static())
+    assert not mux.is_idle(0)
+
+    mux.finish_streams(["abc123"], exit_code=0)
+    mux.del_connection()
+
+    assert mux.stream_names() == []
+    assert mux.is_idle(0)
+    assert not mux.is_idle(60)
+    assert mux_thread.is_alive()
+    mux.teardown(0)
+    mux_thread.join()
@@ -0,0 +1,164 @@
+import json
+import os
+import queue
+import threading
+import time
+from unittest import mock
+
+import pytest
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore, sender
+from wandb.sync import sync
+
+
+class _StubSendManager:
+    """Records what a sync sends instead of sending it to the server."""
+
+    def __init__(self, fs=None):
+        self._record_q = queue.Queue()
+        self._result_q = queue.Queue()
+        self._fs = fs
+        self.sent = []
+        self.finished = False
+
+    def send(self, record):
+        self.sent.append(record)
+        if record.control.req_resp and record.HasField("run"):
+            result = pb.Result()
+            result.run_result.run.CopyFrom(record.run)
+            self._result_q.put(result)
+
+    def finish(self):
+        self.finished = True
+
+    def sent_steps(self):
+        return [
+            json.loads(item.value_json)
+            for record in self.sent
+            if record.HasField("history")
+            for item in record.history.item
+            if item.key == "_step"
+        ]
+
+
+def _write_run(path, num_steps, finished=True):
+    """Write a .wandb file and return the offset following each history record."""
+    wandb._set_internal_process()
+    ds = datastore.DataStore()
+    ds.open_for_write(str(path))
+    ds.write(pb.Record(run=pb.RunRecord(entity="e", project="p", run_id="r")))
+    offsets = []
+    for step in range(num_steps):
+        history = pb.HistoryRecord()
+        history.item.add(key="_step", value_json=json.dumps(step))
+        _, end, _ = ds.write(pb.Record(history=history))
+        offsets.append(end)
+    if finished:
+        ds.write(pb.Record(exit=pb.RunExitRecord(exit_code=0)))
+        ds.write(pb.Record(final=pb.FinalRecord()))
+    ds.close()
+    return offsets
+
+
+def _sync_run(path, sm, checkpoint=None):
+    ds = datastore.DataStore()
+    ds.open_for_scan(str(path))
+    sync.SyncThread(sync_list=[])._sync_run(sm, ds, str(path), checkpoint)
+    ds._fp.close()
+
+
+def _checkpoint(path):
+    with open(f"{path}{sync.CHECKPOINT_SUFFIX}") as f:
+        return json.load(f)
+
+
+def test_sync_run_checkpoints_unfinished_run(tmp_path):
+    path = tmp_path / "run-r.wandb"
+    offsets = _write_run(path, 3, finished=False)
+    sm = _StubSendManager()
+
+    _sync_run(path, sm)
+
+    assert sm.sent_steps() == [0, 1, 2]
+    assert _checkpoint(path) == {"run": "e/p/r", "offset": offsets[-1]}
+
+
+def test_sync_run_checkpoint_waits_for_file_stream(tmp_path):
+    path = tmp_path / "run-r.wandb"
+    _write_run(path, 3, finished=False)
+    fs = mock.Mock(wait_flushed=mock.Mock(return_value=False))
+
+    _sync_run(path, _StubSendManager(fs=fs))
+
+    fs.wait_flushed.assert_called_once()
+    assert not os.path.exists(f"{path}{sync.CHECKPOINT_SUFFIX}")
+
+
+def test_sync_run_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "run-r.wandb"
+    offsets = _write_run(path, 5)
+    sm = _StubSendManager()
+
+    _sync_run(path, sm, checkpoint={"run": "e/p/r", "offset": offsets[2]})
+
+    assert sm.sent_steps() == [3, 4]
+    assert sm.sent[0].HasField("run")
+    assert sm.sent[-1].HasField("exit")
+
+
+def test_sync_run_ignores_checkpoint_of_other_run(tmp_path):
+    path = tmp_path / "run-r.wandb"
+    offsets = _write_run(path, 5)
+    sm = _StubSendManager()
+
+    _sync_run(path, sm, checkpoint={"run": "e/p/other", "offset": offsets[2]})
+
+    assert sm.sent_steps() == [0, 1, 2, 3, 4]
+
+
+def test_sync_run_removes_checkpoint_when_finished(tmp_path):
+    path = tmp_path / "run-r.wandb"
+    offsets = _write_run(path, 3)
+    with open(f"{path}{sync.CHECKPOINT_SUFFIX}", "w") as f:
+        json.dump({"run": "e/p/r", "offset": offsets[0]}, f)
+    checkpoint = sync.SyncThread._load_checkpoint(str(path))
+
+    sm = _StubSendManager()
+    _sync_run(path, sm, checkpoint=checkpoint)
+
+    assert sm.sent_steps() == [1, 2]
+    assert sm.finished
+    assert not os.path.exists(f"{path}{sync.CHECKPOINT_SUFFIX}")
+
+
+@pytest.mark.timeout(60)
+def test_sync_manager_workers_sync_runs_concurrently(tmp_path, monkeypatch):
+    paths = [tmp_path / f"run-{ndx}.wandb" for ndx in range(3)]
+    for path in paths:
+        _write_run(path, 2)
+
+    send_managers = []
+    # the first two runs are only synced once both workers have started one
+    both_started = threading.Barrier(2, timeout=10)
+
+    def setup(root_dir, resume=None):
+        sm = _StubSendManager()
+        send_managers.append(sm)
+        if len(send_managers) <= 2:
+            both_started.wait()
+        return sm
+
+    monkeypatch.setattr(sender.SendManager, "setup", staticmethod(setup))
+    sm = sync.SyncManager(mark_synced=True, workers=2)
+    for path in paths:
+        sm.add(path)
+    sm.start()
+    while not sm.is_done():
+        time.sleep(0.1)
+
+    assert len(sm._threads) == 2
+    assert len(send_managers) == 3
+    assert all(s.finished and s.sent_steps() == [0, 1] for s in send_managers)
+    for path in paths:
+        assert os.path.exists(f"{path}{sync.SYNCED_SUFFIX}")
@@ -104,3 +104,45 @@ def test_gpu(test_settings):
         assert not interface.metrics_queue.empty()
 
     assert gpu.probe() == {}
+
+
+def test_gpu_caches_device_handles(test_settings):
+    mock_pynvml = MockPynvml()
+    mock_pynvml.nvmlDeviceGetCount = mock.Mock(return_value=2)
+    mock_pynvml.nvmlDeviceGetHandleByIndex = mock.Mock(side_effect=lambda i: i)
+
+    interface = AssetInterface()
+    settings = SettingsStatic(
+        test_settings(
+            dict(
+                _stats_sample_rate_seconds=0.1,
+                _stats_samples_to_average=2,
+            )
+        ).make_static()
+    )
+    gpu = GPU(
+        interface=interface,
+        settings=settings,
+        shutdown_event=threading.Event(),
+    )
+
+    with mock.patch.object(
+        wandb.sdk.internal.system.assets.gpu,
+        "pynvml",
+        mock_pynvml,
+    ), mock.patch.object(
+        wandb.sdk.internal.system.assets.gpu,
+        "gpu_in_use_by_this_process",
+        lambda handle, _: handle == 1,
+    ):
+        for _ in range(3):
+            gpu.metrics_monitor.sample()
+            gpu.metrics_monitor.publish()
+
+    assert mock_pynvml.nvmlDeviceGetCount.call_count == 1
+    assert mock_pynvml.nvmlDeviceGetHandleByIndex.call_count == 2
+    stats = interface.metrics_queue.get()
+    assert stats["gpu.0.gpu"] == 24.0
+    assert stats["gpu.1.temp"] == 420.0
+    assert "gpu.process.1.gpu" in stats
+    assert "gpu.process.0.gpu" not in stats
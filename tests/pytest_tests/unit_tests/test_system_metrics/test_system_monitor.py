@@ -6,6 +6,7 @@ from unittest import mock
 
 import pytest
 import wandb
+from wandb.sdk.internal.overhead import OverheadProfiler
 from wandb.sdk.internal.settings_static import SettingsStatic
 from wandb.sdk.internal.system.assets import (
     CPU,
@@ -201,3 +202,59 @@ def test_system_monitor(test_settings, join_assets, num_keys):
         # sometimes, due to timing we might see less than num_keys
         max_num_keys = max(max_num_keys, len(metric_record))
     assert max_num_keys == num_keys
+
+
+def test_system_monitor_samples_assets_on_one_thread(test_settings):
+    interface = AssetInterface()
+    settings = SettingsStatic(
+        test_settings(
+            dict(
+                _stats_sample_rate_seconds=0.1,
+                _stats_samples_to_average=2,
+            )
+        ).make_static()
+    )
+
+    with mock.patch.object(
+        wandb.sdk.internal.system.assets.asset_registry,
+        "_registry",
+        [MockAsset1, MockAsset2],
+    ):
+        system_monitor = SystemMonitor(interface=interface, settings=settings)
+        system_monitor.start()
+        time.sleep(0.5)
+        thread_names = {thread.name for thread in threading.enumerate()}
+        system_monitor.finish()
+
+    assert "SystemMonitor" in thread_names
+    assert not thread_names & {"mockasset1", "mockasset2"}
+    assert not interface.metrics_queue.empty()
+
+
+def test_system_monitor_profiles_metrics(test_settings):
+    interface = AssetInterface()
+    settings = SettingsStatic(
+        test_settings(
+            dict(
+                _stats_sample_rate_seconds=0.1,
+                _stats_samples_to_average=2,
+            )
+        ).make_static()
+    )
+    profiler = OverheadProfiler()
+
+    with mock.patch.object(
+        wandb.sdk.internal.system.assets.asset_registry,
+        "_registry",
+        [MockAsset1],
+    ):
+        system_monitor = SystemMonitor(
+            interface=interface, settings=settings, profiler=profiler
+        )
+        system_monitor.start()
+        time.sleep(0.5)
+        system_monitor.finish()
+
+    sections = profiler.summary()["sections"]
+    assert sections["stats.mock_metric_1.sample"]["count"] >= 2
+    assert sections["stats.mock_metric_1.aggregate"]["count"] >= 1
@@ -1,4 +1,6 @@
 import datetime
+import json
+import unittest.mock
 
 import numpy as np
 import pytest
@@ -258,3 +260,87 @@ def test_datetime_conversion():
         [975628800000, 975628800000, 975628800000, 1],
         [975715200000, 975715200000, 975715200000, 2],
     ]
+
+
+def test_dataframe_columnar_matches_rowwise():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "f": [1.5, np.nan, 3.0],
+            "i": np.array([1, 2, 3], dtype=np.int32),
+            "b": [True, False, True],
+            "s": ["a", None, "c"],
+        }
+    )
+    table = wandb.Table(dataframe=df)
+    rowwise = wandb.Table(columns=list(df.columns))
+    for row in range(len(df)):
+        rowwise.add_data(*(df[col].values[row] for col in df.columns))
+
+    assert table._column_types == rowwise._column_types
+    # NaN != NaN, so compare the serialized rows
+    assert json.dumps(table._to_table_json()) == json.dumps(
+        rowwise._to_table_json(), default=lambda v: v.item()
+    )
+    assert table.get_column("i") == [1, 2, 3]
+    assert [row for _, row in table.iterrows()][2] == [3.0, 3, True, "c"]
+    # rows are only built once something needs them
+    assert table._data is None
+    assert table.data[0] == [1.5, 1, True, "a"]
+    assert table._column_data is None
+
+
+def test_ndarray_columnar_add_data_and_cast():
+    table = wandb.Table(columns=["a", "b"], data=np.arange(6).reshape(3, 2))
+    assert table.get_column("b", convert_to="numpy").tolist() == [1, 3, 5]
+    with pytest.raises(TypeError):
+        table.cast("a", wandb.data_types._dtypes.StringType())
+    table.add_data(6, 7)
+    assert [row for _, row in table.iterrows()] == [[0, 1], [2, 3], [4, 5], [6, 7]]
+
+
+def test_dataframe_columnar_type_error():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1, "x"]})
+    with pytest.raises(TypeError):
+        wandb.Table(dataframe=df)
+
+
+def test_binary_table_disabled_by_default():
+    artifact = wandb.Artifact("A", "B")
+    table = wandb.Table(columns=["a"], data=np.arange(3).reshape(3, 1))
+    json_obj = table.to_json(artifact)
+    assert "binary_table" not in json_obj
+    assert json_obj["data"] == [[0], [1], [2]]
+
+
+@pytest.mark.parametrize("binary_format", ["arrow", "arrow_only"])
+def test_binary_table_round_trip(monkeypatch, binary_format):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("WANDB_TABLE_BINARY_FORMAT", binary_format)
+    artifact = wandb.Artifact("A", "B")
+    table = wandb.Table(
+        columns=["n", "s", "i", "b", "image"],
+        data=[
+            [1.5, "a", 1, True, wandb.Image(np.zeros((2, 2)))],
+            [2.5, None, None, None, None],
+        ],
+    )
+    json_obj = table.to_json(artifact)
+
+    binary_table = json_obj["binary_table"]
+    assert binary_table["columns"] == ["n", "s", "i", "b"]
+    assert binary_table["inline"] == (binary_format == "arrow")
+    if binary_format == "arrow_only":
+        assert [row[:4] for row in json_obj["data"]] == [[None] * 4, [None] * 4]
+
+    source_artifact = unittest.mock.MagicMock()
+    source_artifact.get_path.side_effect = lambda name: unittest.mock.Mock(
+        download=lambda: artifact.manifest.entries[name].local_path
+    )
+    loaded = wandb.Table.from_json(json_obj, source_artifact)
+    assert loaded.get_column("n") == [1.5, 2.5]
+    assert loaded.get_column("s") == ["a", None]
+    # nulls stay None rather than turning int and bool columns into floats
+    assert loaded.get_column("i") == [1, None]
+    assert loaded.get_column("b") == [True, None]
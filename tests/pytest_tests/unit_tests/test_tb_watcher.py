@@ -0,0 +1,42 @@
+import queue
+import struct
+
+import numpy as np
+from wandb.sdk.interface.interface_queue import InterfaceQueue
+from wandb.sdk.internal import tb_watcher
+
+
+def _tfrecord(data: bytes) -> bytes:
+    # the CRCs aren't checked by the bulk reader
+    return struct.pack("<QI", len(data), 0) + data + struct.pack("<I", 0)
+
+
+def test_bulk_record_iterator_resumes_after_partial_record(tmp_path):
+    path = tmp_path / "events.out.tfevents.1.host"
+    second = _tfrecord(b"second")
+    path.write_bytes(_tfrecord(b"first") + second[:7])
+
+    records = tb_watcher._BulkRecordIterator(str(path))
+    assert list(records) == [b"first"]
+    assert list(records) == []
+
+    with open(path, "ab") as f:
+        f.write(second[7:] + _tfrecord(b""))
+    assert list(records) == [b"second", b""]
+
+
+def test_publish_history_batch_matches_publish_history():
+    rows = [
+        {"_step": 0, "loss": 0.5, "n": 3, "ok": True, "name": "a"},
+        {"_step": 1, "loss": float("nan"), "arr": np.array(0.25), "d": {"x": 1}},
+    ]
+    record_q = queue.Queue()
+    interface = InterfaceQueue(record_q=record_q, process_check=False)
+
+    interface.publish_history_batch([dict(row) for row in rows])
+    batched = [record_q.get_nowait().history for _ in rows]
+    for row in rows:
+        interface.publish_history(dict(row), publish_step=False)
+    single = [record_q.get_nowait().history for _ in rows]
+
+    assert batched == single
@@ -1,3 +1,5 @@
+import unittest.mock
+
 import pytest
 import torch
 import torch.nn as nn
@@ -105,3 +107,85 @@ def test_watch_bad_argument(mock_run):
         ValueError, match="log must be one of 'gradients', 'parameters', 'all', or None"
     ):
         run.watch(net, log="bad_argument")
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        torch.Tensor([1.0, 2.0, 3.0, 4.0]),
+        torch.Tensor([0.5, 0.5, 0.5]),
+        torch.Tensor([-2.0, 1.0, float("nan"), float("inf"), 3.0]),
+        torch.arange(-10, 10, dtype=torch.float16),
+    ],
+)
+def test_batched_tensor_stats_match_log_tensor_stats(mock_run, test_input):
+    run = mock_run(use_magic_mock=True)
+    run._log = unittest.mock.MagicMock()
+    torch_history = wandb.wandb_torch.TorchHistory()
+
+    torch_history.log_tensor_stats(test_input, "expected")
+    torch_history._log_tensor_stats_rows(
+        {"batched": torch_history._tensor_stats_row(test_input)}
+    )
+
+    expected = run._log.call_args_list[0][0][0]["expected"]
+    batched = run._log.call_args_list[1][0][0]["batched"]
+    assert batched.histogram == expected.histogram
+    assert batched.bins == pytest.approx(expected.bins)
+
+
+def test_batched_tensor_stats_skip_non_finite(mock_run):
+    run = mock_run(use_magic_mock=True)
+    run._log = unittest.mock.MagicMock()
+    torch_history = wandb.wandb_torch.TorchHistory()
+
+    assert torch_history._tensor_stats_row(torch.Tensor([])) is None
+    torch_history._log_tensor_stats_rows(
+        {"nan": torch_history._tensor_stats_row(torch.Tensor([float("nan")]))}
+    )
+    run._log.assert_not_called()
+
+
+def test_watch_batch_histograms_logs_once_per_step(mock_run):
+    run = mock_run(use_magic_mock=True)
+    run._log = unittest.mock.MagicMock()
+    net = nn.Sequential(nn.Linear(4, 3), nn.Linear(3, 2))
+    run.watch(net, log="all", log_freq=1, idx=0, batch_histograms=True)
+
+    net(torch.ones(5, 4)).sum().backward()
+
+    # one update for the parameters after forward, one for the gradients
+    assert run._log.call_count == 2
+    parameters, gradients = (call[0][0] for call in run._log.call_args_list)
+    assert sorted(parameters) == [
+        "parameters/0.bias",
+        "parameters/0.weight",
+        "parameters/1.bias",
+        "parameters/1.weight",
+    ]
+    assert sorted(gradients) == [
+        "gradients/0.bias",
+        "gradients/0.weight",
+        "gradients/1.bias",
+        "gradients/1.weight",
+    ]
+
+
+def test_watch_batch_histograms_per_model(mock_run):
+    run = mock_run(use_magic_mock=True)
+    run._log = unittest.mock.MagicMock()
+    net_a = nn.Linear(4, 3)
+    net_b = nn.Linear(4, 2)
+    run.watch((net_a, net_b), log="gradients", log_freq=1, idx=0, batch_histograms=True)
+
+    # each model's gradients are logged as soon as its own backward pass is done
+    net_a(torch.ones(5, 4)).sum().backward()
+    assert run._log.call_count == 1
+    assert sorted(run._log.call_args[0][0]) == ["gradients/bias", "gradients/weight"]
+
+    net_b(torch.ones(5, 4)).sum().backward()
+    assert run._log.call_count == 2
+    assert sorted(run._log.call_args[0][0]) == [
+        "gradients/graph_1bias",
+        "gradients/graph_1weight",
+    ]
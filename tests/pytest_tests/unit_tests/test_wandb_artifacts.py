@@ -1,6 +1,9 @@
 import asyncio
 import functools
 import queue
+import re
+import threading
+import time
 import unittest.mock as mock
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Optional
@@ -8,7 +11,10 @@ from unittest.mock import Mock
 
 import pytest
 import requests
+import responses
 from wandb.filesync.step_prepare import ResponsePrepare, StepPrepare
+from wandb.sdk import wandb_artifacts
+from wandb.sdk.lib.hashutil import md5_string
 from wandb.sdk.wandb_artifacts import (
     Artifact,
     ArtifactManifestEntry,
@@ -435,24 +441,142 @@ class TestStoreFile:
         }
         hex_digests = {1: "abc1", 2: "abc2", 3: "abc3"}
         chunk_size = 1
-        test_file = some_file(tmp_path)
+        test_file = tmp_path / "some-file"
+        test_file.write_text("abc")
         policy = WandbStoragePolicy(api=api)
-        responses = []
-        for idx in range(1, len(hex_digests) + 1):
+        uploaded = {}
+
+        def upload_chunk(url, data, extra_headers):
+            part_number = int(url.split("=")[-1])
+            uploaded[part_number] = data
             etag_response = requests.Response()
-            etag_response.headers = {"ETag": hex_digests[idx]}
-            responses.append(etag_response)
-        api.upload_multipart_file_chunk_retry.side_effect = responses
+            etag_response.headers = {"ETag": hex_digests[part_number]}
+            return etag_response
+
+        api.upload_multipart_file_chunk_retry.side_effect = upload_chunk
+        progress_callback = Mock()
+
+        etags = policy.s3_multipart_file_upload(
+            str(test_file),
+            chunk_size,
+            hex_digests,
+            multipart_parts,
+            extra_headers={},
+            progress_callback=progress_callback,
+            # Parts already in memory are uploaded without re-reading the file.
+            chunks={3: b"z"},
+        )
+        assert api.upload_multipart_file_chunk_retry.call_count == 3
+        assert uploaded == {1: b"a", 2: b"b", 3: b"z"}
+        # Note Etags == hex_digest when there isn't an additional encryption method for uploading.
+        assert [etag["partNumber"] for etag in etags] == [1, 2, 3]
+        for etag in etags:
+            assert etag["hexMD5"] == hex_digests[etag["partNumber"]]
+        assert progress_callback.call_args_list == [mock.call(1, 3)] * 3
 
-        with mock.patch("builtins.open", mock.mock_open(read_data="abc")):
-            etags = policy.s3_multipart_file_upload(
-                test_file, chunk_size, hex_digests, multipart_parts, extra_headers={}
-            )
-            assert api.upload_multipart_file_chunk_retry.call_count == 3
-            # Note Etags == hex_digest when there isn't an additional encryption method for uploading.
-            assert len(etags) == len(hex_digests)
-            for etag in etags:
-                assert etag["hexMD5"] == hex_digests[etag["partNumber"]]
+
+class TestLoadFile:
+    CONTENT = "0123456789"
+
+    @pytest.fixture
+    def api(self):
+        api = Mock(api_key="my-api-key")
+        api.settings.return_value = "http://wandb-test"
+        return api
+
+    @pytest.fixture
+    def entry(self) -> ArtifactManifestEntry:
+        return ArtifactManifestEntry(
+            path="my-path", digest=md5_string(self.CONTENT), size=len(self.CONTENT)
+        )
+
+    @staticmethod
+    def _load_file(policy: WandbStoragePolicy, entry: ArtifactManifestEntry) -> str:
+        with mock.patch(
+            "wandb.sdk.wandb_artifacts._DOWNLOAD_RANGE_THRESHOLD", 4
+        ), mock.patch("wandb.sdk.wandb_artifacts._DOWNLOAD_RANGE_PART_SIZE", 3):
+            return policy.load_file(Mock(entity="my-entity"), entry)
+
+    def _range_callback(self, request):
+        range_header = request.headers.get("Range")
+        if range_header is None:
+            return 200, {}, self.CONTENT
+        start, end = (int(x) for x in range_header[len("bytes=") :].split("-"))
+        return 206, {}, self.CONTENT[start : end + 1]
+
+    @responses.activate
+    def test_downloads_large_file_in_ranges(
+        self, api, entry, artifacts_cache: ArtifactsCache
+    ):
+        responses.add_callback(
+            responses.GET, re.compile("http://wandb-test/.*"), self._range_callback
+        )
+        policy = WandbStoragePolicy(api=api, cache=artifacts_cache)
+
+        path = self._load_file(policy, entry)
+
+        assert Path(path).read_text() == self.CONTENT
+        ranges = sorted(call.request.headers["Range"] for call in responses.calls)
+        assert ranges == ["bytes=0-2", "bytes=3-5", "bytes=6-8", "bytes=9-9"]
+
+    @responses.activate
+    def test_range_parts_share_process_wide_limit(
+        self, api, entry, artifacts_cache: ArtifactsCache, monkeypatch
+    ):
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def callback(request):
+            with lock:
+                in_flight.append(request)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(request)
+            return self._range_callback(request)
+
+        responses.add_callback(
+            responses.GET, re.compile("http://wandb-test/.*"), callback
+        )
+        monkeypatch.setenv("WANDB_ARTIFACT_DOWNLOAD_CONCURRENCY", "1")
+        monkeypatch.setattr(wandb_artifacts, "_download_range_slots", None)
+        policy = WandbStoragePolicy(api=api, cache=artifacts_cache)
+
+        path = self._load_file(policy, entry)
+
+        assert Path(path).read_text() == self.CONTENT
+        # the first part, and one more part at a time
+        assert len(responses.calls) == 4
+        assert max(max_in_flight) == 1
+
+    @responses.activate
+    def test_falls_back_to_single_stream_if_range_ignored(
+        self, api, entry, artifacts_cache: ArtifactsCache
+    ):
+        responses.add(
+            responses.GET, re.compile("http://wandb-test/.*"), body=self.CONTENT
+        )
+        policy = WandbStoragePolicy(api=api, cache=artifacts_cache)
+
+        path = self._load_file(policy, entry)
+
+        assert Path(path).read_text() == self.CONTENT
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_small_file_is_not_ranged(self, api, artifacts_cache: ArtifactsCache):
+        responses.add_callback(
+            responses.GET, re.compile("http://wandb-test/.*"), self._range_callback
+        )
+        policy = WandbStoragePolicy(api=api, cache=artifacts_cache)
+        entry = ArtifactManifestEntry(path="my-path", digest=md5_string("012"), size=3)
+
+        with mock.patch("wandb.sdk.wandb_artifacts._DOWNLOAD_RANGE_THRESHOLD", 4):
+            policy.load_file(Mock(entity="my-entity"), entry)
+
+        assert len(responses.calls) == 1
+        assert "Range" not in responses.calls[0].request.headers
 
 
 @pytest.mark.parametrize("type", ["job", "wandb-history", "wandb-foo"])
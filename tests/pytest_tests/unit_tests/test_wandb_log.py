@@ -1,3 +1,7 @@
+import json
+
+import numpy as np
+import pandas as pd
 import pytest
 import wandb
 
@@ -46,3 +50,49 @@ def test_log_not_dict(mock_run):
     run = mock_run()
     with pytest.raises(ValueError):
         run.log(10)
+
+
+def test_log_batch_single_request(mock_run, parse_records, record_q):
+    run = mock_run()
+    run.log({"a": 1})
+    run.log_batch({"loss": np.arange(1000, dtype=np.float32)})
+    assert run.step == 1001
+
+    partial_history = parse_records(record_q).partial_history
+    assert len(partial_history) == 2
+    columns = partial_history[1]
+    assert json.loads(columns["_step"]) == list(range(1, 1001))
+    assert len(json.loads(columns["loss"])) == 1000
+
+
+def test_log_batch_dataframe_step_column(mock_run, parse_records, record_q):
+    run = mock_run()
+    df = pd.DataFrame({"it": [2, 4, 8], "loss": [0.5, np.nan, 0.1], "tag": list("abc")})
+    run.log_batch(df, step="it")
+    assert run.step == 9
+
+    (columns,) = parse_records(record_q).partial_history
+    assert "it" not in columns
+    assert json.loads(columns["_step"]) == [2, 4, 8]
+    assert columns["loss"] == "[0.5, NaN, 0.1]"
+    assert columns["tag"] == '["a", "b", "c"]'
+
+
+@pytest.mark.parametrize(
+    "data, step",
+    [
+        ({"a": [1, 2], "b": [1]}, None),
+        ({"a": [[1], [2]]}, None),
+        ({"a": [{"x": 1}]}, None),
+        ({"a": [1.0, 2.0], "s": [1.0, 2.0]}, "s"),
+        ({"a": [1.0, 2.0], "s": [2, 1]}, "s"),
+        ({1: [1.0]}, None),
+        ({"a": [1.0], "_step": [3]}, None),
+        ({"a": [1.0], "_step": [3], "s": [4]}, "s"),
+        ({"a": [1.0], "_wandb_batch": [1]}, None),
+    ],
+)
+def test_log_batch_invalid(mock_run, data, step):
+    run = mock_run()
+    with pytest.raises(ValueError):
+        run.log_batch(data, step=step)
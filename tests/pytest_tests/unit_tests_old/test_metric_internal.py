@@ -2,6 +2,7 @@
 metric internal tests.
 """
 
+import numpy as np
 from wandb.proto import wandb_internal_pb2 as pb
 
 
@@ -79,3 +80,27 @@ def test_metric_glob_twice_norm(publish_util):
         "metric": 1,
         "metric": {"best": 1, "max": 1, "min": 1},
     }
+
+
+def test_metric_history_batch(publish_util):
+    m1 = pb.MetricRecord(name="loss")
+    m1.summary.min = True
+
+    def end_cb(interface):
+        interface.publish_partial_history({"acc": 0.5}, user_step=0, step=0)
+        interface.publish_partial_history_batch(
+            {"loss": np.array([3.0, 1.0, 2.0]), "name": np.array(["a", "b", "c"])},
+            [0, 1, 5],
+        )
+
+    ctx_util = publish_util(metrics=[m1], end_cb=end_cb)
+
+    history = ctx_util.history
+    assert [row["_step"] for row in history] == [0, 1, 5]
+    assert [row["loss"] for row in history] == [3.0, 1.0, 2.0]
+    assert history[0]["acc"] == 0.5
+    assert len({row["_timestamp"] for row in history}) == 1
+    summary = ctx_util.summary
+    assert summary["loss"] == {"min": 1.0}
+    assert summary["name"] == "c"
+    assert summary["_step"] == 5
@@ -0,0 +1,72 @@
+"""Measure DataStore write throughput with and without group commit.
+
+Run with `python tests/standalone_tests/datastore_benchmark.py` or through
+pytest with `pytest-benchmark` installed.
+"""
+import argparse
+import json
+import pathlib
+import tempfile
+import time
+
+import pytest
+import wandb
+from wandb.proto import wandb_internal_pb2 as pb
+from wandb.sdk.internal import datastore
+
+
+def make_history_record(step: int, num_keys: int = 10) -> pb.Record:
+    record = pb.Record()
+    for i in range(num_keys):
+        item = record.history.item.add()
+        item.key = f"metric_{i}"
+        item.value_json = json.dumps(step * 0.5 + i)
+    item = record.history.item.add()
+    item.key = "_step"
+    item.value_json = json.dumps(step)
+    return record
+
+
+def write_records(fname: str, records, **kwargs) -> None:
+    ds = datastore.DataStore(**kwargs)
+    ds.open_for_write(fname)
+    for record in records:
+        ds.write(record)
+    ds.close()
+
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_benchmark_datastore_write(tmp_path: pathlib.Path, benchmark, group_commit):
+    wandb._set_internal_process()
+    records = [make_history_record(step) for step in range(20_000)]
+    counter = iter(range(1_000_000))
+
+    def target():
+        fname = str(tmp_path / f"run-{next(counter)}.wandb")
+        write_records(fname, records, group_commit=group_commit)
+
+    benchmark.pedantic(target=target, rounds=5, iterations=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--keys", type=int, default=10)
+    args = parser.parse_args()
+
+    wandb._set_internal_process()
+    records = [make_history_record(step, args.keys) for step in range(args.records)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for group_commit in (False, True):
+            fname = str(pathlib.Path(tmp_dir) / f"group-{group_commit}.wandb")
+            start = time.perf_counter()
+            write_records(fname, records, group_commit=group_commit)
+            elapsed = time.perf_counter() - start
+            print(
+                f"group_commit={group_commit}: "
+                f"{args.records / elapsed:,.0f} records/sec ({elapsed:.2f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure `wandb.log` calls per second in offline mode.
+
+Run with `python tests/standalone_tests/log_benchmark.py` or through pytest
+with `pytest-benchmark` installed.  Pass `--min-calls-per-sec` to fail when the
+rate drops below a known-good baseline.
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pytest
+import wandb
+
+
+def make_rows(num_keys: int, kind: str = "float", num_rows: int = 100):
+    keys = [f"metric_{i}" for i in range(num_keys)]
+    if kind == "numpy":
+        return [{k: np.float32(random.random()) for k in keys} for _ in range(num_rows)]
+    return [{k: random.random() for k in keys} for _ in range(num_rows)]
+
+
+def log_rows(run, rows, steps: int) -> float:
+    start = time.perf_counter()
+    for step in range(steps):
+        run.log(rows[step % len(rows)])
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("kind", ["float", "numpy"])
+def test_benchmark_log_scalars(tmp_path, benchmark, kind):
+    rows = make_rows(30, kind)
+    run = wandb.init(mode="offline", dir=str(tmp_path))
+
+    def target():
+        log_rows(run, rows, 5_000)
+
+    benchmark.pedantic(target=target, rounds=5, iterations=1)
+    run.finish()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=20_000)
+    parser.add_argument("--keys", type=int, default=30)
+    parser.add_argument("--min-calls-per-sec", type=float, default=None)
+    args = parser.parse_args()
+
+    rates = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run = wandb.init(mode="offline", dir=tmp_dir)
+        for kind in ("float", "numpy"):
+            elapsed = log_rows(run, make_rows(args.keys, kind), args.steps)
+            rates[kind] = args.steps / elapsed
+        run.finish(quiet=True)
+
+    for kind, rate in rates.items():
+        print(f"{kind} scalars: {rate:,.0f} calls/sec")
+    if args.min_calls_per_sec and min(rates.values()) < args.min_calls_per_sec:
+        print(f"slower than {args.min_calls_per_sec:,.0f} calls/sec")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,13 @@ import os
 import platform
 import re
 import shutil
+import sys
 import tempfile
+import threading
 import time
 import urllib
-from collections import namedtuple
-from functools import partial
+from collections import deque, namedtuple
+from concurrent import futures
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -2084,7 +2086,9 @@ class Run(Attrs):
         return lines
 
     @normalize_exceptions
-    def scan_history(self, keys=None, page_size=1000, min_step=None, max_step=None):
+    def scan_history(
+        self, keys=None, page_size=1000, min_step=None, max_step=None, prefetch=0
+    ):
         """Returns an iterable collection of all history records for a run.
 
         Example:
@@ -2100,9 +2104,14 @@ class Run(Attrs):
         Arguments:
             keys ([str], optional): only fetch these keys, and only fetch rows that have all of keys defined.
             page_size (int, optional): size of pages to fetch from the api
+            prefetch (int, optional): number of pages to fetch concurrently in the
+                background while iterating. The default of 0 fetches one page at a time.
 
         Returns:
-            An iterable collection over history records (dict).
+            An iterable collection over history records (dict). The collection
+            also has `to_columns()`, `to_pandas()` and `to_arrow()` methods that
+            return the remaining rows in columnar form, and a `close()` method
+            that stops background requests when iteration ends early.
         """
         if keys is not None and not isinstance(keys, list):
             wandb.termerror("keys must be specified in a list")
@@ -2127,6 +2136,7 @@ class Run(Attrs):
                 page_size=page_size,
                 min_step=min_step,
                 max_step=max_step,
+                prefetch=prefetch,
             )
         else:
             return SampledHistoryScan(
@@ -2136,6 +2146,7 @@ class Run(Attrs):
                 page_size=page_size,
                 min_step=min_step,
                 max_step=max_step,
+                prefetch=prefetch,
             )
 
     @normalize_exceptions
@@ -3105,8 +3116,6 @@ class QueryGenerator:
 
 
 class PythonMongoishQueryGenerator:
-    from pkg_resources import parse_version
-
     SPACER = "----------"
     DECIMAL_SPACER = ";;;"
     FRONTEND_NAME_MAPPING = {
@@ -3146,7 +3155,7 @@ class PythonMongoishQueryGenerator:
         ast.Not: "$not",
     }
 
-    if parse_version(platform.python_version()) >= parse_version("3.8"):
+    if sys.version_info >= (3, 8):
         AST_FIELDS = {
             ast.Constant: "value",
             ast.Name: "id",
@@ -3469,30 +3478,29 @@ class BetaReport(Attrs):
         return self.to_html()
 
 
-class HistoryScan:
-    QUERY = gql(
-        """
-        query HistoryPage($entity: String!, $project: String!, $run: String!, $minStep: Int64!, $maxStep: Int64!, $pageSize: Int!) {
-            project(name: $project, entityName: $entity) {
-                run(name: $run) {
-                    history(minStep: $minStep, maxStep: $maxStep, samples: $pageSize)
-                }
-            }
-        }
-        """
-    )
+class _BaseHistoryScan:
+    """Iterates over history rows one page of steps at a time.
+
+    With `prefetch` > 0, the next `prefetch` pages are requested concurrently
+    in the background while the caller consumes the current one.
+    """
 
-    def __init__(self, client, run, min_step, max_step, page_size=1000):
+    def __init__(self, client, run, min_step, max_step, page_size=1000, prefetch=0):
         self.client = client
         self.run = run
         self.page_size = page_size
         self.min_step = min_step
         self.max_step = max_step
+        self.prefetch = prefetch
         self.page_offset = min_step  # minStep for next page
         self.scan_offset = 0  # index within current page of rows
         self.rows = []  # current page of rows
+        self._executor = None
+        self._pending = deque()  # futures for prefetched pages
+        self._fetch_offset = min_step  # minStep for next page to request
 
     def __iter__(self):
+        self._stop_prefetch()
         self.page_offset = self.min_step
         self.scan_offset = 0
         self.rows = []
@@ -3505,37 +3513,149 @@ class HistoryScan:
                 self.scan_offset += 1
                 return row
             if self.page_offset >= self.max_step:
+                self._stop_prefetch()
                 raise StopIteration()
             self._load_next()
 
     next = __next__
 
+    def _load_next(self):
+        if self.prefetch > 0:
+            self._schedule_prefetch()
+            self.rows = self._pending.popleft().result()
+        else:
+            self.rows = self._fetch_page(
+                self.page_offset, self._page_end(self.page_offset)
+            )
+        self.page_offset += self.page_size
+        self.scan_offset = 0
+
+    def _page_end(self, page_offset):
+        return min(page_offset + self.page_size, self.max_step)
+
+    def _schedule_prefetch(self):
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self.prefetch, thread_name_prefix="wandb-history-scan"
+            )
+            self._fetch_offset = self.page_offset
+        while (
+            len(self._pending) < self.prefetch + 1
+            and self._fetch_offset < self.max_step
+        ):
+            self._pending.append(
+                self._executor.submit(
+                    self._fetch_page,
+                    self._fetch_offset,
+                    self._page_end(self._fetch_offset),
+                )
+            )
+            self._fetch_offset += self.page_size
+
+    def _stop_prefetch(self):
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def close(self):
+        """Stop any page requests still running in the background.
+
+        Only needed when iteration is abandoned before the end of the scan.
+        """
+        self._stop_prefetch()
+
+    def __del__(self):
+        if getattr(self, "_executor", None) is not None:
+            self._stop_prefetch()
+
+    def _fetch_page(self, min_step, max_step):
+        raise NotImplementedError
+
+    def _remaining_pages(self):
+        try:
+            yield self.rows[self.scan_offset :]
+            self.scan_offset = len(self.rows)
+            while self.page_offset < self.max_step:
+                self._load_next()
+                self.scan_offset = len(self.rows)
+                yield self.rows
+        finally:
+            self._stop_prefetch()
+
+    def to_columns(self):
+        """Fetch all remaining rows and return them as a dict of column lists.
+
+        Keys missing from a row are filled with None.
+        """
+        columns = {}
+        num_rows = 0
+        for rows in self._remaining_pages():
+            for row in rows:
+                for key, value in row.items():
+                    column = columns.get(key)
+                    if column is None:
+                        column = columns[key] = []
+                    if len(column) < num_rows:
+                        column.extend([None] * (num_rows - len(column)))
+                    column.append(value)
+                num_rows += 1
+        for column in columns.values():
+            column.extend([None] * (num_rows - len(column)))
+        return columns
+
+    def to_pandas(self):
+        """Fetch all remaining rows as a `pandas.DataFrame`."""
+        pandas = util.get_module(
+            "pandas", required="to_pandas requires the pandas library"
+        )
+        return pandas.DataFrame(self.to_columns())
+
+    def to_arrow(self):
+        """Fetch all remaining rows as a `pyarrow.Table`."""
+        pyarrow = util.get_module(
+            "pyarrow", required="to_arrow requires the pyarrow library"
+        )
+        return pyarrow.table(self.to_columns())
+
+
+class HistoryScan(_BaseHistoryScan):
+    QUERY = gql(
+        """
+        query HistoryPage($entity: String!, $project: String!, $run: String!, $minStep: Int64!, $maxStep: Int64!, $pageSize: Int!) {
+            project(name: $project, entityName: $entity) {
+                run(name: $run) {
+                    history(minStep: $minStep, maxStep: $maxStep, samples: $pageSize)
+                }
+            }
+        }
+        """
+    )
+
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
-        if max_step > self.max_step:
-            max_step = self.max_step
+    def _fetch_page(self, min_step, max_step):
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
             "run": self.run.id,
-            "minStep": int(self.page_offset),
+            "minStep": int(min_step),
             "maxStep": int(max_step),
             "pageSize": int(self.page_size),
         }
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["history"]
-        self.rows = [json.loads(row) for row in res]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        # Decode the whole page with a single call rather than row by row.
+        return json.loads("[" + ",".join(res) + "]")
 
 
-class SampledHistoryScan:
+class SampledHistoryScan(_BaseHistoryScan):
     QUERY = gql(
         """
         query SampledHistoryPage($entity: String!, $project: String!, $run: String!, $spec: JSONString!) {
@@ -3548,44 +3668,20 @@ class SampledHistoryScan:
         """
     )
 
-    def __init__(self, client, run, keys, min_step, max_step, page_size=1000):
-        self.client = client
-        self.run = run
+    def __init__(
+        self, client, run, keys, min_step, max_step, page_size=1000, prefetch=0
+    ):
+        super().__init__(
+            client, run, min_step, max_step, page_size=page_size, prefetch=prefetch
+        )
         self.keys = keys
-        self.page_size = page_size
-        self.min_step = min_step
-        self.max_step = max_step
-        self.page_offset = min_step  # minStep for next page
-        self.scan_offset = 0  # index within current page of rows
-        self.rows = []  # current page of rows
-
-    def __iter__(self):
-        self.page_offset = self.min_step
-        self.scan_offset = 0
-        self.rows = []
-        return self
-
-    def __next__(self):
-        while True:
-            if self.scan_offset < len(self.rows):
-                row = self.rows[self.scan_offset]
-                self.scan_offset += 1
-                return row
-            if self.page_offset >= self.max_step:
-                raise StopIteration()
-            self._load_next()
-
-    next = __next__
 
     @normalize_exceptions
     @retry.retriable(
         check_retry_fn=util.no_retry_auth,
         retryable_exceptions=(RetryError, requests.RequestException),
     )
-    def _load_next(self):
-        max_step = self.page_offset + self.page_size
-        if max_step > self.max_step:
-            max_step = self.max_step
+    def _fetch_page(self, min_step, max_step):
         variables = {
             "entity": self.run.entity,
             "project": self.run.project,
@@ -3593,7 +3689,7 @@ class SampledHistoryScan:
             "spec": json.dumps(
                 {
                     "keys": self.keys,
-                    "minStep": int(self.page_offset),
+                    "minStep": int(min_step),
                     "maxStep": int(max_step),
                     "samples": int(self.page_size),
                 }
@@ -3602,9 +3698,7 @@ class SampledHistoryScan:
 
         res = self.client.execute(self.QUERY, variable_values=variables)
         res = res["project"]["run"]["sampledHistory"]
-        self.rows = res[0]
-        self.page_offset += self.page_size
-        self.scan_offset = 0
+        return res[0]
 
 
 class ProjectArtifactTypes(Paginator):
@@ -4214,6 +4308,57 @@ class _ArtifactDownloadLogger:
                 self._last_log_time = self._clock()
 
 
+_download_executor: Optional[futures.ThreadPoolExecutor] = None
+_download_executor_pid: Optional[int] = None
+_download_executor_lock = threading.Lock()
+_download_worker = threading.local()
+
+
+def _mark_download_worker() -> None:
+    _download_worker.active = True
+
+
+def _get_download_executor() -> futures.ThreadPoolExecutor:
+    """Return the process-wide pool shared by all artifact downloads.
+
+    Sharing one pool bounds the number of concurrent file downloads no matter
+    how many artifacts (or dependent artifacts) are being downloaded at once.
+    The size is read from `WANDB_ARTIFACT_DOWNLOAD_CONCURRENCY`.
+    """
+    global _download_executor, _download_executor_pid
+    with _download_executor_lock:
+        # A forked child inherits the executor object but not its threads.
+        if _download_executor is None or _download_executor_pid != os.getpid():
+            _download_executor = futures.ThreadPoolExecutor(
+                max_workers=env.get_artifact_download_concurrency(),
+                thread_name_prefix="wandb-artifact-download",
+                initializer=_mark_download_worker,
+            )
+            _download_executor_pid = os.getpid()
+        return _download_executor
+
+
+def _submit_download(fn: Callable, *args: Any, **kwargs: Any) -> futures.Future:
+    if getattr(_download_worker, "active", False):
+        # Waiting on the shared pool from one of its own workers could
+        # deadlock once every worker is blocked, so run nested work inline.
+        future: futures.Future = futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    return _get_download_executor().submit(fn, *args, **kwargs)
+
+
+def _wait_downloads(fs: Sequence[futures.Future]) -> None:
+    done, not_done = futures.wait(fs, return_when=futures.FIRST_EXCEPTION)
+    for future in not_done:
+        future.cancel()
+    for future in done:
+        future.result()
+
+
 class Artifact(artifacts.Artifact):
     """A wandb Artifact.
 
@@ -4732,22 +4877,20 @@ class Artifact(artifacts.Artifact):
             start_time = datetime.datetime.now()
 
         # Force all the files to download into the same directory.
-        # Download in parallel
-        import multiprocessing.dummy  # this uses threads
-
+        # Download in parallel on the shared pool; dependent artifacts are
+        # queued on the same pool rather than starting pools of their own.
         download_logger = _ArtifactDownloadLogger(nfiles=nfiles)
-
-        pool = multiprocessing.dummy.Pool(32)
-        pool.map(
-            partial(self._download_file, root=dirpath, download_logger=download_logger),
-            manifest.entries,
-        )
-        if recursive:
-            pool.map(lambda artifact: artifact.download(), self._dependent_artifacts)
-        pool.close()
-        pool.join()
+        fs = self._submit_download_files(dirpath, download_logger)
+        dependents = self._dependent_artifacts if recursive else []
+        for artifact in dependents:
+            artifact_root = artifact._default_root()
+            artifact._add_download_root(artifact_root)
+            fs.extend(artifact._submit_download_files(artifact_root))
+        _wait_downloads(fs)
 
         self._is_downloaded = True
+        for artifact in dependents:
+            artifact._is_downloaded = True
 
         if log:
             now = datetime.datetime.now()
@@ -4825,6 +4968,23 @@ class Artifact(artifacts.Artifact):
 
         return self._download_file(list(manifest.entries)[0], root=root)
 
+    def _submit_download_files(
+        self, root, download_logger: Optional[_ArtifactDownloadLogger] = None
+    ) -> List[futures.Future]:
+        # Queue small files ahead of large ones: they finish quickly and keep
+        # every worker busy while the large files stream in.
+        manifest = self._load_manifest()
+        entries = sorted(manifest.entries.values(), key=lambda e: e.size or 0)
+        return [
+            _submit_download(
+                self._download_file,
+                entry.path,
+                root=root,
+                download_logger=download_logger,
+            )
+            for entry in entries
+        ]
+
     def _download_file(
         self, name, root, download_logger: Optional[_ArtifactDownloadLogger] = None
     ):
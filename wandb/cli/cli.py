@@ -265,6 +265,23 @@ def login(key, host, cloud, relogin, anonymously, no_offline=False):
 @click.option("--debug", is_flag=True, help="log debug info")
 @click.option("--serve-sock", is_flag=True, help="use socket mode")
 @click.option("--serve-grpc", is_flag=True, help="use grpc mode")
+@click.option("--serve-unix", is_flag=True, help="use a unix socket in socket mode")
+@click.option(
+    "--stream-workers",
+    default=0,
+    type=int,
+    help="Run streams in this many worker processes.",
+)
+@click.option(
+    "--ready-fd", default=None, type=int, help="Write the port info to this fd."
+)
+@click.option("--shared", is_flag=True, help="Serve all processes of this user.")
+@click.option(
+    "--idle-timeout",
+    default=600,
+    type=float,
+    help="Seconds a shared service stays up while unused.",
+)
 @display_error
 def service(
     grpc_port=None,
@@ -275,6 +292,11 @@ def service(
     debug=False,
     serve_sock=False,
     serve_grpc=False,
+    serve_unix=False,
+    stream_workers=0,
+    ready_fd=None,
+    shared=False,
+    idle_timeout=600,
 ):
     from wandb.sdk.service.server import WandbServer
 
@@ -287,6 +309,11 @@ def service(
         debug=debug,
         serve_sock=serve_sock,
         serve_grpc=serve_grpc,
+        serve_unix=serve_unix,
+        stream_workers=stream_workers,
+        ready_fd=ready_fd,
+        shared=shared,
+        idle_timeout=idle_timeout,
     )
     server.serve()
 
@@ -487,6 +514,9 @@ def init(ctx, project, entity, reset, mode):
 @click.option("--ignore", hidden=True)
 @click.option("--show", default=5, help="Number of runs to show")
 @click.option("--append", is_flag=True, default=False, help="Append run")
+@click.option(
+    "--workers", default=1, type=int, help="Number of runs to sync concurrently"
+)
 @display_error
 def sync(
     ctx,
@@ -510,6 +540,7 @@ def sync(
     clean_old_hours=24,
     clean_force=None,
     append=None,
+    workers=None,
 ):
     # TODO: rather unfortunate, needed to avoid creating a `wandb` directory
     os.environ["WANDB_DIR"] = TMPDIR.name
@@ -579,6 +610,7 @@ def sync(
             sync_tensorboard=_sync_tensorboard,
             log_path=_wandb_log_path,
             append=append,
+            workers=workers,
         )
         for p in _path:
             sm.add(p)
@@ -27,7 +27,7 @@ from decimal import Decimal
 from typing import Optional
 
 import wandb
-from wandb import util
+from wandb import env, util
 from wandb.sdk.lib import filesystem
 
 from .sdk.data_types import _dtypes
@@ -103,6 +103,36 @@ class _TableIndex(int, _TableLinkMixin):
         return row
 
 
+# numpy dtype kinds (bool, int, uint, float) whose values all map to the same
+# wandb type, so the type of such a column is inferred from a single value
+_NATIVE_DTYPE_KINDS = "biuf"
+
+
+def _is_native_column(values):
+    return (
+        util.is_numpy_array(values)
+        and values.ndim == 1
+        and values.dtype.kind in _NATIVE_DTYPE_KINDS
+    )
+
+
+# column types that can be stored in a binary (Arrow) table file
+_BINARY_COLUMN_TYPES = (_dtypes.NumberType, _dtypes.BooleanType, _dtypes.StringType)
+
+
+def _is_binary_column_type(col_type):
+    if isinstance(col_type, _dtypes.UnionType):
+        allowed_types = [
+            t
+            for t in col_type.params["allowed_types"]
+            if not isinstance(t, _dtypes.NoneType)
+        ]
+        return len(allowed_types) == 1 and isinstance(
+            allowed_types[0], _BINARY_COLUMN_TYPES
+        )
+    return isinstance(col_type, _BINARY_COLUMN_TYPES)
+
+
 def _json_helper(val, artifact):
     if isinstance(val, WBValue):
         return val.to_json(artifact)
@@ -320,6 +350,10 @@ class Table(Media):
         self._assert_valid_columns(columns)
         self.columns = columns
         self._make_column_types(dtype, optional)
+        if ndarray.ndim == 2 and ndarray.shape[1] == len(columns):
+            column_values = [ndarray[:, ndx].copy() for ndx in range(len(columns))]
+            if self._init_from_columns(column_values):
+                return
         for row in ndarray:
             self.add_data(*row)
 
@@ -332,8 +366,99 @@ class Table(Media):
         self._assert_valid_columns(columns)
         self.columns = columns
         self._make_column_types(dtype, optional)
+        column_values = []
+        for ndx in range(len(columns)):
+            values = dataframe.iloc[:, ndx].values
+            # extension arrays (categoricals, nullable ints, ...) are kept as
+            # the python objects they yield
+            column_values.append(
+                values.copy() if util.is_numpy_array(values) else list(values)
+            )
+        if self._init_from_columns(column_values):
+            return
         for row in range(len(dataframe)):
-            self.add_data(*tuple(dataframe[col].values[row] for col in self.columns))
+            self.add_data(*tuple(values[row] for values in column_values))
+
+    def _init_from_columns(self, column_values):
+        """Store column-major data, inferring each column's type in one pass.
+
+        Returns False, leaving the table untouched, if the data has to go
+        through `add_data` row by row instead.
+        """
+        if len(column_values) == 0:
+            return False
+        for values in column_values:
+            # key-like values recast their column as they are added
+            if not _is_native_column(values) and any(
+                isinstance(item, _TableLinkMixin) for item in values
+            ):
+                return False
+
+        type_map = self._column_types.params["type_map"]
+        for col_name, values in zip(self.columns, column_values):
+            type_map[col_name] = self._assign_column(type_map[col_name], values)
+
+        self._column_data = column_values
+        self._data = None
+        if self._pk_col is not None or self._fk_cols:
+            self._apply_key_updates()
+        return True
+
+    @property
+    def data(self):
+        """The rows of the table, as a list of lists.
+
+        Tables built from a DataFrame or ndarray hold their data by column; the
+        rows are only materialized the first time they are accessed here.
+        """
+        if self._data is None:
+            self._data = [list(row) for row in zip(*self._column_data)]
+            self._column_data = None
+        return self._data
+
+    @data.setter
+    def data(self, rows):
+        self._data = rows
+        self._column_data = None
+
+    def _num_rows(self):
+        if self._column_data is not None:
+            return len(self._column_data[0])
+        return len(self._data)
+
+    def _column_values(self, col_ndx):
+        if self._column_data is not None:
+            return self._column_data[col_ndx]
+        return [row[col_ndx] for row in self._data]
+
+    @staticmethod
+    def _assign_column(wbtype, values):
+        """Assign every value of a column to `wbtype` and return the result type.
+
+        Raises:
+            TypeError: if a value cannot be assigned.
+        """
+        if _is_native_column(values):
+            values = values[:1]
+        seen_classes = set()
+        for item in values:
+            # the type of these values doesn't depend on the value itself
+            # (float is left out as NaN is typed as None)
+            if item.__class__ in (str, int, bool, type(None)):
+                if item.__class__ in seen_classes:
+                    continue
+                seen_classes.add(item.__class__)
+            result_type = wbtype.assign(item)
+            if isinstance(result_type, _dtypes.InvalidType):
+                raise TypeError(
+                    "Existing data {}, of type {} cannot be cast to {}".format(
+                        item,
+                        _dtypes.TypeRegistry.type_of(item),
+                        wbtype,
+                    )
+                )
+            wbtype = result_type
+        return wbtype
 
     def _make_column_types(self, dtype=None, optional=True):
         if dtype is None:
@@ -365,19 +490,9 @@ class Table(Media):
         if optional:
             wbtype = _dtypes.OptionalType(wbtype)
 
-        # Cast each value in the row, raising an error if there are invalid entries.
+        # Cast each value in the column, raising an error if there are invalid entries.
         col_ndx = self.columns.index(col_name)
-        for row in self.data:
-            result_type = wbtype.assign(row[col_ndx])
-            if isinstance(result_type, _dtypes.InvalidType):
-                raise TypeError(
-                    "Existing data {}, of type {} cannot be cast to {}".format(
-                        row[col_ndx],
-                        _dtypes.TypeRegistry.type_of(row[col_ndx]),
-                        wbtype,
-                    )
-                )
-            wbtype = result_type
+        wbtype = self._assign_column(wbtype, self._column_values(col_ndx))
 
         # Assert valid options
         is_pk = isinstance(wbtype, _PrimaryKeyType)
@@ -513,7 +628,7 @@ class Table(Media):
         # separate this method for easier testing
         if max_rows is None:
             max_rows = Table.MAX_ROWS
-        n_rows = len(self.data)
+        n_rows = self._num_rows()
         if n_rows > max_rows and warn:
             if wandb.run and (
                 wandb.run.settings.table_raise_on_max_row_limit_exceeded
@@ -526,6 +641,14 @@ class Table(Media):
                     f"this may cause slower queries in the W&B UI."
                 )
             logging.warning("Truncating wandb.Table object to %i rows." % max_rows)
+        if self._column_data is not None:
+            columns = [
+                values[:max_rows].tolist()
+                if _is_native_column(values)
+                else values[:max_rows]
+                for values in self._column_data
+            ]
+            return {"columns": self.columns, "data": [list(r) for r in zip(*columns)]}
         return {"columns": self.columns, "data": self.data[:max_rows]}
 
     def bind_to_run(self, *args, **kwargs):
@@ -547,7 +670,6 @@ class Table(Media):
 
     @classmethod
     def from_json(cls, json_obj, source_artifact):
-        data = []
         column_types = None
         np_deserialized_columns = {}
         timestamp_column_indices = set()
@@ -589,22 +711,24 @@ class Table(Media):
                     ] = deserialized[serialization_path["key"]]
                     ndarray_type._clear_serialization_path()
 
-        for r_ndx, row in enumerate(json_obj["data"]):
-            row_data = []
-            for c_ndx, item in enumerate(row):
-                cell = item
-                if c_ndx in timestamp_column_indices and isinstance(item, (int, float)):
-                    cell = datetime.datetime.fromtimestamp(
-                        item / 1000, tz=datetime.timezone.utc
-                    )
-                elif c_ndx in np_deserialized_columns:
-                    cell = np_deserialized_columns[c_ndx][r_ndx]
-                elif isinstance(item, dict) and "_type" in item:
-                    obj = WBValue.init_from_json(item, source_artifact)
-                    if obj is not None:
-                        cell = obj
-                row_data.append(cell)
-            data.append(row_data)
+        binary_columns = cls._read_binary_columns(json_obj, source_artifact)
+
+        column_values = []
+        for c_ndx in range(len(json_obj["columns"])):
+            if c_ndx in binary_columns:
+                column_values.append(binary_columns[c_ndx])
+                continue
+            if c_ndx in np_deserialized_columns:
+                column_values.append(np_deserialized_columns[c_ndx])
+                continue
+            column_values.append(
+                cls._column_from_json_rows(
+                    json_obj["data"],
+                    c_ndx,
+                    c_ndx in timestamp_column_indices,
+                    source_artifact,
+                )
+            )
 
         # construct Table with dtypes for each column if type information exists
         dtypes = None
@@ -613,7 +737,10 @@ class Table(Media):
                 column_types.params["type_map"][str(col)] for col in json_obj["columns"]
             ]
 
-        new_obj = cls(columns=json_obj["columns"], data=data, dtype=dtypes)
+        new_obj = cls(columns=json_obj["columns"], dtype=dtypes)
+        if not new_obj._init_from_columns(column_values):
+            for row in zip(*column_values):
+                new_obj.add_data(*row)
 
         if column_types is not None:
             new_obj._column_types = column_types
@@ -621,6 +748,105 @@ class Table(Media):
         new_obj._update_keys()
         return new_obj
 
+    @staticmethod
+    def _column_from_json_rows(rows, c_ndx, is_timestamp, source_artifact):
+        column = []
+        for row in rows:
+            cell = item = row[c_ndx]
+            if is_timestamp and isinstance(item, (int, float)):
+                cell = datetime.datetime.fromtimestamp(
+                    item / 1000, tz=datetime.timezone.utc
+                )
+            elif isinstance(item, dict) and "_type" in item:
+                obj = WBValue.init_from_json(item, source_artifact)
+                if obj is not None:
+                    cell = obj
+            column.append(cell)
+        return column
+
+    @staticmethod
+    def _read_binary_columns(json_obj, source_artifact):
+        """Read the columns stored in the table's Arrow file, keyed by column index.
+
+        The file is memory-mapped, so numeric columns without nulls are not
+        copied. Columns with nulls are read as lists so the nulls stay None, as
+        in the JSON rows. If pyarrow is not installed the columns are read from
+        the JSON rows instead, when the table was written with them.
+        """
+        binary_table = json_obj.get("binary_table")
+        if binary_table is None:
+            return {}
+        pa = util.get_module(
+            "pyarrow",
+            required=None
+            if binary_table["inline"]
+            else "Reading this table requires the pyarrow library",
+        )
+        if pa is None:
+            return {}
+
+        path = source_artifact.get_path(binary_table["path"]).download()
+        # the arrays keep the memory map open for as long as they are in use
+        reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        arrow_table = reader.read_all()
+        return {
+            json_obj["columns"].index(col_name): column.to_pylist()
+            if column.null_count
+            else column.to_numpy(zero_copy_only=False)
+            for col_name, column in zip(binary_table["columns"], arrow_table.columns)
+        }
+
+    def _write_binary_columns(self, artifact, skip_col_ndxs):
+        """Write the number, boolean and string columns to an Arrow file.
+
+        Returns the json describing the file and the indexes of the columns
+        it holds, or `(None, set())` if nothing was written.
+        """
+        binary_format = env.get_table_binary_format()
+        if binary_format not in ("arrow", "arrow_only"):
+            return None, set()
+        pa = util.get_module("pyarrow")
+        if pa is None:
+            return None, set()
+
+        arrays = []
+        col_ndxs = []
+        for col_ndx, col_name in enumerate(self.columns):
+            col_type = self._column_types.params["type_map"][col_name]
+            if col_ndx in skip_col_ndxs or not _is_binary_column_type(col_type):
+                continue
+            values = self._column_values(col_ndx)[: Table.MAX_ARTIFACT_ROWS]
+            try:
+                # from_pandas stores NaN as null, as the JSON rows do
+                arrays.append(pa.array(values, from_pandas=True))
+            except (pa.ArrowException, TypeError, ValueError):
+                # e.g. a number column mixing ints too large for int64 and floats
+                continue
+            col_ndxs.append(col_ndx)
+        if not arrays:
+            return None, set()
+
+        file_name = f"{runid.generate_id()}.table.arrow"
+        arrow_file_name = os.path.join(MEDIA_TMP.name, file_name)
+        batch = pa.RecordBatch.from_arrays(
+            arrays, names=[str(self.columns[ndx]) for ndx in col_ndxs]
+        )
+        # written uncompressed so the file can be memory-mapped when read
+        with pa.OSFile(arrow_file_name, "wb") as sink:
+            with pa.ipc.new_file(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+        entry = artifact.add_file(
+            arrow_file_name, "media/serialized_data/" + file_name, is_tmp=True
+        )
+        binary_table = {
+            "format": "arrow",
+            "path": entry.path,
+            "columns": [self.columns[ndx] for ndx in col_ndxs],
+            # whether the JSON rows also hold the values of these columns
+            "inline": binary_format == "arrow",
+        }
+        return binary_table, set(col_ndxs)
+
     def to_json(self, run_or_artifact):
         json_dict = super().to_json(run_or_artifact)
 
@@ -629,7 +855,7 @@ class Table(Media):
                 {
                     "_type": "table-file",
                     "ncols": len(self.columns),
-                    "nrows": len(self.data),
+                    "nrows": self._num_rows(),
                 }
             )
 
@@ -639,6 +865,14 @@ class Table(Media):
             data = self._to_table_json(Table.MAX_ARTIFACT_ROWS)["data"]
 
             ndarray_col_ndxs = set()
+            # numeric columns come out of _to_table_json as python numbers
+            native_col_ndxs = set()
+            if self._column_data is not None:
+                native_col_ndxs = {
+                    col_ndx
+                    for col_ndx, values in enumerate(self._column_data)
+                    if _is_native_column(values)
+                }
             for col_ndx, col_name in enumerate(self.columns):
                 col_type = self._column_types.params["type_map"][col_name]
                 ndarray_type = None
@@ -682,11 +916,20 @@ class Table(Media):
                     ndarray_type._set_serialization_path(entry.path, str(col_name))
                     ndarray_col_ndxs.add(col_ndx)
 
+            binary_table, binary_col_ndxs = self._write_binary_columns(
+                artifact, ndarray_col_ndxs
+            )
+            if binary_table is None or binary_table["inline"]:
+                binary_col_ndxs = set()
+
             for row in data:
                 mapped_row = []
                 for ndx, v in enumerate(row):
-                    if ndx in ndarray_col_ndxs:
+                    if ndx in ndarray_col_ndxs or ndx in binary_col_ndxs:
                         mapped_row.append(None)
+                    elif ndx in native_col_ndxs:
+                        # NaN is stored as None, as json_friendly does
+                        mapped_row.append(v if v == v else None)
                     else:
                         mapped_row.append(_json_helper(v, artifact))
                 mapped_data.append(mapped_row)
@@ -701,6 +944,8 @@ class Table(Media):
                     "column_types": self._column_types.to_json(artifact),
                 }
             )
+            if binary_table is not None:
+                json_dict["binary_table"] = binary_table
         else:
             raise ValueError("to_json accepts wandb_run.Run or wandb_artifact.Artifact")
 
@@ -717,6 +962,13 @@ class Table(Media):
         row : List[any]
             The data of the row.
         """
+        if self._column_data is not None:
+            # build the rows one at a time rather than materializing them all
+            for ndx, row in enumerate(zip(*self._column_data)):
+                index = _TableIndex(ndx)
+                index.set_table(self)
+                yield index, list(row)
+            return
         for ndx in range(len(self.data)):
             index = _TableIndex(ndx)
             index.set_table(self)
@@ -885,9 +1137,10 @@ class Table(Media):
                 "numpy", required="Converting to numpy requires installing numpy"
             )
         col = []
-        col_ndx = self.columns.index(name)
-        for row in self.data:
-            item = row[col_ndx]
+        values = self._column_values(self.columns.index(name))
+        if _is_native_column(values):
+            return values.copy() if convert_to == "numpy" else list(values)
+        for item in values:
             if convert_to is not None and isinstance(item, WBValue):
                 item = item.to_data_array()
             col.append(item)
@@ -898,7 +1151,7 @@ class Table(Media):
     def get_index(self):
         """Return an array of row indexes for use in other tables to create links."""
         ndxs = []
-        for ndx in range(len(self.data)):
+        for ndx in range(self._num_rows()):
             index = _TableIndex(ndx)
             index.set_table(self)
             ndxs.append(index)
@@ -910,11 +1163,15 @@ class Table(Media):
             "pandas",
             required="Converting to pandas.DataFrame requires installing pandas",
         )
+        if self._column_data is not None:
+            df = pd.DataFrame(dict(enumerate(self._column_data)))
+            df.columns = self.columns
+            return df
         return pd.DataFrame.from_records(self.data, columns=self.columns)
 
     def index_ref(self, index):
         """Get a reference to a particular row index in the table."""
-        assert index < len(self.data)
+        assert index < self._num_rows()
         _index = _TableIndex(index)
         _index.set_table(self)
         return _index
@@ -4,9 +4,10 @@ import json
 import logging
 import os
 import platform
-from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Union
 
-import dockerpycreds  # type: ignore
+if TYPE_CHECKING:
+    import dockerpycreds  # type: ignore
 
 IS_WINDOWS_PLATFORM = platform.system() == "Windows"
 DOCKER_CONFIG_FILENAME = os.path.join(".docker", "config.json")
@@ -309,6 +310,9 @@ class AuthConfig(dict):
     def _resolve_authconfig_credstore(
         self, registry: Optional[str], credstore_name: str
     ) -> Optional[Dict[str, Any]]:
+        # dockerpycreds pulls in distutils, only import it when it's needed
+        import dockerpycreds  # type: ignore
+
         if not registry or registry == INDEX_NAME:
             # The ecosystem is a little schizophrenic with recker.io VS
             # docker.io - in that case, it seems the full URL is necessary.
@@ -332,6 +336,8 @@ class AuthConfig(dict):
             raise DockerError(f"Credentials store error: {repr(e)}")
 
     def _get_store_instance(self, name: str) -> "dockerpycreds.Store":
+        import dockerpycreds  # type: ignore
+
         if name not in self._stores:
             self._stores[name] = dockerpycreds.Store(
                 name, environment=self._credstore_env
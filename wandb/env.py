@@ -13,7 +13,6 @@ these values in many cases.
 import json
 import os
 import sys
-from distutils.util import strtobool
 from typing import List, MutableMapping, Optional, Union
 
 import appdirs
@@ -73,6 +72,11 @@ CONFIG_DIR = "WANDB_CONFIG_DIR"
 DATA_DIR = "WANDB_DATA_DIR"
 ARTIFACT_DIR = "WANDB_ARTIFACT_DIR"
 CACHE_DIR = "WANDB_CACHE_DIR"
+CACHE_MAX_SIZE = "WANDB_CACHE_MAX_SIZE"
+ARTIFACT_DOWNLOAD_CONCURRENCY = "WANDB_ARTIFACT_DOWNLOAD_CONCURRENCY"
+MEDIA_ENCODING_THREADS = "WANDB_MEDIA_ENCODING_THREADS"
+MEDIA_ENCODING_MAX_BYTES = "WANDB_MEDIA_ENCODING_MAX_BYTES"
+TABLE_BINARY_FORMAT = "WANDB_TABLE_BINARY_FORMAT"
 DISABLE_SSL = "WANDB_INSECURE_DISABLE_SSL"
 SERVICE = "WANDB_SERVICE"
 _DISABLE_SERVICE = "WANDB_DISABLE_SERVICE"
@@ -119,11 +123,29 @@ def immutable_keys() -> List[str]:
         DATA_DIR,
         ARTIFACT_DIR,
         CACHE_DIR,
+        CACHE_MAX_SIZE,
+        ARTIFACT_DOWNLOAD_CONCURRENCY,
+        MEDIA_ENCODING_THREADS,
+        MEDIA_ENCODING_MAX_BYTES,
+        TABLE_BINARY_FORMAT,
         USE_V1_ARTIFACTS,
         DISABLE_SSL,
     ]
 
 
+def strtobool(val: str) -> int:
+    """Convert a string representation of truth to 1 or 0.
+
+    Same as `distutils.util.strtobool`, which is deprecated and slow to import.
+    """
+    val = val.lower()
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return 1
+    if val in ("n", "no", "f", "false", "off", "0"):
+        return 0
+    raise ValueError(f"invalid truth value {val!r}")
+
+
 def _env_as_bool(
     var: str, default: Optional[str] = None, env: Optional[Env] = None
 ) -> bool:
@@ -373,6 +395,43 @@ def get_cache_dir(env: Optional[Env] = None) -> str:
     return val
 
 
+def get_cache_max_size(env: Optional[Env] = None) -> Optional[str]:
+    if env is None:
+        env = os.environ
+    return env.get(CACHE_MAX_SIZE)
+
+
+def get_artifact_download_concurrency(
+    default: int = 32, env: Optional[Env] = None
+) -> int:
+    if env is None:
+        env = os.environ
+    return max(1, int(env.get(ARTIFACT_DOWNLOAD_CONCURRENCY, default)))
+
+
+def get_media_encoding_threads(default: int = 0, env: Optional[Env] = None) -> int:
+    if env is None:
+        env = os.environ
+    return max(0, int(env.get(MEDIA_ENCODING_THREADS, default)))
+
+
+def get_media_encoding_max_bytes(env: Optional[Env] = None) -> Optional[str]:
+    if env is None:
+        env = os.environ
+    return env.get(MEDIA_ENCODING_MAX_BYTES)
+
+
+def get_table_binary_format(env: Optional[Env] = None) -> Optional[str]:
+    """Return the binary format Tables in artifacts are also written in.
+
+    `arrow` writes the columns of numbers, booleans and strings to an Arrow file
+    alongside the JSON rows, `arrow_only` leaves them out of the JSON rows.
+    """
+    if env is None:
+        env = os.environ
+    return env.get(TABLE_BINARY_FORMAT)
+
+
 def get_use_v1_artifacts(env: Optional[Env] = None) -> bool:
     if env is None:
         env = os.environ
@@ -3,12 +3,22 @@ import fnmatch
 import glob
 import logging
 import os
+import platform
 import queue
 import time
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, MutableSet, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+    Optional,
+)
 
 from wandb import util
 from wandb.sdk.interface.interface import GlobStr
+from wandb.sdk.lib.filenames import OUTPUT_FNAME
 from wandb.sdk.lib.paths import LogicalPath
 
 if TYPE_CHECKING:
@@ -24,6 +34,10 @@ else:
 
 PathStr = str  # TODO(spencerpearson): would be nice to use Path here
 
+# The SDK reports every media file it writes through `update_policy`, so the
+# observer doesn't need to watch this directory.
+MEDIA_DIR = "media"
+
 
 logger = logging.getLogger(__name__)
 
@@ -203,13 +217,39 @@ class DirWatcher:
         }
         self._file_pusher = file_pusher
         self._file_event_handlers: MutableMapping[LogicalPath, FileEventHandler] = {}
-        self._file_observer = wd_polling.PollingObserver()
-        self._file_observer.schedule(
-            self._per_file_event_handler(), self._dir, recursive=True
-        )
-        self._file_observer.start()
+        self._pushed_media: MutableSet[LogicalPath] = set()
+        self._polling = False
+        self._file_observer = self._start_observer()
         logger.info("watching files in: %s", settings.files_dir)
 
+    def _start_observer(self) -> "wd_api.BaseObserver":
+        event_handler = self._per_file_event_handler()
+        if platform.system() == "Linux" and not self._settings._disable_inotify:
+            try:
+                wd_inotify = util.vendor_import("wandb_watchdog.observers.inotify")
+                observer = wd_inotify.InotifyObserver()
+                observer.schedule(event_handler, self._dir, recursive=True)
+                observer.start()
+                return observer
+            except Exception as e:
+                # e.g. the per-user limit of inotify instances or watches is reached
+                logger.warning("inotify unavailable, polling for changes: %s", e)
+
+        self._polling = True
+        observer = wd_polling.PollingObserverVFS(
+            stat=os.stat, listdir=self._listdir, polling_interval=1
+        )
+        observer.schedule(event_handler, self._dir, recursive=True)
+        observer.start()
+        return observer
+
+    def _listdir(self, path: PathStr) -> List[str]:
+        names = os.listdir(path)
+        # keep the media files, which can number in the 100ks, out of the scan
+        if path == self._dir and MEDIA_DIR in names:
+            names.remove(MEDIA_DIR)
+        return names
+
     @property
     def emitter(self) -> Optional["wd_api.EventEmitter"]:
         try:
@@ -235,6 +275,8 @@ class DirWatcher:
             self._user_file_policies[policy].add(path)
         for src_path in glob.glob(os.path.join(self._dir, path)):
             save_name = LogicalPath(os.path.relpath(src_path, self._dir))
+            if save_name.startswith("media/"):
+                self._pushed_media.add(save_name)
             feh = self._get_file_event_handler(src_path, save_name)
             # handle the case where the policy changed
             if feh.policy != policy:
@@ -259,6 +301,9 @@ class DirWatcher:
             "*.tmp",
             "*.wandb",
             "wandb-summary.json",
+            os.path.join(self._dir, MEDIA_DIR, "*"),
+            # appended to on every console line, the final scan uploads it
+            os.path.join(self._dir, OUTPUT_FNAME),
             os.path.join(self._dir, ".*"),
             os.path.join(self._dir, "*/.*"),
         ]
@@ -274,7 +319,7 @@ class DirWatcher:
             return None
         self._file_count += 1
         # We do the directory scan less often as it grows
-        if self._file_count % 100 == 0:
+        if self._polling and self._file_count % 100 == 0:
             emitter = self.emitter
             if emitter:
                 emitter._timeout = int(self._file_count / 100) + 1
@@ -367,7 +412,8 @@ class DirWatcher:
                 self._file_observer._timeout = 0
                 self._file_observer._stopped_event.set()
                 self._file_observer.join()
-                self.emitter.queue_events(0)  # type: ignore[union-attr]
+                if self._polling:
+                    self.emitter.queue_events(0)  # type: ignore[union-attr]
                 while True:
                     try:
                         self._file_observer.dispatch_events(
@@ -400,5 +446,13 @@ class DirWatcher:
                         break
                 if ignored:
                     continue
+                if save_name.startswith("media/"):
+                    # media the SDK didn't report, e.g. written to run.dir by hand
+                    if save_name not in self._pushed_media:
+                        logger.info("scan save: %s %s", file_path, save_name)
+                        self._get_file_event_handler(file_path, save_name).on_modified(
+                            force=True
+                        )
+                    continue
                 logger.info("scan save: %s %s", file_path, save_name)
                 self._get_file_event_handler(file_path, save_name).finish()
@@ -1,5 +1,6 @@
 import io
 import re
+import struct
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
@@ -51,6 +52,28 @@ def make_ndarray(tensor: Any) -> Optional["np.ndarray"]:
         return None
 
 
+# tensorflow DataType enum values of the scalar tensors decoded without numpy
+_DT_FLOAT = 1
+_DT_DOUBLE = 2
+
+
+def _make_scalar(tensor: Any) -> Optional[float]:
+    """Decode a rank 0 float tensor, returning None for anything else."""
+    if tensor.tensor_shape.dim:
+        return None
+    if tensor.dtype == _DT_FLOAT:
+        if len(tensor.float_val) == 1:
+            return tensor.float_val[0]
+        if len(tensor.tensor_content) == 4:
+            return struct.unpack("=f", tensor.tensor_content)[0]
+    elif tensor.dtype == _DT_DOUBLE:
+        if len(tensor.double_val) == 1:
+            return tensor.double_val[0]
+        if len(tensor.tensor_content) == 8:
+            return struct.unpack("=d", tensor.tensor_content)[0]
+    return None
+
+
 def namespaced_tag(tag: str, namespace: str = "") -> str:
     if not namespace:
         return tag
@@ -141,8 +164,9 @@ def tf_summary_to_dict(  # noqa: C901
         elif kind == "tensor":
             plugin_name = value.metadata.plugin_data.plugin_name
             if plugin_name == "scalars" or plugin_name == "":
-                values[namespaced_tag(value.tag, namespace)] = make_ndarray(
-                    value.tensor
+                scalar = _make_scalar(value.tensor)
+                values[namespaced_tag(value.tag, namespace)] = (
+                    make_ndarray(value.tensor) if scalar is None else scalar
                 )
             elif plugin_name == "images":
                 img_strs = value.tensor.string_val[2:]  # First two items are dims.
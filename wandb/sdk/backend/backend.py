@@ -159,6 +159,8 @@ class Backend:
 
             svc_iface_sock = cast("ServiceSockInterface", svc_iface)
             sock_client = svc_iface_sock._get_sock_client()
+            if self._settings and self._settings._service_coalesce_seconds:
+                sock_client.enable_coalescing(self._settings._service_coalesce_seconds)
             sock_interface = InterfaceSock(sock_client, mailbox=self._mailbox)
             self.interface = sock_interface
         elif svc_transport == "grpc":
@@ -0,0 +1,72 @@
+"""Bounded thread pool that encodes media off the caller's thread.
+
+Enabled by setting `WANDB_MEDIA_ENCODING_THREADS` to the number of worker
+threads. The raw bytes waiting to be encoded are capped by
+`WANDB_MEDIA_ENCODING_MAX_BYTES` (e.g. `512MB`): once the cap is reached,
+`submit` blocks until enough of the pending work has finished.
+"""
+
+import os
+import threading
+from concurrent import futures
+from typing import Any, Callable, Optional
+
+from wandb import env, util
+
+DEFAULT_MAX_PENDING_BYTES = 512 * 1024 * 1024
+
+
+class MediaEncoder:
+    def __init__(self, max_workers: int, max_pending_bytes: int) -> None:
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="wandb-media-encode"
+        )
+        self._max_pending_bytes = max_pending_bytes
+        self._pending_bytes = 0
+        self._cond = threading.Condition()
+
+    def submit(
+        self, nbytes: int, fn: Callable, *args: Any, **kwargs: Any
+    ) -> futures.Future:
+        with self._cond:
+            # a single item larger than the cap is still let through on its own
+            while (
+                self._pending_bytes > 0
+                and self._pending_bytes + nbytes > self._max_pending_bytes
+            ):
+                self._cond.wait()
+            self._pending_bytes += nbytes
+
+        def release(_: futures.Future) -> None:
+            with self._cond:
+                self._pending_bytes -= nbytes
+                self._cond.notify_all()
+
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(release)
+        return future
+
+
+_encoder: Optional[MediaEncoder] = None
+_encoder_pid: Optional[int] = None
+_encoder_lock = threading.Lock()
+
+
+def get_media_encoder() -> Optional[MediaEncoder]:
+    """Return the process-wide media encoder, or None if encoding is synchronous."""
+    global _encoder, _encoder_pid
+    max_workers = env.get_media_encoding_threads()
+    if not max_workers:
+        return None
+    with _encoder_lock:
+        # A forked child inherits the encoder object but not its threads.
+        if _encoder is None or _encoder_pid != os.getpid():
+            max_bytes = env.get_media_encoding_max_bytes()
+            _encoder = MediaEncoder(
+                max_workers,
+                util.from_human_size(max_bytes)
+                if max_bytes
+                else DEFAULT_MAX_PENDING_BYTES,
+            )
+            _encoder_pid = os.getpid()
+        return _encoder
@@ -54,7 +54,11 @@ class Media(WBValue):
         self._caption = caption
 
     def _set_file(
-        self, path: str, is_tmp: bool = False, extension: Optional[str] = None
+        self,
+        path: str,
+        is_tmp: bool = False,
+        extension: Optional[str] = None,
+        sha256: Optional[str] = None,
     ) -> None:
         self._path = path
         self._is_tmp = is_tmp
@@ -65,8 +69,11 @@ class Media(WBValue):
             extension, path
         )
 
-        with open(self._path, "rb") as f:
-            self._sha256 = hashlib.sha256(f.read()).hexdigest()
+        if sha256 is None:
+            # the caller didn't hash the contents while writing them
+            with open(self._path, "rb") as f:
+                sha256 = hashlib.sha256(f.read()).hexdigest()
+        self._sha256 = sha256
         self._size = os.path.getsize(self._path)
 
     @classmethod
@@ -1,8 +1,20 @@
 import hashlib
 import logging
 import os
+from concurrent import futures
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from urllib import parse
 
 import wandb
@@ -10,6 +22,7 @@ from wandb import util
 from wandb.sdk.lib import hashutil, runid
 from wandb.sdk.lib.paths import LogicalPath
 
+from ._media_encoder import get_media_encoder
 from ._private import MEDIA_TMP
 from .base_types.media import BatchableMedia, Media
 from .helper_types.bounding_boxes_2d import BoundingBoxes2D
@@ -34,6 +47,30 @@ if TYPE_CHECKING:  # pragma: no cover
     TorchTensorType = Union["torch.Tensor", "torch.Variable"]
 
 
+# file types Image can encode to, and the name PIL knows the format by
+_PIL_FORMATS = {
+    "png": "PNG",
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "webp": "WEBP",
+    "bmp": "BMP",
+    "gif": "GIF",
+}
+
+
+def _encode_image(image: "PILImage", file_type: str, path: str, **params: Any) -> str:
+    """Save `image` to `path`, returning the sha256 of the file."""
+    pil_format = _PIL_FORMATS[file_type]
+    if pil_format == "JPEG" and image.mode not in ("L", "RGB", "CMYK"):
+        image = image.convert("RGB")
+    buf = BytesIO()
+    image.save(buf, format=pil_format, **params)
+    contents = buf.getvalue()
+    with open(path, "wb") as f:
+        f.write(contents)
+    return hashlib.sha256(contents).hexdigest()
+
+
 def _server_accepts_image_filenames() -> bool:
     if util._is_offline():
         return True
@@ -72,6 +109,17 @@ class Image(BatchableMedia):
         mode: (string) The PIL mode for an image. Most common are "L", "RGB",
             "RGBA". Full explanation at https://pillow.readthedocs.io/en/4.2.x/handbook/concepts.html#concept-modes.
         caption: (string) Label for display of image.
+        file_type: (string) Format to encode array, tensor and PIL image data to:
+            "png" (default), "jpg", "jpeg", "webp", "bmp" or "gif".
+        compress_level: (int) PNG compression level, from 0 (fastest) to 9.
+        quality: (int) JPEG and WebP quality, from 1 to 100.
+
+    Encoding happens on the calling thread unless `WANDB_MEDIA_ENCODING_THREADS`
+    is set, in which case it runs on a pool of that many threads while the caller
+    carries on, e.g. building the other images of a batch. Logging the image,
+    adding it to an artifact, pickling or copying it waits for its encoding to
+    finish. Creating an image blocks while `WANDB_MEDIA_ENCODING_MAX_BYTES` of
+    images are still waiting to be encoded.
 
     Note : When logging a `torch.Tensor` as a `wandb.Image`, images are normalized. If you do not want to normalize your images, please convert your tensors to a PIL Image.
 
@@ -125,6 +173,8 @@ class Image(BatchableMedia):
     _classes: Optional["Classes"]
     _boxes: Optional[Dict[str, "BoundingBoxes2D"]]
     _masks: Optional[Dict[str, "ImageMask"]]
+    _encoding: Optional["futures.Future[str]"]
+    _encoding_path: Optional[str]
 
     def __init__(
         self,
@@ -135,6 +185,9 @@ class Image(BatchableMedia):
         classes: Optional[Union["Classes", Sequence[dict]]] = None,
         boxes: Optional[Union[Dict[str, "BoundingBoxes2D"], Dict[str, dict]]] = None,
         masks: Optional[Union[Dict[str, "ImageMask"], Dict[str, dict]]] = None,
+        file_type: Optional[str] = None,
+        compress_level: Optional[int] = None,
+        quality: Optional[int] = None,
     ) -> None:
         super().__init__()
         # TODO: We should remove grouping, it's a terrible name and I don't
@@ -148,6 +201,8 @@ class Image(BatchableMedia):
         self._classes = None
         self._boxes = None
         self._masks = None
+        self._encoding = None
+        self._encoding_path = None
 
         # Allows the user to pass an Image object as the first parameter and have a perfect copy,
         # only overriding additional metdata passed in. If this pattern is compelling, we can generalize.
@@ -159,7 +214,9 @@ class Image(BatchableMedia):
             else:
                 self._initialize_from_path(data_or_path)
         else:
-            self._initialize_from_data(data_or_path, mode)
+            self._initialize_from_data(
+                data_or_path, mode, file_type, compress_level, quality
+            )
 
         self._set_initialization_meta(grouping, caption, classes, boxes, masks)
 
@@ -228,6 +285,7 @@ class Image(BatchableMedia):
         self._free_ram()
 
     def _initialize_from_wbimage(self, wbimage: "Image") -> None:
+        wbimage._resolve_encoding()
         self._grouping = wbimage._grouping
         self._caption = wbimage._caption
         self._width = wbimage._width
@@ -271,17 +329,22 @@ class Image(BatchableMedia):
         self,
         data: "ImageDataType",
         mode: Optional[str] = None,
+        file_type: Optional[str] = None,
+        compress_level: Optional[int] = None,
+        quality: Optional[int] = None,
     ) -> None:
         pil_image = util.get_module(
             "PIL.Image",
             required='wandb.Image needs the PIL package. To get it, run "pip install pillow".',
         )
+        image_is_shared = False
         if util.is_matplotlib_typename(util.get_full_typename(data)):
             buf = BytesIO()
             util.ensure_matplotlib_figure(data).savefig(buf)
             self._image = pil_image.open(buf)
         elif isinstance(data, pil_image.Image):
             self._image = data
+            image_is_shared = True
         elif util.is_pytorch_tensor_typename(util.get_full_typename(data)):
             vis_util = util.get_module(
                 "torchvision.utils", "torchvision is required to render images"
@@ -301,11 +364,62 @@ class Image(BatchableMedia):
                 self.to_uint8(data), mode=mode or self.guess_mode(data)
             )
 
-        tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + ".png")
-        self.format = "png"
+        file_type = (file_type or "png").lower()
+        if file_type not in _PIL_FORMATS:
+            raise ValueError(
+                "file_type must be one of {}, not {!r}".format(
+                    ", ".join(_PIL_FORMATS), file_type
+                )
+            )
+        params: Dict[str, Any] = {}
+        if file_type == "png":
+            params["transparency"] = None
+            if compress_level is not None:
+                params["compress_level"] = compress_level
+        elif quality is not None:
+            params["quality"] = quality
+
+        tmp_path = os.path.join(MEDIA_TMP.name, runid.generate_id() + "." + file_type)
+        self.format = file_type
         assert self._image is not None
-        self._image.save(tmp_path, transparency=None)
-        self._set_file(tmp_path, is_tmp=True)
+
+        encoder = get_media_encoder()
+        if encoder is None:
+            sha256 = _encode_image(self._image, file_type, tmp_path, **params)
+            self._set_file(tmp_path, is_tmp=True, sha256=sha256)
+            return
+
+        if image_is_shared:
+            # the caller still owns it and may change it while we're encoding
+            self._image = self._image.copy()
+        self._encoding = encoder.submit(
+            self._image.width * self._image.height * len(self._image.getbands()),
+            _encode_image,
+            self._image,
+            file_type,
+            tmp_path,
+            **params,
+        )
+        self._encoding_path = tmp_path
+
+    def _resolve_encoding(self) -> None:
+        """Wait for the image to be encoded on the media encoder, if it still is."""
+        if self._encoding is None:
+            return
+        sha256 = self._encoding.result()
+        self._encoding = None
+        assert self._encoding_path is not None
+        self._set_file(self._encoding_path, is_tmp=True, sha256=sha256)
+        self._free_ram()
+
+    def file_is_set(self) -> bool:
+        self._resolve_encoding()
+        return super().file_is_set()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the pending encoding holds locks, which can't be pickled or copied
+        self._resolve_encoding()
+        return self.__dict__.copy()
 
     @classmethod
     def from_json(
@@ -362,6 +476,7 @@ class Image(BatchableMedia):
         # space, but there are also custom charts, and maybe others. Let's
         # commit to getting all that fixed up before moving this to  the top
         # level Media class.
+        self._resolve_encoding()
         if self.path_is_reference(self._path):
             raise ValueError(
                 "Image media created by a reference to external storage cannot currently be added to a run"
@@ -387,6 +502,7 @@ class Image(BatchableMedia):
                 )
 
     def to_json(self, run_or_artifact: Union["LocalRun", "LocalArtifact"]) -> dict:
+        self._resolve_encoding()
         json_dict = super().to_json(run_or_artifact)
         json_dict["_type"] = Image._log_type
         json_dict["format"] = self.format
@@ -503,11 +619,11 @@ class Image(BatchableMedia):
                 )
 
         num_images_to_log = len(seq)
-        width, height = seq[0].image.size  # type: ignore
+        width, height = seq[0]._image_size()
         format = jsons[0]["format"]
 
         def size_equals_image(image: "Image") -> bool:
-            img_width, img_height = image.image.size  # type: ignore
+            img_width, img_height = image._image_size()
             return img_width == width and img_height == height
 
         sizes_match = all(size_equals_image(img) for img in seq)
@@ -643,6 +759,12 @@ class Image(BatchableMedia):
         if self._path is not None:
             self._image = None
 
+    def _image_size(self) -> Tuple[int, int]:
+        # the size is recorded at init, so there is no need to decode the file again
+        if self._width is not None and self._height is not None:
+            return self._width, self._height
+        return self.image.size  # type: ignore
+
     @property
     def image(self) -> Optional["PILImage"]:
         if self._image is None:
@@ -6,6 +6,7 @@ from wandb.sdk.interface.artifacts.artifact import (
 )
 from wandb.sdk.interface.artifacts.artifact_cache import (
     ArtifactsCache,
+    FileDigestCache,
     get_artifacts_cache,
 )
 from wandb.sdk.interface.artifacts.artifact_manifest import (
@@ -26,6 +27,7 @@ __all__ = [
     "ArtifactNotLoggedError",
     "ArtifactsCache",
     "ArtifactStatusError",
+    "FileDigestCache",
     "get_artifacts_cache",
     "StorageHandler",
     "StorageLayout",
@@ -1,8 +1,21 @@
 import contextlib
 import hashlib
+import logging
 import os
 import secrets
-from typing import IO, TYPE_CHECKING, ContextManager, Dict, Generator, Optional, Tuple
+import threading
+import time
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from wandb import env, util
 from wandb.sdk.interface.artifacts import Artifact, ArtifactNotLoggedError
@@ -11,6 +24,7 @@ from wandb.sdk.lib.hashutil import B64MD5, ETag, b64_to_hex_id
 from wandb.sdk.lib.paths import FilePathStr, StrPath, URIStr
 
 if TYPE_CHECKING:
+    import sqlite3
     import sys
 
     from wandb.sdk import wandb_artifacts
@@ -25,16 +39,39 @@ if TYPE_CHECKING:
             pass
 
 
+logger = logging.getLogger(__name__)
+
+
 class ArtifactsCache:
     _TMP_PREFIX = "tmp"
+    _DIGESTS_DB = "digests.db"
+    _INDEX_DB = "index.db"
+
+    # When the cache grows past its max size, evict down to this fraction of it
+    # so that eviction runs in batches rather than after every write.
+    _EVICT_TO_FRACTION = 0.9
 
-    def __init__(self, cache_dir: StrPath) -> None:
+    def __init__(self, cache_dir: StrPath, max_size: Optional[int] = None) -> None:
         self._cache_dir = cache_dir
         mkdir_exists_ok(self._cache_dir)
         self._md5_obj_dir = os.path.join(self._cache_dir, "obj", "md5")
         self._etag_obj_dir = os.path.join(self._cache_dir, "obj", "etag")
         self._artifacts_by_id: Dict[str, Artifact] = {}
         self._artifacts_by_client_id: Dict[str, "wandb_artifacts.Artifact"] = {}
+        self._file_digests: Optional[FileDigestCache] = None
+        self._max_size = max_size
+        self._index = _CacheIndex(
+            os.path.join(self._cache_dir, self._INDEX_DB),
+            os.path.join(self._cache_dir, "obj"),
+        )
+
+    @property
+    def file_digests(self) -> "FileDigestCache":
+        if self._file_digests is None:
+            self._file_digests = FileDigestCache(
+                os.path.join(self._cache_dir, self._DIGESTS_DB)
+            )
+        return self._file_digests
 
     def check_md5_obj_path(
         self, b64_md5: B64MD5, size: int
@@ -43,6 +80,7 @@ class ArtifactsCache:
         path = os.path.join(self._cache_dir, "obj", "md5", hex_md5[:2], hex_md5[2:])
         opener = self._cache_opener(path)
         if os.path.isfile(path) and os.path.getsize(path) == size:
+            self._index.touch(path, size)
             return FilePathStr(path), True, opener
         mkdir_exists_ok(os.path.dirname(path))
         return FilePathStr(path), False, opener
@@ -62,6 +100,7 @@ class ArtifactsCache:
         path = os.path.join(self._cache_dir, "obj", "etag", hexhash[:2], hexhash[2:])
         opener = self._cache_opener(path)
         if os.path.isfile(path) and os.path.getsize(path) == size:
+            self._index.touch(path, size)
             return FilePathStr(path), True, opener
         mkdir_exists_ok(os.path.dirname(path))
         return FilePathStr(path), False, opener
@@ -83,6 +122,18 @@ class ArtifactsCache:
         self._artifacts_by_client_id[artifact._client_id] = artifact
 
     def cleanup(self, target_size: int) -> int:
+        """Evict least recently used objects until the cache fits `target_size`.
+
+        Leftover temporary files from interrupted writes are always removed.
+        Returns the number of bytes reclaimed.
+        """
+        reclaimed = self._index.cleanup(target_size)
+        if reclaimed is None:
+            return self._cleanup_walk(target_size)
+        return reclaimed
+
+    def _cleanup_walk(self, target_size: int) -> int:
+        # Used only when the index is unavailable.
         bytes_reclaimed = 0
         paths = {}
         total_size = 0
@@ -92,6 +143,8 @@ class ArtifactsCache:
                     path = os.path.join(root, file)
                     stat = os.stat(path)
 
+                    if file.startswith((self._DIGESTS_DB, self._INDEX_DB)):
+                        continue
                     if file.startswith(ArtifactsCache._TMP_PREFIX):
                         os.remove(path)
                         bytes_reclaimed += stat.st_size
@@ -115,6 +168,13 @@ class ArtifactsCache:
             bytes_reclaimed += stat.st_size
         return bytes_reclaimed
 
+    def _maybe_evict(self) -> None:
+        if self._max_size is None:
+            return
+        total_size = self._index.total_size()
+        if total_size is not None and total_size > self._max_size:
+            self._index.evict(int(self._max_size * self._EVICT_TO_FRACTION))
+
     def _cache_opener(self, path: StrPath) -> "Opener":
         @contextlib.contextmanager
         def helper(mode: str = "w") -> Generator[IO, None, None]:
@@ -125,6 +185,7 @@ class ArtifactsCache:
             tmp_file = os.path.join(
                 dirname, f"{ArtifactsCache._TMP_PREFIX}_{secrets.token_hex(8)}"
             )
+            self._index.add_tmp(tmp_file)
             with util.fsync_open(tmp_file, mode=mode) as f:
                 yield f
 
@@ -148,10 +209,365 @@ class ArtifactsCache:
                 os.replace(tmp_file, path)
             except AttributeError:
                 os.rename(tmp_file, path)
+            self._index.add(path, os.path.getsize(path), tmp_file)
+            self._maybe_evict()
 
         return helper
 
 
+class _CacheIndex:
+    """Index of the objects in an `ArtifactsCache` with their size and last access.
+
+    Lets eviction pick the least recently used objects without walking and
+    stat-ing the whole cache, and without relying on filesystem atimes. An
+    existing cache is indexed with a single walk the first time it is used.
+    The index also tracks in-progress temporary files so that ones left behind
+    by interrupted writes can be removed.
+
+    If the database can't be used, or another process holds it for longer than
+    the busy timeout, every method is a no-op and returns None.
+    """
+
+    _EVICT_BATCH_SIZE = 256
+    _BUILD_BATCH_SIZE = 1000
+    _TIMEOUT = 30.0
+
+    def __init__(self, db_path: StrPath, obj_dir: StrPath) -> None:
+        self._db_path = db_path
+        self._obj_dir = obj_dir
+        self._lock = threading.Lock()
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._disabled = False
+        self._pid = os.getpid()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections and locks can't be shared with other processes.
+        return {"_db_path": self._db_path, "_obj_dir": self._obj_dir}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["_db_path"], state["_obj_dir"])  # type: ignore
+
+    def _connect(self) -> Optional["sqlite3.Connection"]:
+        if self._conn is None and not self._disabled:
+            try:
+                import sqlite3
+
+                conn = sqlite3.connect(
+                    os.fspath(self._db_path),
+                    timeout=self._TIMEOUT,
+                    check_same_thread=False,
+                    isolation_level=None,
+                )
+                # The index can always be rebuilt, so don't pay for fsyncs.
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS objects ("
+                    "path TEXT PRIMARY KEY, size INTEGER, last_access REAL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS objects_last_access"
+                    " ON objects (last_access)"
+                )
+                conn.execute("CREATE TABLE IF NOT EXISTS tmp (path TEXT PRIMARY KEY)")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+                )
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'total_size'"
+                ).fetchone()
+                if row is None:
+                    self._build(conn)
+                self._conn = conn
+            except Exception:
+                logger.exception("Failed to open artifacts cache index")
+                self._disabled = True
+        return self._conn
+
+    def _build(self, conn: "sqlite3.Connection") -> None:
+        # The walk can take a long time on a big cache, so rows are committed in
+        # batches rather than holding the write lock for all of it. The total is
+        # summed from the table at the end, which also counts objects other
+        # processes added in the meantime.
+        objects = []
+        tmp_paths = []
+        for root, _, files in os.walk(self._obj_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                if file.startswith(ArtifactsCache._TMP_PREFIX):
+                    tmp_paths.append((path,))
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                objects.append((path, stat.st_size, stat.st_atime))
+                if len(objects) + len(tmp_paths) >= self._BUILD_BATCH_SIZE:
+                    self._insert_built(conn, objects, tmp_paths)
+                    objects, tmp_paths = [], []
+        if objects or tmp_paths:
+            self._insert_built(conn, objects, tmp_paths)
+        with _transaction(conn):
+            conn.execute(
+                "INSERT OR IGNORE INTO meta"
+                " SELECT 'total_size', COALESCE(SUM(size), 0) FROM objects"
+            )
+
+    @staticmethod
+    def _insert_built(
+        conn: "sqlite3.Connection",
+        objects: List[Tuple[str, int, float]],
+        tmp_paths: List[Tuple[str]],
+    ) -> None:
+        with _transaction(conn):
+            # Don't clobber the access time of objects used since the walk.
+            conn.executemany("INSERT OR IGNORE INTO objects VALUES (?, ?, ?)", objects)
+            conn.executemany("INSERT OR IGNORE INTO tmp VALUES (?)", tmp_paths)
+
+    @contextlib.contextmanager
+    def _use(self) -> Generator[Optional["sqlite3.Connection"], None, None]:
+        if self._pid != os.getpid():
+            # A connection inherited from the parent process must not be used.
+            self.__init__(self._db_path, self._obj_dir)  # type: ignore
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                except Exception:
+                    # Most likely another process has held the index for longer
+                    # than the busy timeout: skip maintaining it this time.
+                    logger.warning("Artifacts cache index is busy", exc_info=True)
+                    conn = None
+            if conn is None:
+                yield None
+                return
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                logger.exception("Failed to update artifacts cache index")
+                with contextlib.suppress(Exception):
+                    conn.execute("ROLLBACK")
+
+    def _upsert(self, conn: "sqlite3.Connection", path: StrPath, size: int) -> None:
+        row = conn.execute(
+            "SELECT size FROM objects WHERE path = ?", (os.fspath(path),)
+        ).fetchone()
+        old_size = row[0] if row is not None else 0
+        conn.execute(
+            "INSERT OR REPLACE INTO objects VALUES (?, ?, ?)",
+            (os.fspath(path), size, time.time()),
+        )
+        if size != old_size:
+            conn.execute(
+                "UPDATE meta SET value = value + ? WHERE key = 'total_size'",
+                (size - old_size,),
+            )
+
+    def add_tmp(self, tmp_path: StrPath) -> None:
+        with self._use() as conn:
+            if conn is not None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO tmp VALUES (?)", (os.fspath(tmp_path),)
+                )
+
+    def add(self, path: StrPath, size: int, tmp_path: StrPath) -> None:
+        """Record a newly written object, replacing the temp file it was written to."""
+        with self._use() as conn:
+            if conn is not None:
+                conn.execute("DELETE FROM tmp WHERE path = ?", (os.fspath(tmp_path),))
+                self._upsert(conn, path, size)
+
+    def touch(self, path: StrPath, size: int) -> None:
+        """Mark an object as just used."""
+        with self._use() as conn:
+            if conn is not None:
+                self._upsert(conn, path, size)
+
+    def total_size(self) -> Optional[int]:
+        with self._use() as conn:
+            if conn is None:
+                return None
+            return conn.execute(
+                "SELECT value FROM meta WHERE key = 'total_size'"
+            ).fetchone()[0]
+        return None
+
+    def evict(self, target_size: int) -> Optional[int]:
+        """Remove least recently used objects until at most `target_size` remain.
+
+        Returns the number of bytes reclaimed.
+        """
+        reclaimed = 0
+        while True:
+            batch_size = None
+            with self._use() as conn:
+                if conn is None:
+                    return None
+                batch_size = self._evict_batch(conn, target_size)
+            if not batch_size:
+                return reclaimed
+            reclaimed += batch_size
+
+    def _evict_batch(self, conn: "sqlite3.Connection", target_size: int) -> int:
+        total_size = conn.execute(
+            "SELECT value FROM meta WHERE key = 'total_size'"
+        ).fetchone()[0]
+        rows = conn.execute(
+            "SELECT path, size FROM objects ORDER BY last_access LIMIT ?",
+            (self._EVICT_BATCH_SIZE,),
+        ).fetchall()
+        batch_size = 0
+        for path, size in rows:
+            if total_size - batch_size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Probably in use; leave it for a later eviction.
+                continue
+            conn.execute("DELETE FROM objects WHERE path = ?", (path,))
+            batch_size += size
+        conn.execute(
+            "UPDATE meta SET value = value - ? WHERE key = 'total_size'",
+            (batch_size,),
+        )
+        return batch_size
+
+    def cleanup(self, target_size: int) -> Optional[int]:
+        reclaimed = 0
+        with self._use() as conn:
+            if conn is None:
+                return None
+            for (path,) in conn.execute("SELECT path FROM tmp").fetchall():
+                try:
+                    reclaimed += os.stat(path).st_size
+                    os.remove(path)
+                except OSError:
+                    pass
+            conn.execute("DELETE FROM tmp")
+        evicted = self.evict(target_size)
+        if evicted is None:
+            return None
+        return reclaimed + evicted
+
+
+@contextlib.contextmanager
+def _transaction(conn: "sqlite3.Connection") -> Generator[None, None, None]:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class FileDigestCache:
+    """Persistent map from local files to their MD5 digests.
+
+    Entries are keyed on the file's absolute path and are only valid while
+    its inode, size and mtime are unchanged, so re-adding an unchanged file
+    does not need to hash it again. The cache is a best-effort optimization:
+    if the database can't be used, every lookup misses.
+    """
+
+    # Files modified this recently are not cached: a write landing in the same
+    # mtime tick as our hash would otherwise go unnoticed.
+    _MIN_AGE_SECONDS = 2.0
+
+    # New entries are buffered and written this many at a time, so the database
+    # is only locked for writing while a batch is inserted.
+    _WRITE_BATCH_SIZE = 1000
+
+    def __init__(self, db_path: StrPath) -> None:
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._disabled = False
+        self._pending: List[Tuple[str, int, int, int, B64MD5]] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"_db_path": self._db_path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["_db_path"])  # type: ignore
+
+    def _connect(self) -> Optional["sqlite3.Connection"]:
+        if self._conn is None and not self._disabled:
+            try:
+                import sqlite3
+
+                conn = sqlite3.connect(
+                    os.fspath(self._db_path), timeout=30, check_same_thread=False
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS digests ("
+                    "path TEXT PRIMARY KEY, inode INTEGER, size INTEGER,"
+                    " mtime_ns INTEGER, digest TEXT)"
+                )
+                self._conn = conn
+            except Exception:
+                logger.exception("Failed to open file digest cache")
+                self._disabled = True
+        return self._conn
+
+    @staticmethod
+    def is_unchanged(stat: os.stat_result, new_stat: os.stat_result) -> bool:
+        """Whether two stats of a file describe the same contents, ignoring atime."""
+        return _stat_key(stat) == _stat_key(new_stat)
+
+    def get(self, path: StrPath, stat: os.stat_result) -> Optional[B64MD5]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT inode, size, mtime_ns, digest FROM digests WHERE path = ?",
+                    (os.path.abspath(path),),
+                ).fetchone()
+            except Exception:
+                logger.exception("Failed to read file digest cache")
+                return None
+        if row is None or tuple(row[:3]) != _stat_key(stat):
+            return None
+        return B64MD5(row[3])
+
+    def put(self, path: StrPath, stat: os.stat_result, digest: B64MD5) -> None:
+        if time.time() - stat.st_mtime < self._MIN_AGE_SECONDS:
+            return
+        with self._lock:
+            self._pending.append((os.path.abspath(path), *_stat_key(stat), digest))
+            if len(self._pending) >= self._WRITE_BATCH_SIZE:
+                self._write_pending()
+
+    def commit(self) -> None:
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?)", pending
+                )
+        except Exception:
+            logger.exception("Failed to write file digest cache")
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
 _artifacts_cache = None
 
 
@@ -159,5 +575,9 @@ def get_artifacts_cache() -> ArtifactsCache:
     global _artifacts_cache
     if _artifacts_cache is None:
         cache_dir = os.path.join(env.get_cache_dir(), "artifacts")
-        _artifacts_cache = ArtifactsCache(cache_dir)
+        max_size = env.get_cache_max_size()
+        _artifacts_cache = ArtifactsCache(
+            cache_dir,
+            max_size=util.from_human_size(max_size) if max_size else None,
+        )
     return _artifacts_cache
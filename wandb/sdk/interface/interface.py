@@ -15,7 +15,19 @@ import os
 import sys
 import time
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Iterable, NewType, Optional, Tuple, Union
+from json.encoder import encode_basestring_ascii
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NewType,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from wandb.apis.public import Artifact as PublicArtifact
 from wandb.proto import wandb_internal_pb2 as pb
@@ -28,6 +40,7 @@ from wandb.util import (
     json_friendly,
     json_friendly_val,
     maybe_compress_summary,
+    np,
 )
 
 from ..data_types.utils import history_dict_to_json, val_to_json
@@ -56,6 +69,74 @@ if TYPE_CHECKING:
 logger = logging.getLogger("wandb")
 
 
+_NON_FINITE_JSON = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _encode_float(value: float) -> str:
+    # same output as json.dumps, without building an encoder per call
+    encoded = float.__repr__(value)
+    return _NON_FINITE_JSON.get(encoded, encoded)
+
+
+def _encode_numpy_float(value: Any) -> str:
+    # json_friendly turns NaN numpy scalars (other than float64) into null
+    if value != value:
+        return "null"
+    return _encode_float(value.item())
+
+
+# Encoders for history values that val_to_json leaves alone, keyed by exact
+# type.  Each one produces the same JSON as json_dumps_safer_history.
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    str: encode_basestring_ascii,
+    type(None): lambda value: "null",
+}
+if np:
+    _SCALAR_ENCODERS.update(
+        {
+            np.dtype(code).type: lambda value: int.__repr__(value.item())
+            for code in np.typecodes["AllInteger"]
+        }
+    )
+    _SCALAR_ENCODERS.update(
+        {
+            np.float16: _encode_numpy_float,
+            np.float32: _encode_numpy_float,
+            # a float subclass, which json encodes like any other float
+            np.float64: _encode_float,
+            np.bool_: lambda value: "true" if value else "false",
+            np.str_: encode_basestring_ascii,
+        }
+    )
+
+
+# marks a PartialHistoryRequest whose items are columns of many history rows
+HISTORY_BATCH_KEY = "_wandb_batch"
+
+
+def _encode_column(values: Any) -> str:
+    """Encode a 1-d numpy array the way its elements encode in history rows."""
+    if values.dtype.kind == "f" and values.dtype != np.float64:
+        if np.isnan(values).any():
+            return json.dumps([None if v != v else v for v in values.tolist()])
+    return json.dumps(values.tolist())
+
+
+def _encode_scalar_row(row: dict) -> Optional[List[Tuple[str, str]]]:
+    """Encode a history row made only of scalars, or return None if it isn't."""
+    items = []
+    get_encoder = _SCALAR_ENCODERS.get
+    for k, v in row.items():
+        encode = get_encoder(type(v))
+        if encode is None:
+            return None
+        items.append((k, encode(v)))
+    return items
+
+
 def file_policy_to_enum(policy: "PolicyName") -> "pb.FilesItem.PolicyType.V":
     if policy == "now":
         enum = pb.FilesItem.PolicyType.NOW
@@ -564,19 +645,20 @@ class InterfaceBase:
     ) -> None:
         run = run or self._run
 
-        data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
         data.pop("_step", None)
-
         # add timestamp to the history request, if not already present
         # the timestamp might come from the tensorboard log logic
         if "_timestamp" not in data:
             data["_timestamp"] = time.time()
 
         partial_history = pb.PartialHistoryRequest()
-        for k, v in data.items():
-            item = partial_history.item.add()
-            item.key = k
-            item.value_json = json_dumps_safer_history(v)
+        # rows of plain scalars (the common case) skip the media conversion
+        items = _encode_scalar_row(data)
+        if items is None:
+            data = history_dict_to_json(run, data, step=user_step, ignore_copy_err=True)
+            items = [(k, json_dumps_safer_history(v)) for k, v in data.items()]
+        for k, value_json in items:
+            partial_history.item.add(key=k, value_json=value_json)
 
         if publish_step and step is not None:
             partial_history.step.num = step
@@ -584,6 +666,28 @@ class InterfaceBase:
             partial_history.action.flush = flush
         self._publish_partial_history(partial_history)
 
+    def publish_partial_history_batch(
+        self, columns: Dict[str, Any], steps: List[int]
+    ) -> None:
+        """Publish many history rows as a single request.
+
+        `columns` maps each key to a 1-d numpy array holding one value per step.
+        The handler expands the request back into one history row per step.
+        """
+        partial_history = pb.PartialHistoryRequest()
+        partial_history.item.add(
+            key=HISTORY_BATCH_KEY, value_json=json.dumps(len(steps))
+        )
+        partial_history.item.add(key="_step", value_json=json.dumps(steps))
+        # a value that isn't a list is shared by every row
+        if "_timestamp" not in columns:
+            partial_history.item.add(
+                key="_timestamp", value_json=json.dumps(time.time())
+            )
+        for k, values in columns.items():
+            partial_history.item.add(key=k, value_json=_encode_column(values))
+        self._publish_partial_history(partial_history)
+
     @abstractmethod
     def _publish_partial_history(self, history: pb.PartialHistoryRequest) -> None:
         raise NotImplementedError
@@ -608,6 +712,34 @@ class InterfaceBase:
             item.value_json = json_dumps_safer_history(v)
         self._publish_history(history)
 
+    def publish_history_batch(
+        self, rows: Iterable[dict], run: Optional["Run"] = None
+    ) -> None:
+        """Publish complete history rows, leaving their steps to the handler.
+
+        Plain scalars are encoded directly; other values go through the same
+        conversion as `publish_history`.
+        """
+        run = run or self._run
+        for row in rows:
+            step = row.get("_step")
+            history = pb.HistoryRecord()
+            for k, v in row.items():
+                if k == "_step":
+                    continue
+                item = history.item.add()
+                item.key = k
+                encode = _SCALAR_ENCODERS.get(type(v))
+                if encode is not None:
+                    item.value_json = encode(v)
+                    continue
+                if isinstance(v, dict):
+                    v = history_dict_to_json(run, v, step=step)
+                else:
+                    v = val_to_json(run, k, v, namespace=step)
+                item.value_json = json_dumps_safer_history(v)
+            self._publish_history(history)
+
     @abstractmethod
     def _publish_history(self, history: pb.HistoryRecord) -> None:
         raise NotImplementedError
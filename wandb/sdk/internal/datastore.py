@@ -21,8 +21,9 @@ header :=
 import logging
 import os
 import struct
+import time
 import zlib
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import wandb
 
@@ -46,6 +47,10 @@ LEVELDBLOG_HEADER_MAGIC = (
 )
 LEVELDBLOG_HEADER_VERSION = 0
 
+# group commit defaults: sync to disk after this many bytes or seconds
+GROUP_COMMIT_SYNC_BYTES = 4 * LEVELDBLOG_BLOCK_LEN
+GROUP_COMMIT_SYNC_SECONDS = 1.0
+
 try:
     bytes("", "ascii")
 
@@ -62,16 +67,43 @@ except Exception:
 
 
 class DataStore:
+    """Transaction log of records in leveldb log format.
+
+    By default every record is handed to the file object as soon as it is
+    written and multi-block records are synced to disk immediately.  With
+    `group_commit` enabled, records are assembled into an in-memory buffer
+    which is only written out in whole blocks, and the file is synced once
+    `sync_bytes` have been written or `sync_seconds` have elapsed since the
+    last sync (whichever comes first).  The on-disk format is identical in
+    both modes.
+    """
+
     _index: int
     _flush_offset: int
-
-    def __init__(self) -> None:
+    _buffer: bytearray
+    _buffer_offset: int
+
+    def __init__(
+        self,
+        group_commit: bool = False,
+        sync_bytes: Optional[int] = None,
+        sync_seconds: Optional[float] = None,
+    ) -> None:
         self._opened_for_scan = False
         self._fp = None
         self._index = 0
         self._flush_offset = 0
         self._size_bytes = 0
 
+        self._group_commit = group_commit
+        self._sync_bytes = sync_bytes or GROUP_COMMIT_SYNC_BYTES
+        self._sync_seconds = (
+            sync_seconds if sync_seconds is not None else GROUP_COMMIT_SYNC_SECONDS
+        )
+        self._buffer = bytearray()
+        self._buffer_offset = 0
+        self._last_sync_time = time.monotonic()
+
         self._crc = [0] * (LEVELDBLOG_LAST + 1)
         for x in range(1, LEVELDBLOG_LAST + 1):
             self._crc[x] = zlib.crc32(strtobytes(chr(x))) & 0xFFFFFFFF
@@ -192,6 +224,7 @@ class DataStore:
         )
         self._fp.write(data)
         self._index += len(data)
+        self._buffer_offset = self._index
 
     def _read_header(self):
         header = self._fp.read(LEVELDBLOG_HEADER_LEN)
@@ -223,9 +256,9 @@ class DataStore:
         checksum = zlib.crc32(s, self._crc[dtype]) & 0xFFFFFFFF
         # logger.info("write_record: index=%d len=%d dtype=%d",
         #     self._index, dlength, dtype)
-        self._fp.write(struct.pack("<IHB", checksum, dlength, dtype))
+        self._buffer += struct.pack("<IHB", checksum, dlength, dtype)
         if dlength:
-            self._fp.write(s)
+            self._buffer += s
         self._index += LEVELDBLOG_HEADER_LEN + len(s)
 
     def _write_data(self, s):
@@ -239,7 +272,7 @@ class DataStore:
         #     self._index, offset, data_left)
         if space_left < LEVELDBLOG_HEADER_LEN:
             pad = "\x00" * space_left
-            self._fp.write(strtobytes(pad))
+            self._buffer += strtobytes(pad)
             self._index += space_left
             offset = 0
             space_left = LEVELDBLOG_BLOCK_LEN
@@ -267,13 +300,69 @@ class DataStore:
 
             # write last and flush the entire block to disk
             self._write_record(s[data_used:], LEVELDBLOG_LAST)
-            self._fp.flush()
-            os.fsync(self._fp.fileno())
-            self._flush_offset = self._index
+            if not self._group_commit:
+                self._write_buffer()
+                self._sync()
+
+        if self._group_commit:
+            self._maybe_commit()
+        else:
+            self._write_buffer()
 
         return start_offset, self._index, self._flush_offset
 
+    def _write_buffer(self, end: Optional[int] = None) -> None:
+        """Hand buffered bytes up to file offset `end` to the file object."""
+        if end is None:
+            end = self._index
+        size = end - self._buffer_offset
+        if size <= 0:
+            return
+        if size == len(self._buffer):
+            self._fp.write(self._buffer)
+            self._buffer = bytearray()
+        else:
+            with memoryview(self._buffer) as view, view[:size] as chunk:
+                self._fp.write(chunk)
+            del self._buffer[:size]
+        self._buffer_offset = end
+
+    def _sync(self) -> None:
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        self._flush_offset = self._buffer_offset
+        self._last_sync_time = time.monotonic()
+
+    def _maybe_commit(self) -> None:
+        # only hand complete blocks to the file, the partial tail block
+        # stays in memory until it fills up or a commit is forced
+        block_end = self._index - self._index % LEVELDBLOG_BLOCK_LEN
+        if block_end > self._buffer_offset:
+            self._write_buffer(block_end)
+        if (
+            self._buffer_offset - self._flush_offset >= self._sync_bytes
+            or time.monotonic() - self._last_sync_time >= self._sync_seconds
+        ):
+            self.commit()
+
+    def commit(self) -> None:
+        """Write out all buffered records and sync them to disk."""
+        if self._fp is None or self._opened_for_scan:
+            return
+        self._write_buffer()
+        if self._flush_offset < self._buffer_offset:
+            self._sync()
+
+    def poll(self) -> None:
+        """Commit buffered records if the sync interval has elapsed."""
+        if not self._group_commit or self._fp is None:
+            return
+        if time.monotonic() - self._last_sync_time >= self._sync_seconds:
+            self.commit()
+
     def ensure_flushed(self, off: int) -> None:
+        if off > self._buffer_offset:
+            self._write_buffer()
         self._fp.flush()
 
     def write(self, obj: "Record") -> Tuple[int, int, int]:
@@ -296,4 +385,8 @@ class DataStore:
     def close(self) -> None:
         if self._fp is not None:
             logger.info("close: %s", self._fname)
+            if self._group_commit:
+                self.commit()
+            else:
+                self._write_buffer()
             self._fp.close()
@@ -1,5 +1,7 @@
 import base64
+import gzip
 import itertools
+import json
 import logging
 import os
 import queue
@@ -311,8 +313,15 @@ class FileStreamApi:
         artifact_id: str
         save_name: str
 
+    class Flushed(NamedTuple):
+        event: threading.Event
+
     HTTP_TIMEOUT = env.get_http_timeout(10)
     MAX_ITEMS_PER_PUSH = 10000
+    # adaptive rate limiting: post no more often than this multiple of the
+    # observed request latency, and back off by this factor on 429s
+    LATENCY_FACTOR = 2.0
+    BACKOFF_FACTOR = 2.0
 
     def __init__(
         self,
@@ -320,7 +329,19 @@ class FileStreamApi:
         run_id: str,
         start_time: float,
         settings: Optional[dict] = None,
+        compression: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        adaptive_rate: bool = False,
     ) -> None:
+        """Create a file stream.
+
+        Arguments:
+            compression: Compress request bodies with "gzip" or "zstd".
+            max_bytes: Size batches by the bytes of queued chunks instead of
+                by the number of items.
+            adaptive_rate: Adapt the posting interval to the observed request
+                latency and to rate limiting (429) responses.
+        """
         settings = settings or dict()
         # NOTE: exc_info is set in thread_except_body context and readable by calling threads
         self._exc_info: Optional[
@@ -346,6 +367,12 @@ class FileStreamApi:
         )
         self._file_policies: Dict[str, "DefaultFilePolicy"] = {}
         self._dropped_chunks: int = 0
+        self._compression = self._init_compression(compression)
+        self._max_bytes = min(max_bytes, util.MAX_LINE_BYTES) if max_bytes else None
+        self._adaptive_rate = adaptive_rate
+        self._latency_seconds = 0.0
+        self._backoff_seconds = 0.0
+        self._rate_limited = False
         self._queue: queue.Queue = queue.Queue()
         self._thread = threading.Thread(target=self._thread_except_body)
         # It seems we need to make this a daemon thread to get sync.py's atexit handler to run, which
@@ -354,6 +381,20 @@ class FileStreamApi:
         self._thread.daemon = True
         self._init_endpoint()
 
+    @staticmethod
+    def _init_compression(compression: Optional[str]) -> Optional[str]:
+        if not compression:
+            return None
+        if compression not in ("gzip", "zstd"):
+            raise ValueError(f"Unsupported file stream compression: {compression}")
+        if compression == "zstd" and not util.get_module("zstandard"):
+            wandb.termwarn(
+                "zstandard is not installed, compressing file stream with gzip",
+                repeat=False,
+            )
+            return "gzip"
+        return compression
+
     def _init_endpoint(self) -> None:
         settings = self._api.settings()
         settings.update(self._settings)
@@ -389,11 +430,38 @@ class FileStreamApi:
     def rate_limit_seconds(self) -> Union[int, float]:
         run_time = time.time() - self._start_time
         if run_time < 60:
-            return max(1.0, self.heartbeat_seconds / 15)
+            seconds = max(1.0, self.heartbeat_seconds / 15)
         elif run_time < 300:
-            return max(2.5, self.heartbeat_seconds / 3)
+            seconds = max(2.5, self.heartbeat_seconds / 3)
+        else:
+            seconds = max(5.0, self.heartbeat_seconds)
+        if self._adaptive_rate:
+            seconds = max(
+                seconds,
+                self._backoff_seconds,
+                self.LATENCY_FACTOR * self._latency_seconds,
+            )
+            seconds = min(seconds, MAX_SLEEP_SECONDS)
+        return seconds
+
+    def _update_rate_limit(self, latency: Optional[float]) -> None:
+        """Track post latency and 429s to adapt the posting interval.
+
+        `latency` is None when the post failed, it then isn't averaged in.
+        """
+        # exponentially weighted average of the request latency
+        if latency is not None:
+            self._latency_seconds = 0.8 * self._latency_seconds + 0.2 * latency
+        if self._rate_limited:
+            self._rate_limited = False
+            self._backoff_seconds = min(
+                MAX_SLEEP_SECONDS,
+                max(self._backoff_seconds, 1.0) * self.BACKOFF_FACTOR,
+            )
         else:
-            return max(5.0, self.heartbeat_seconds)
+            self._backoff_seconds /= self.BACKOFF_FACTOR
+            if self._backoff_seconds < 1.0:
+                self._backoff_seconds = 0.0
 
     def _read_queue(self) -> List:
         # called from the push thread (_thread_body), this does an initial read
@@ -405,26 +473,91 @@ class FileStreamApi:
         #
         # If we have more than MAX_ITEMS_PER_PUSH in the queue then the push thread
         # will get behind and data will buffer up in the queue.
+        if self._max_bytes:
+            return self._read_queue_bytes(self._max_bytes)
         return util.read_many_from_queue(
             self._queue, self.MAX_ITEMS_PER_PUSH, self.rate_limit_seconds()
         )
 
+    def _read_queue_bytes(self, max_bytes: int) -> List:
+        # like _read_queue, but stops once the queued chunks add up to max_bytes
+        try:
+            item = self._queue.get(True, self.rate_limit_seconds())
+        except queue.Empty:
+            return []
+        items = [item]
+        size = _item_size(item)
+        while size < max_bytes and len(items) < self.MAX_ITEMS_PER_PUSH:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            size += _item_size(item)
+        return items
+
+    def _post(
+        self, payload: Dict[str, Any], retry_callback: Optional[Callable] = None
+    ) -> Union["requests.Response", "requests.RequestException"]:
+        """Post a json payload to the file stream endpoint, retrying on failure."""
+
+        def _retry_callback(status: int, response_text: str) -> None:
+            if status == 429:
+                self._rate_limited = True
+            if retry_callback:
+                retry_callback(status, response_text)
+
+        latency: Optional[float] = None
+
+        def _post_attempt(*args: Any, **kwargs: Any) -> "requests.Response":
+            nonlocal latency
+            start = time.monotonic()
+            response = self._client.post(*args, **kwargs)
+            latency = time.monotonic() - start
+            return response
+
+        if self._compression:
+            response = request_with_retry(
+                _post_attempt,
+                self._endpoint,
+                data=_compress(json.dumps(payload).encode("utf-8"), self._compression),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": self._compression,
+                },
+                retry_callback=_retry_callback,
+            )
+        else:
+            response = request_with_retry(
+                _post_attempt,
+                self._endpoint,
+                json=payload,
+                retry_callback=_retry_callback,
+            )
+        if self._adaptive_rate:
+            # only time the attempt that succeeded, the backoff between retries
+            # says nothing about how long the server takes to answer
+            failed = isinstance(response, Exception)
+            self._update_rate_limit(None if failed else latency)
+        return response
+
     def _thread_body(self) -> None:
         posted_data_time = time.time()
         posted_anything_time = time.time()
         ready_chunks = []
         uploaded: Set[str] = set()
+        flushed: List[threading.Event] = []
         finished: Optional["FileStreamApi.Finish"] = None
         while finished is None:
             items = self._read_queue()
             for item in items:
                 if isinstance(item, self.Finish):
                     finished = item
+                elif isinstance(item, self.Flushed):
+                    flushed.append(item.event)
                 elif isinstance(item, self.Preempting):
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "preempting": True,
                             "dropped": self._dropped_chunks,
@@ -441,7 +574,9 @@ class FileStreamApi:
             cur_time = time.time()
 
             if ready_chunks and (
-                finished or cur_time - posted_data_time > self.rate_limit_seconds()
+                finished
+                or flushed
+                or cur_time - posted_data_time > self.rate_limit_seconds()
             ):
                 posted_data_time = cur_time
                 posted_anything_time = cur_time
@@ -449,6 +584,9 @@ class FileStreamApi:
                 ready_chunks = []
                 if success:
                     uploaded = set()
+            for event in flushed:
+                event.set()
+            flushed = []
 
             # If there aren't ready chunks or uploaded files, we still want to
             # send regular heartbeats so the backend doesn't erroneously mark this
@@ -460,10 +598,8 @@ class FileStreamApi:
                 # list of uploaded files, don't reset the `uploaded`
                 # list. Retry publishing the list on the next attempt.
                 if not isinstance(
-                    request_with_retry(
-                        self._client.post,
-                        self._endpoint,
-                        json={
+                    self._post(
+                        {
                             "complete": False,
                             "failed": False,
                             "dropped": self._dropped_chunks,
@@ -475,10 +611,8 @@ class FileStreamApi:
                     uploaded = set()
 
         # post the final close message. (item is self.Finish instance now)
-        request_with_retry(
-            self._client.post,
-            self._endpoint,
-            json={
+        self._post(
+            {
                 "complete": True,
                 "exitcode": int(finished.exitcode),
                 "dropped": self._dropped_chunks,
@@ -533,22 +667,19 @@ class FileStreamApi:
             if not files[filename]:
                 del files[filename]
 
-        for fs in file_stream_utils.split_files(files, max_bytes=util.MAX_LINE_BYTES):
+        max_bytes = self._max_bytes or util.MAX_LINE_BYTES
+        for fs in file_stream_utils.split_files(files, max_bytes=max_bytes):
             self._handle_response(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={"files": fs, "dropped": self._dropped_chunks},
+                self._post(
+                    {"files": fs, "dropped": self._dropped_chunks},
                     retry_callback=self._api.retry_callback,
                 )
             )
 
         if uploaded_list:
             if isinstance(
-                request_with_retry(
-                    self._client.post,
-                    self._endpoint,
-                    json={
+                self._post(
+                    {
                         "complete": False,
                         "failed": False,
                         "dropped": self._dropped_chunks,
@@ -577,6 +708,20 @@ class FileStreamApi:
         """
         self._queue.put(Chunk(filename, data))
 
+    def wait_flushed(self, timeout: Optional[float] = None) -> bool:
+        """Block until every chunk pushed so far has been posted.
+
+        Arguments:
+            timeout: Seconds to wait for, or None to wait indefinitely.
+
+        Returns:
+            False if the timeout expired first, or if a chunk was dropped
+            because it could not be posted.
+        """
+        event = threading.Event()
+        self._queue.put(self.Flushed(event))
+        return event.wait(timeout) and self._dropped_chunks == 0
+
     def push_success(self, artifact_id: str, save_name: str) -> None:
         """Notification that a file upload has been successfully completed.
 
@@ -607,6 +752,19 @@ class FileStreamApi:
 MAX_SLEEP_SECONDS = 60 * 5
 
 
+def _item_size(item: Any) -> int:
+    if isinstance(item, Chunk) and isinstance(item.data, (str, bytes)):
+        return len(item.data)
+    return 0
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        zstandard = util.get_module("zstandard", required="zstd compression")
+        return zstandard.ZstdCompressor().compress(data)  # type: ignore
+    return gzip.compress(data, compresslevel=6)
+
+
 def request_with_retry(
     func: Callable,
     *args: Any,
@@ -4,6 +4,7 @@ import json
 import logging
 import math
 import numbers
+import re
 import time
 from collections import defaultdict
 from queue import Queue
@@ -16,7 +17,9 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Pattern,
     Sequence,
+    Set,
     Tuple,
     cast,
 )
@@ -33,6 +36,7 @@ from wandb.proto.wandb_internal_pb2 import (
     SummaryRecordRequest,
 )
 
+from ..interface.interface import HISTORY_BATCH_KEY, _encode_scalar_row
 from ..interface.interface_queue import InterfaceQueue
 from ..lib import handler_util, proto_util, tracelog
 from . import context, sample, tb_watcher
@@ -40,7 +44,9 @@ from .settings_static import SettingsStatic
 from .system.system_monitor import SystemMonitor
 
 if TYPE_CHECKING:
-    from wandb.proto.wandb_internal_pb2 import ArtifactDoneRequest, MetricSummary
+    from wandb.proto.wandb_internal_pb2 import ArtifactDoneRequest
+
+    from .overhead import OverheadProfiler
 
 
 SummaryDict = Dict[str, Any]
@@ -61,10 +67,115 @@ def _dict_nested_set(target: Dict[str, Any], key_list: Sequence[str], v: Any) ->
     target[key_list[-1]] = v
 
 
+class _MetricAggregate:
+    """Running summary statistics (min/max/last/mean) of a single metric.
+
+    The summary keys and the statistics to track are compiled from the metric
+    definition once, and only recompiled when metric definitions change.  The
+    tracked values survive recompilation.
+    """
+
+    __slots__ = (
+        "kl",
+        "version",
+        "none",
+        "copy",
+        "last",
+        "best",
+        "max",
+        "min",
+        "mean",
+        "track_max",
+        "track_min",
+        "last_v",
+        "max_v",
+        "min_v",
+        "tot",
+        "num",
+    )
+
+    def __init__(self, kl: List[str]) -> None:
+        self.kl = kl
+        self.version = -1
+        self.last_v: Optional[float] = None
+        self.max_v: Optional[float] = None
+        self.min_v: Optional[float] = None
+        self.tot = 0.0
+        self.num = 0
+
+    def compile(self, d: MetricRecord, version: int) -> None:
+        s = d.summary
+        goal_max = None
+        if d.goal:
+            goal_max = d.goal == d.GOAL_MAXIMIZE
+        self.version = version
+        self.none = s.none
+        # non key list copy already done in _update_summary
+        self.copy = s.copy and len(self.kl) > 1
+        self.last = s.last
+        self.best = s.best
+        self.max = s.max
+        self.min = s.min
+        self.mean = s.mean
+        self.track_max = bool(s.max or s.best and goal_max)
+        # defaulting to minimize if goal is not supecified
+        self.track_min = bool(s.min or s.best and not goal_max)
+
+    def _target(self, summary: SummaryDict) -> Dict[str, Any]:
+        # resolve the nested summary dict that holds the statistics of this metric
+        target = summary
+        for k in self.kl:
+            target = target.setdefault(k, {})
+        return target
+
+    def update(self, summary: SummaryDict, v: Any, float_v: float) -> bool:
+        if self.none:
+            return False
+        if self.copy:
+            _dict_nested_set(summary, self.kl, v)
+            return True
+        target = None
+        if self.last and (self.last_v is None or float_v != self.last_v):
+            self.last_v = float_v
+            target = self._target(summary)
+            target["last"] = v
+        if self.track_max and (self.max_v is None or float_v > self.max_v):
+            self.max_v = float_v
+            if self.max or self.best:
+                target = target if target is not None else self._target(summary)
+                if self.max:
+                    target["max"] = v
+                if self.best:
+                    target["best"] = v
+        if self.track_min and (self.min_v is None or float_v < self.min_v):
+            self.min_v = float_v
+            if self.min or self.best:
+                target = target if target is not None else self._target(summary)
+                if self.min:
+                    target["min"] = v
+                if self.best:
+                    target["best"] = v
+        if self.mean:
+            self.tot += float_v
+            self.num += 1
+            target = target if target is not None else self._target(summary)
+            target["mean"] = self.tot / self.num
+        return target is not None
+
+
+def _encode_row(row: Dict[str, Any]) -> List[Tuple[str, str]]:
+    items = _encode_scalar_row(row)
+    if items is None:
+        items = [(k, json.dumps(v)) for k, v in row.items()]
+    return items
+
+
 class HandleManager:
     _consolidated_summary: SummaryDict
+    _summary_updated_keys: Dict[str, None]
     _sampled_history: Dict[str, sample.UniformSampleAccumulator]
     _partial_history: Dict[str, Any]
+    _partial_history_json: Dict[str, str]
     _run_proto: Optional[RunRecord]
     _settings: SettingsStatic
     _record_q: "Queue[Record]"
@@ -76,13 +187,18 @@ class HandleManager:
     _tb_watcher: Optional[tb_watcher.TBWatcher]
     _metric_defines: Dict[str, MetricRecord]
     _metric_globs: Dict[str, MetricRecord]
-    _metric_track: Dict[Tuple[str, ...], float]
+    _metric_glob_names: List[str]
+    _metric_glob_re: Optional[Pattern[str]]
+    _metric_glob_misses: Set[str]
+    _metric_aggregates: Dict[Tuple[str, ...], _MetricAggregate]
+    _metric_version: int
     _metric_copy: Dict[Tuple[str, ...], Any]
     _track_time: Optional[float]
     _accumulate_time: float
     _artifact_xid_done: Dict[str, "ArtifactDoneRequest"]
     _run_start_time: Optional[float]
     _context_keeper: context.ContextKeeper
+    _profiler: Optional["OverheadProfiler"]
 
     def __init__(
         self,
@@ -93,6 +209,7 @@ class HandleManager:
         writer_q: "Queue[Record]",
         interface: InterfaceQueue,
         context_keeper: context.ContextKeeper,
+        profiler: Optional["OverheadProfiler"] = None,
     ) -> None:
         self._settings = settings
         self._record_q = record_q
@@ -101,6 +218,7 @@ class HandleManager:
         self._writer_q = writer_q
         self._interface = interface
         self._context_keeper = context_keeper
+        self._profiler = profiler
 
         self._tb_watcher = None
         self._system_monitor = None
@@ -112,12 +230,18 @@ class HandleManager:
 
         # keep track of summary from key/val updates
         self._consolidated_summary = dict()
+        self._summary_updated_keys = dict()
         self._sampled_history = defaultdict(sample.UniformSampleAccumulator)
         self._run_proto = None
         self._partial_history = dict()
+        self._partial_history_json = dict()
         self._metric_defines = defaultdict(MetricRecord)
         self._metric_globs = defaultdict(MetricRecord)
-        self._metric_track = dict()
+        self._metric_glob_names = []
+        self._metric_glob_re = None
+        self._metric_glob_misses = set()
+        self._metric_aggregates = dict()
+        self._metric_version = 0
         self._metric_copy = dict()
 
         # TODO: implement release protocol to clean this up
@@ -133,7 +257,13 @@ class HandleManager:
         handler_str = "handle_" + record_type
         handler: Callable[[Record], None] = getattr(self, handler_str, None)  # type: ignore
         assert handler, f"unknown handle: {handler_str}"  # type: ignore
-        handler(record)
+        if self._profiler is None:
+            handler(record)
+            return
+        if record_type == "request":
+            record_type += "." + str(record.request.WhichOneof("request_type"))
+        with self._profiler.measure("handle." + record_type):
+            handler(record)
 
     def handle_request(self, record: Record) -> None:
         request_type = record.request.WhichOneof("request_type")
@@ -158,7 +288,12 @@ class HandleManager:
         self._result_q.put(result)
 
     def debounce(self) -> None:
-        pass
+        self._flush_summary_updates()
+        if self._profiler is not None:
+            self._profiler.sample_gauges()
+            # stats are only streamed once the run has started
+            if self._run_start_time is not None and self._profiler.due():
+                self._interface.publish_stats(self._profiler.stats())
 
     def handle_request_cancel(self, record: Record) -> None:
         self._dispatch_record(record)
@@ -182,6 +317,7 @@ class HandleManager:
         elif state == defer.FLUSH_PARTIAL_HISTORY:
             self._flush_partial_history()
         elif state == defer.FLUSH_SUM:
+            self._summary_updated_keys = {}
             self._save_summary(self._consolidated_summary, flush=True)
 
         # defer is used to drive the sender finish state machine
@@ -239,78 +375,13 @@ class HandleManager:
 
     def _save_history(
         self,
-        history: HistoryRecord,
+        history_dict: Dict[str, Any],
     ) -> None:
-        for item in history.item:
+        for k, v in history_dict.items():
             # TODO(jhr) save nested keys?
-            k = item.key
-            v = json.loads(item.value_json)
             if isinstance(v, numbers.Real):
                 self._sampled_history[k].add(v)
 
-    def _update_summary_metrics(
-        self,
-        s: "MetricSummary",
-        kl: List[str],
-        v: "numbers.Real",
-        float_v: float,
-        goal_max: Optional[bool],
-    ) -> bool:
-        updated = False
-        best_key: Optional[Tuple[str, ...]] = None
-        if s.none:
-            return False
-        if s.copy:
-            # non key list copy already done in _update_summary
-            if len(kl) > 1:
-                _dict_nested_set(self._consolidated_summary, kl, v)
-                return True
-        if s.last:
-            last_key = tuple(kl + ["last"])
-            old_last = self._metric_track.get(last_key)
-            if old_last is None or float_v != old_last:
-                self._metric_track[last_key] = float_v
-                _dict_nested_set(self._consolidated_summary, last_key, v)
-                updated = True
-        if s.best:
-            best_key = tuple(kl + ["best"])
-        if s.max or best_key and goal_max:
-            max_key = tuple(kl + ["max"])
-            old_max = self._metric_track.get(max_key)
-            if old_max is None or float_v > old_max:
-                self._metric_track[max_key] = float_v
-                if s.max:
-                    _dict_nested_set(self._consolidated_summary, max_key, v)
-                    updated = True
-                if best_key:
-                    _dict_nested_set(self._consolidated_summary, best_key, v)
-                    updated = True
-        # defaulting to minimize if goal is not supecified
-        if s.min or best_key and not goal_max:
-            min_key = tuple(kl + ["min"])
-            old_min = self._metric_track.get(min_key)
-            if old_min is None or float_v < old_min:
-                self._metric_track[min_key] = float_v
-                if s.min:
-                    _dict_nested_set(self._consolidated_summary, min_key, v)
-                    updated = True
-                if best_key:
-                    _dict_nested_set(self._consolidated_summary, best_key, v)
-                    updated = True
-        if s.mean:
-            tot_key = tuple(kl + ["tot"])
-            num_key = tuple(kl + ["num"])
-            avg_key = tuple(kl + ["mean"])
-            tot = self._metric_track.get(tot_key, 0.0)
-            num = self._metric_track.get(num_key, 0)
-            tot += float_v
-            num += 1
-            self._metric_track[tot_key] = tot
-            self._metric_track[num_key] = num
-            _dict_nested_set(self._consolidated_summary, avg_key, tot / num)
-            updated = True
-        return updated
-
     def _update_summary_leaf(
         self,
         kl: List[str],
@@ -335,13 +406,13 @@ class HandleManager:
             return False
         if math.isnan(v):
             return False
-        float_v = float(v)
-        goal_max = None
-        if d.goal:
-            goal_max = d.goal == d.GOAL_MAXIMIZE
-        if self._update_summary_metrics(
-            d.summary, kl=kl, v=v, float_v=float_v, goal_max=goal_max
-        ):
+        key = tuple(kl)
+        agg = self._metric_aggregates.get(key)
+        if agg is None:
+            agg = self._metric_aggregates[key] = _MetricAggregate(kl)
+        if agg.version != self._metric_version:
+            agg.compile(d, self._metric_version)
+        if agg.update(self._consolidated_summary, v, float(v)):
             return True
         return False
 
@@ -417,16 +488,29 @@ class HandleManager:
         # Dont define metric for internal metrics
         if hkey.startswith("_"):
             return None
-        for k, mglob in self._metric_globs.items():
-            if k.endswith("*"):
-                if hkey.startswith(k[:-1]):
-                    m = MetricRecord()
-                    m.CopyFrom(mglob)
-                    m.ClearField("glob_name")
-                    m.options.defined = False
-                    m.name = hkey
-                    return m
-        return None
+        if hkey in self._metric_glob_misses:
+            return None
+        if self._metric_glob_re is None:
+            self._compile_metric_globs()
+        assert self._metric_glob_re is not None
+        match = self._metric_glob_re.match(hkey)
+        if not match or match.lastindex is None:
+            self._metric_glob_misses.add(hkey)
+            return None
+        mglob = self._metric_globs[self._metric_glob_names[match.lastindex - 1]]
+        m = MetricRecord()
+        m.CopyFrom(mglob)
+        m.ClearField("glob_name")
+        m.options.defined = False
+        m.name = hkey
+        return m
+
+    def _compile_metric_globs(self) -> None:
+        """Combine all glob metrics into one regex, first defined glob wins."""
+        self._metric_glob_names = [k for k in self._metric_globs if k.endswith("*")]
+        pattern = "|".join(f"({re.escape(k[:-1])})" for k in self._metric_glob_names)
+        # a pattern that never matches if there are no usable globs
+        self._metric_glob_re = re.compile(pattern or r"(?!)")
 
     def _history_update_leaf(
         self,
@@ -497,7 +581,10 @@ class HandleManager:
 
     def handle_history(self, record: Record) -> None:
         history_dict = proto_util.dict_from_proto_list(record.history.item)
+        self._handle_history(record, history_dict)
 
+    def _handle_history(self, record: Record, history_dict: Dict[str, Any]) -> None:
+        """Process a history record whose items are already decoded in history_dict."""
         # Inject _runtime if it is not present
         if history_dict is not None:
             if "_runtime" not in history_dict:
@@ -505,10 +592,21 @@ class HandleManager:
 
         self._history_update(record.history, history_dict)
         self._dispatch_record(record)
-        self._save_history(record.history)
+        self._save_history(history_dict)
+        # summary updates are coalesced and sent on the next debounce
         updated_keys = self._update_summary(history_dict)
-        if updated_keys:
-            updated_items = {k: self._consolidated_summary[k] for k in updated_keys}
+        self._summary_updated_keys.update(dict.fromkeys(updated_keys))
+
+    def _flush_summary_updates(self) -> None:
+        if not self._summary_updated_keys:
+            return
+        updated_items = {
+            k: self._consolidated_summary[k]
+            for k in self._summary_updated_keys
+            if k in self._consolidated_summary
+        }
+        self._summary_updated_keys = {}
+        if updated_items:
             self._save_summary(updated_items)
 
     def _flush_partial_history(
@@ -518,15 +616,17 @@ class HandleManager:
         if not self._partial_history:
             return
 
+        # reuse the json fragments sent by the client instead of re-encoding
         history = HistoryRecord()
-        for k, v in self._partial_history.items():
+        for k, v in self._partial_history_json.items():
             item = history.item.add()
             item.key = k
-            item.value_json = json.dumps(v)
+            item.value_json = v
         if step is not None:
             history.step.num = step
-        self.handle_history(Record(history=history))
+        self._handle_history(Record(history=history), self._partial_history)
         self._partial_history = {}
+        self._partial_history_json = {}
 
     def handle_request_sender_mark_report(self, record: Record) -> None:
         self._dispatch_record(record, always_send=True)
@@ -534,8 +634,55 @@ class HandleManager:
     def handle_request_status_report(self, record: Record) -> None:
         self._dispatch_record(record, always_send=True)
 
+    def _handle_history_batch(self, record: Record) -> None:
+        """Expand the columns sent by `run.log_batch` into history rows."""
+        columns = proto_util.dict_from_proto_list(record.request.partial_history.item)
+        columns.pop(HISTORY_BATCH_KEY)
+        steps = columns.pop("_step")
+        shared = {k: v for k, v in columns.items() if not isinstance(v, list)}
+        for k in shared:
+            del columns[k]
+        shared_items = _encode_row(shared)
+
+        dropped = 0
+        for i, step in enumerate(steps):
+            if step < self._step:
+                dropped += 1
+                continue
+            row = {k: values[i] for k, values in columns.items()}
+            items = _encode_row(row)
+            row.update(shared)
+            if step == self._step and self._partial_history:
+                # uncommitted wandb.log data for this step goes into the same row
+                self._partial_history.update(row)
+                self._partial_history_json.update(items)
+                self._partial_history_json.update(shared_items)
+                self._flush_partial_history(step)
+                continue
+            self._flush_partial_history()
+
+            history = HistoryRecord()
+            for k, value_json in items + shared_items:
+                history.item.add(key=k, value_json=value_json)
+            history.step.num = step
+            self._handle_history(Record(history=history), row)
+
+        if dropped:
+            logger.warning(
+                f"Dropped {dropped} batched history rows behind the current step."
+            )
+
     def handle_request_partial_history(self, record: Record) -> None:
         partial_history = record.request.partial_history
+        # a batch starts with the batch marker followed by the list of steps;
+        # rows logged with `wandb.log` never carry a "_step" item
+        if (
+            len(partial_history.item) >= 2
+            and partial_history.item[0].key == HISTORY_BATCH_KEY
+            and partial_history.item[1].key == "_step"
+        ):
+            self._handle_history_batch(record)
+            return
 
         flush = None
         if partial_history.HasField("action"):
@@ -546,6 +693,7 @@ class HandleManager:
             step = partial_history.step.num
 
         history_dict = proto_util.dict_from_proto_list(partial_history.item)
+        history_json = {item.key: item.value_json for item in partial_history.item}
         if step is not None:
             if step < self._step:
                 logger.warning(
@@ -559,6 +707,7 @@ class HandleManager:
             flush = True
 
         self._partial_history.update(history_dict)
+        self._partial_history_json.update(history_json)
 
         if flush:
             self._flush_partial_history(self._step)
@@ -603,6 +752,7 @@ class HandleManager:
             # use the last element of the key to erase the leaf:
             del target[key[-1]]
 
+        self._summary_updated_keys = {}
         self._save_summary(self._consolidated_summary)
 
     def handle_exit(self, record: Record) -> None:
@@ -690,6 +840,7 @@ class HandleManager:
         self._system_monitor = SystemMonitor(
             self._settings,
             self._interface,
+            profiler=self._profiler,
         )
         if not self._settings._disable_stats:
             self._system_monitor.start()
@@ -755,10 +906,14 @@ class HandleManager:
 
     def _handle_defined_metric(self, record: Record) -> None:
         metric = record.metric
+        old_metric = self._metric_defines.get(metric.name)
+        if old_metric is not None:
+            old_metric = MetricRecord(summary=old_metric.summary, goal=old_metric.goal)
         if metric._control.overwrite:
             self._metric_defines[metric.name].CopyFrom(metric)
         else:
             self._metric_defines[metric.name].MergeFrom(metric)
+        self._invalidate_metric_aggregates(metric.name, old_metric)
 
         # before dispatching, make sure step_metric is defined, if not define it and
         # dispatch it locally first
@@ -773,8 +928,32 @@ class HandleManager:
 
         self._dispatch_record(record)
 
+    def _invalidate_metric_aggregates(
+        self, name: str, old_metric: Optional[MetricRecord]
+    ) -> None:
+        """Recompile the aggregates affected by a change to the definition of `name`."""
+        new_metric = self._metric_defines[name]
+        if old_metric is not None:
+            # only the summary options and goal are compiled into aggregates
+            if old_metric.summary == new_metric.summary and (
+                old_metric.goal == new_metric.goal
+            ):
+                return
+        elif not new_metric.options.defined:
+            # Defined from a glob the first time the key was logged. Keys matching
+            # globs are leaves, so only that key's aggregate can be affected.
+            kl = [k.replace("\\.", ".") for k in re.split(r"(?<!\\)\.", name)]
+            agg = self._metric_aggregates.get(tuple(kl))
+            if agg is not None:
+                agg.version = -1
+            return
+        self._metric_version += 1
+
     def _handle_glob_metric(self, record: Record) -> None:
         metric = record.metric
+        # globs changed, previous resolutions are no longer valid
+        self._metric_glob_re = None
+        self._metric_glob_misses = set()
         if metric._control.overwrite:
             self._metric_globs[metric.glob_name].CopyFrom(metric)
         else:
@@ -30,7 +30,7 @@ import wandb
 
 from ..interface.interface_queue import InterfaceQueue
 from ..lib import tracelog
-from . import context, handler, internal_util, sender, settings_static, writer
+from . import context, handler, internal_util, overhead, sender, settings_static, writer
 
 if TYPE_CHECKING:
     from queue import Queue
@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     from wandb.proto.wandb_internal_pb2 import Record, Result
 
     from .internal_util import RecordLoopThread
+    from .overhead import OverheadProfiler
     from .settings_static import SettingsDict, SettingsStatic
 
 
@@ -104,6 +105,13 @@ def wandb_internal(
     write_record_q: "Queue[Record]" = queue.Queue()
     tracelog.annotate_queue(write_record_q, "write_q")
 
+    profiler = None
+    if _settings._internal_profile:
+        profiler = overhead.OverheadProfiler()
+        profiler.add_gauge("record_q", record_q.qsize)
+        profiler.add_gauge("sender_q", send_record_q.qsize)
+        profiler.add_gauge("writer_q", write_record_q.qsize)
+
     record_sender_thread = SenderThread(
         settings=_settings,
         record_q=send_record_q,
@@ -112,6 +120,7 @@ def wandb_internal(
         interface=publish_interface,
         debounce_interval_ms=5000,
         context_keeper=context_keeper,
+        profiler=profiler,
     )
     threads.append(record_sender_thread)
 
@@ -134,6 +143,7 @@ def wandb_internal(
         writer_q=write_record_q,
         interface=publish_interface,
         context_keeper=context_keeper,
+        profiler=profiler,
     )
     threads.append(record_handler_thread)
 
@@ -162,6 +172,9 @@ def wandb_internal(
     for thread in threads:
         thread.join()
 
+    if profiler is not None:
+        profiler.dump(os.path.join(_settings.log_dir, "debug-internal-profile.json"))
+
     def close_internal_log() -> None:
         root = logging.getLogger("wandb")
         for _handler in root.handlers[:]:
@@ -248,6 +261,7 @@ class HandlerThread(internal_util.RecordLoopThread):
         interface: "InterfaceQueue",
         context_keeper: context.ContextKeeper,
         debounce_interval_ms: "float" = 1000,
+        profiler: Optional["OverheadProfiler"] = None,
     ) -> None:
         super().__init__(
             input_record_q=record_q,
@@ -263,6 +277,7 @@ class HandlerThread(internal_util.RecordLoopThread):
         self._writer_q = writer_q
         self._interface = interface
         self._context_keeper = context_keeper
+        self._profiler = profiler
 
     def _setup(self) -> None:
         self._hm = handler.HandleManager(
@@ -273,6 +288,7 @@ class HandlerThread(internal_util.RecordLoopThread):
             writer_q=self._writer_q,
             interface=self._interface,
             context_keeper=self._context_keeper,
+            profiler=self._profiler,
         )
 
     def _process(self, record: "Record") -> None:
@@ -301,6 +317,7 @@ class SenderThread(internal_util.RecordLoopThread):
         interface: "InterfaceQueue",
         context_keeper: context.ContextKeeper,
         debounce_interval_ms: "float" = 5000,
+        profiler: Optional["OverheadProfiler"] = None,
     ) -> None:
         super().__init__(
             input_record_q=record_q,
@@ -314,6 +331,7 @@ class SenderThread(internal_util.RecordLoopThread):
         self._result_q = result_q
         self._interface = interface
         self._context_keeper = context_keeper
+        self._profiler = profiler
 
     def _setup(self) -> None:
         self._sm = sender.SendManager(
@@ -322,6 +340,7 @@ class SenderThread(internal_util.RecordLoopThread):
             result_q=self._result_q,
             interface=self._interface,
             context_keeper=self._context_keeper,
+            profiler=self._profiler,
         )
 
     def _process(self, record: "Record") -> None:
@@ -0,0 +1,164 @@
+"""Self-profiling of the internal process.
+
+The profiler accumulates wall and CPU time per named section (a handler or
+sender record type, a system metric's sample/aggregate) and tracks the depth of
+the internal queues.  The handler publishes a snapshot as `_wandb/internal/*`
+stats on a throttled interval and the full totals are dumped to a JSON file when
+the internal process exits.
+"""
+
+import contextlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+STATS_PREFIX = "_wandb/internal/"
+
+
+class _Section:
+    __slots__ = ("count", "wall", "cpu", "max_wall")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+
+    def add(self, wall: float, cpu: float) -> None:
+        self.count += 1
+        self.wall += wall
+        self.cpu += cpu
+        if wall > self.max_wall:
+            self.max_wall = wall
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "wall_seconds": self.wall,
+            "cpu_seconds": self.cpu,
+            "max_wall_seconds": self.max_wall,
+        }
+
+
+class OverheadProfiler:
+    """Accumulates time spent per section and samples queue depths.
+
+    Sections are measured from several threads (handler, sender and the system
+    monitor), so all updates happen under a lock.  Two sets of counters are kept:
+    totals for the whole lifetime, which go into the JSON dump, and counters for
+    the current interval, which are reset every time stats are emitted.
+    """
+
+    EMIT_INTERVAL_SECONDS: float = 30.0
+
+    def __init__(self, emit_interval: Optional[float] = None) -> None:
+        self._lock = threading.Lock()
+        self._emit_interval = (
+            self.EMIT_INTERVAL_SECONDS if emit_interval is None else emit_interval
+        )
+        self._sections: Dict[str, _Section] = {}
+        self._interval: Dict[str, _Section] = {}
+        self._gauges: Dict[str, Callable[[], int]] = {}
+        self._gauge_max: Dict[str, int] = {}
+        self._gauge_interval_max: Dict[str, int] = {}
+        self._start_time = time.monotonic()
+        self._last_emit = self._start_time
+
+    @contextlib.contextmanager
+    def measure(self, section: str) -> Iterator[None]:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(
+                section,
+                time.perf_counter() - wall_start,
+                time.thread_time() - cpu_start,
+            )
+
+    def record(self, section: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            for sections in (self._sections, self._interval):
+                entry = sections.get(section)
+                if entry is None:
+                    entry = sections[section] = _Section()
+                entry.add(wall, cpu)
+
+    def add_gauge(self, name: str, fn: Callable[[], int]) -> None:
+        with self._lock:
+            self._gauges[name] = fn
+
+    def remove_gauge(self, name: str) -> None:
+        with self._lock:
+            self._gauges.pop(name, None)
+
+    def sample_gauges(self) -> Dict[str, int]:
+        with self._lock:
+            gauges = list(self._gauges.items())
+        depths = {}
+        for name, fn in gauges:
+            try:
+                depths[name] = int(fn())
+            except Exception:
+                # e.g. multiprocessing queues don't implement qsize() on macOS
+                continue
+        with self._lock:
+            for name, depth in depths.items():
+                for maxima in (self._gauge_max, self._gauge_interval_max):
+                    if depth > maxima.get(name, -1):
+                        maxima[name] = depth
+        return depths
+
+    def due(self) -> bool:
+        return time.monotonic() - self._last_emit >= self._emit_interval
+
+    def stats(self) -> Dict[str, float]:
+        """Return the stats for the interval since the last call and reset it."""
+        depths = self.sample_gauges()
+        now = time.monotonic()
+        with self._lock:
+            elapsed = max(now - self._last_emit, 1e-9)
+            interval, self._interval = self._interval, {}
+            interval_max, self._gauge_interval_max = self._gauge_interval_max, {}
+            self._last_emit = now
+
+        stats: Dict[str, float] = {}
+        for name, section in interval.items():
+            key = STATS_PREFIX + name
+            stats[f"{key}.count"] = section.count
+            stats[f"{key}.wallMs"] = section.wall * 1000
+            stats[f"{key}.cpuMs"] = section.cpu * 1000
+            stats[f"{key}.maxWallMs"] = section.max_wall * 1000
+            # share of the interval spent in this section
+            stats[f"{key}.busyPercent"] = 100 * section.wall / elapsed
+        for name, depth in depths.items():
+            key = STATS_PREFIX + name
+            stats[f"{key}.depth"] = depth
+            stats[f"{key}.maxDepth"] = interval_max.get(name, depth)
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            sections = {
+                name: section.to_dict() for name, section in self._sections.items()
+            }
+            queues = {
+                name: {"max_depth": depth} for name, depth in self._gauge_max.items()
+            }
+        return {
+            "elapsed_seconds": time.monotonic() - self._start_time,
+            "sections": sections,
+            "queues": queues,
+        }
+
+    def dump(self, path: str) -> None:
+        try:
+            with open(path, "w") as f:
+                json.dump(self.summary(), f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Failed to write internal profile to {path}: {e}")
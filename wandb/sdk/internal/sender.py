@@ -63,6 +63,7 @@ if TYPE_CHECKING:
     from wandb.proto.wandb_internal_pb2 import (
         ArtifactManifest,
         ArtifactRecord,
+        HistoryRecord,
         HttpResponse,
         LocalInfo,
         Record,
@@ -72,6 +73,8 @@ if TYPE_CHECKING:
         SummaryRecord,
     )
 
+    from .overhead import OverheadProfiler
+
     if sys.version_info >= (3, 8):
         from typing import Literal
     else:
@@ -227,6 +230,7 @@ class SendManager:
     _send_end_offset: int
     _debounce_config_time: float
     _debounce_status_time: float
+    _profiler: Optional["OverheadProfiler"]
 
     def __init__(
         self,
@@ -235,12 +239,14 @@ class SendManager:
         result_q: "Queue[Result]",
         interface: InterfaceQueue,
         context_keeper: context.ContextKeeper,
+        profiler: Optional["OverheadProfiler"] = None,
     ) -> None:
         self._settings = settings
         self._record_q = record_q
         self._result_q = result_q
         self._interface = interface
         self._context_keeper = context_keeper
+        self._profiler = profiler
 
         self._ds = None
         self._send_record_num = 0
@@ -339,6 +345,11 @@ class SendManager:
             _live_policy_wait_time=None,
             disable_job_creation=False,
             _async_upload_concurrency_limit=None,
+            _file_stream_adaptive_rate=None,
+            _file_stream_compression=None,
+            _file_stream_max_bytes=None,
+            _disable_inotify=None,
+            _tensorboard_bulk=None,
         )
         settings = SettingsStatic(sd)
         record_q: "Queue[Record]" = queue.Queue()
@@ -379,7 +390,13 @@ class SendManager:
         api_context = self._context_keeper.get(context_id)
         try:
             self._api.set_local_context(api_context)
-            send_handler(record)
+            if self._profiler is None:
+                send_handler(record)
+            else:
+                if record_type == "request":
+                    record_type += "." + str(record.request.WhichOneof("request_type"))
+                with self._profiler.measure("send." + record_type):
+                    send_handler(record)
         except ContextCancelledError:
             logger.debug(f"Record cancelled: {record_type}")
             self._context_keeper.release(context_id)
@@ -676,6 +693,8 @@ class SendManager:
                 # TODO(jhr): now is a good time to output pending output lines
                 self._fs.finish(self._exit_code)
                 self._fs = None
+                if self._profiler is not None:
+                    self._profiler.remove_gauge("file_stream_q")
             transition_state()
         elif state == defer.FLUSH_FINAL:
             self._interface.publish_final()
@@ -1094,7 +1113,12 @@ class SendManager:
             self._run.run_id,
             self._run.start_time.ToMicroseconds() / 1e6,
             settings=self._api_settings,
+            compression=self._settings._file_stream_compression,
+            max_bytes=self._settings._file_stream_max_bytes,
+            adaptive_rate=bool(self._settings._file_stream_adaptive_rate),
         )
+        if self._profiler is not None:
+            self._profiler.add_gauge("file_stream_q", self._fs._queue.qsize)
         # Ensure the streaming polices have the proper offsets
         self._fs.set_file_policy("wandb-summary.json", file_stream.SummaryFilePolicy())
         self._fs.set_file_policy(
@@ -1127,14 +1151,14 @@ class SendManager:
             self._run.start_time.ToMicroseconds() / 1e6,
         )
 
-    def _save_history(self, history_dict: Dict[str, Any]) -> None:
+    def _save_history(self, history: "HistoryRecord") -> None:
         if self._fs:
-            self._fs.push(filenames.HISTORY_FNAME, json.dumps(history_dict))
+            self._fs.push(
+                filenames.HISTORY_FNAME, proto_util.jsonl_from_proto_list(history.item)
+            )
 
     def send_history(self, record: "Record") -> None:
-        history = record.history
-        history_dict = proto_util.dict_from_proto_list(history.item)
-        self._save_history(history_dict)
+        self._save_history(record.history)
 
     def _update_summary_record(self, summary: "SummaryRecord") -> None:
         summary_dict = proto_util.dict_from_proto_list(summary.update)
@@ -10,6 +10,10 @@ class SettingsStatic:
     _sync: bool
     _disable_stats: Optional[bool]
     _disable_meta: Optional[bool]
+    _disable_inotify: Optional[bool]
+    _datastore_group_commit: Optional[bool]
+    _datastore_sync_bytes: Optional[int]
+    _datastore_sync_seconds: Optional[float]
     _flow_control: bool
     _start_time: float
     _start_datetime: str
@@ -22,10 +26,13 @@ class SettingsStatic:
     _stats_open_metrics_filters: Union[
         Sequence[str], Mapping[str, Mapping[str, str]], None
     ]
+    _tensorboard_bulk: Optional[bool]
     files_dir: str
     program_relpath: Optional[str]
     log_internal: str
+    log_dir: str
     _internal_check_process: bool
+    _internal_profile: Optional[bool]
     is_local: Optional[bool]
     _colab: Optional[bool]
     _jupyter: Optional[bool]
@@ -65,6 +72,9 @@ class SettingsStatic:
     disable_job_creation: bool
     _async_upload_concurrency_limit: Optional[int]
     _extra_http_headers: Optional[Mapping[str, str]]
+    _file_stream_adaptive_rate: Optional[bool]
+    _file_stream_compression: Optional[str]
+    _file_stream_max_bytes: Optional[int]
     job_source: Optional[str]
 
     # TODO(jhr): clean this up, it is only in SettingsStatic and not in Settings
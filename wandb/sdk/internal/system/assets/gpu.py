@@ -1,7 +1,7 @@
 import logging
 import threading
 from collections import deque
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 try:
     import psutil
@@ -54,68 +54,96 @@ def gpu_in_use_by_this_process(gpu_handle: "GPUHandle", pid: int) -> bool:
     return len(pids_using_device & our_pids) > 0
 
 
-class GPUMemoryUtilization:
-    """GPU memory utilization in percent for each GPU."""
+class GPUDevices:
+    """Samples all the NVML fields used by the GPU metrics in one pass per device.
 
-    # name = "memory_utilization"
-    name = "gpu.{}.memory"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
+    Device handles are looked up once and cached. This is the first of the GPU
+    asset's metrics, so on every tick it refreshes `latest` before the other
+    metrics read from it, and on every publish it refreshes `in_use` before
+    they aggregate.
+    """
+
+    name = "gpu.devices"
+    samples: "Deque[Any]"
 
     def __init__(self, pid: int) -> None:
         self.pid = pid
         self.samples = deque([])
+        self.handles: Optional[List["GPUHandle"]] = None
+        # one dict of field -> value (None if unavailable) per device
+        self.latest: List[Dict[str, Optional[float]]] = []
+        # whether each device is used by the monitored process
+        self.in_use: List[bool] = []
+
+    def _get_handles(self) -> List["GPUHandle"]:
+        if self.handles is None:
+            device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
+            self.handles = [
+                pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
+                for i in range(device_count)
+            ]
+        return self.handles
+
+    @staticmethod
+    def _query(fn: Callable, *args: Any) -> Any:
+        # Not every device supports every field; one failing field
+        # shouldn't prevent the others from being reported.
+        try:
+            return fn(*args)
+        except pynvml.NVMLError:  # type: ignore
+            return None
+
+    def _sample_device(self, handle: "GPUHandle") -> Dict[str, Optional[float]]:
+        rates = self._query(pynvml.nvmlDeviceGetUtilizationRates, handle)  # type: ignore
+        memory_info = self._query(pynvml.nvmlDeviceGetMemoryInfo, handle)  # type: ignore
+        power_usage = self._query(pynvml.nvmlDeviceGetPowerUsage, handle)  # type: ignore
+        power_limit = self._query(
+            pynvml.nvmlDeviceGetEnforcedPowerLimit, handle  # type: ignore
+        )
+        return {
+            "memory": rates.memory if rates is not None else None,
+            "gpu": rates.gpu if rates is not None else None,
+            "memoryAllocated": memory_info.used / memory_info.total * 100
+            if memory_info is not None
+            else None,
+            "temp": self._query(
+                pynvml.nvmlDeviceGetTemperature,  # type: ignore
+                handle,
+                pynvml.NVML_TEMPERATURE_GPU,
+            ),
+            "powerWatts": power_usage / 1000 if power_usage is not None else None,
+            "powerPercent": power_usage / power_limit * 100
+            if power_usage is not None and power_limit
+            else None,
+        }
 
     def sample(self) -> None:
-        memory_utilization_rate = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            memory_utilization_rate.append(
-                pynvml.nvmlDeviceGetUtilizationRates(handle).memory  # type: ignore
-            )
-        self.samples.append(memory_utilization_rate)
+        self.latest = [self._sample_device(handle) for handle in self._get_handles()]
 
     def clear(self) -> None:
-        self.samples.clear()
+        pass
 
     def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
-
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+        self.in_use = [
+            gpu_in_use_by_this_process(handle, self.pid)
+            for handle in self._get_handles()
+        ]
+        return {}
 
-        return stats
 
+class _GPUDeviceMetric:
+    """A per-device metric read from the latest `GPUDevices` sample."""
 
-class GPUMemoryAllocated:
-    """GPU memory allocated in percent for each GPU."""
+    name: str
+    field: str
+    samples: "Deque[List[Optional[float]]]"
 
-    # name = "memory_allocated"
-    name = "gpu.{}.memoryAllocated"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
-
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
+    def __init__(self, devices: GPUDevices) -> None:
+        self.devices = devices
         self.samples = deque([])
 
     def sample(self) -> None:
-        memory_allocated = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)  # type: ignore
-            memory_allocated.append(memory_info.used / memory_info.total * 100)
-        self.samples.append(memory_allocated)
+        self.samples.append([device[self.field] for device in self.devices.latest])
 
     def clear(self) -> None:
         self.samples.clear()
@@ -124,183 +152,63 @@ class GPUMemoryAllocated:
         if not self.samples:
             return {}
         stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
+        for i in range(len(self.devices.latest)):
+            samples = [
+                sample[i]
+                for sample in self.samples
+                if i < len(sample) and sample[i] is not None
+            ]
+            if not samples:
+                continue
             aggregate = aggregate_mean(samples)
             stats[self.name.format(i)] = aggregate
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
+            if i < len(self.devices.in_use) and self.devices.in_use[i]:
                 stats[self.name.format(f"process.{i}")] = aggregate
 
         return stats
 
 
-class GPUUtilization:
-    """GPU utilization in percent for each GPU."""
+class GPUMemoryUtilization(_GPUDeviceMetric):
+    """GPU memory utilization in percent for each GPU."""
 
-    # name = "gpu_utilization"
-    name = "gpu.{}.gpu"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
+    name = "gpu.{}.memory"
+    field = "memory"
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
 
-    def sample(self) -> None:
-        gpu_utilization_rate = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            gpu_utilization_rate.append(
-                pynvml.nvmlDeviceGetUtilizationRates(handle).gpu  # type: ignore
-            )
-        self.samples.append(gpu_utilization_rate)
+class GPUMemoryAllocated(_GPUDeviceMetric):
+    """GPU memory allocated in percent for each GPU."""
 
-    def clear(self) -> None:
-        self.samples.clear()
+    name = "gpu.{}.memoryAllocated"
+    field = "memoryAllocated"
 
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
+class GPUUtilization(_GPUDeviceMetric):
+    """GPU utilization in percent for each GPU."""
 
-        return stats
+    name = "gpu.{}.gpu"
+    field = "gpu"
 
 
-class GPUTemperature:
+class GPUTemperature(_GPUDeviceMetric):
     """GPU temperature in Celsius for each GPU."""
 
-    # name = "gpu_temperature"
     name = "gpu.{}.temp"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
-
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
-
-    def sample(self) -> None:
-        temperature = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            temperature.append(
-                pynvml.nvmlDeviceGetTemperature(  # type: ignore
-                    handle,
-                    pynvml.NVML_TEMPERATURE_GPU,
-                )
-            )
-        self.samples.append(temperature)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
-
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
-
-        return stats
+    field = "temp"
 
 
-class GPUPowerUsageWatts:
+class GPUPowerUsageWatts(_GPUDeviceMetric):
     """GPU power usage in Watts for each GPU."""
 
     name = "gpu.{}.powerWatts"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
+    field = "powerWatts"
 
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
-
-    def sample(self) -> None:
-        power_usage = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            power_watts = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # type: ignore
-            power_usage.append(power_watts)
-        self.samples.append(power_usage)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
 
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
-
-        return stats
-
-
-class GPUPowerUsagePercent:
+class GPUPowerUsagePercent(_GPUDeviceMetric):
     """GPU power usage in percent for each GPU."""
 
     name = "gpu.{}.powerPercent"
-    # samples: Deque[Tuple[datetime.datetime, float]]
-    samples: "Deque[List[float]]"
-
-    def __init__(self, pid: int) -> None:
-        self.pid = pid
-        self.samples = deque([])
-
-    def sample(self) -> None:
-        power_usage = []
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            power_watts = pynvml.nvmlDeviceGetPowerUsage(handle)  # type: ignore
-            power_capacity_watts = pynvml.nvmlDeviceGetEnforcedPowerLimit(handle)  # type: ignore
-            power_usage.append((power_watts / power_capacity_watts) * 100)
-        self.samples.append(power_usage)
-
-    def clear(self) -> None:
-        self.samples.clear()
-
-    def aggregate(self) -> dict:
-        if not self.samples:
-            return {}
-        stats = {}
-        device_count = pynvml.nvmlDeviceGetCount()  # type: ignore
-        for i in range(device_count):
-            samples = [sample[i] for sample in self.samples]
-            aggregate = aggregate_mean(samples)
-            stats[self.name.format(i)] = aggregate
-
-            handle = pynvml.nvmlDeviceGetHandleByIndex(i)  # type: ignore
-            if gpu_in_use_by_this_process(handle, self.pid):
-                stats[self.name.format(f"process.{i}")] = aggregate
-
-        return stats
+    field = "powerPercent"
 
 
 @asset_registry.register
@@ -312,13 +220,15 @@ class GPU:
         shutdown_event: threading.Event,
     ) -> None:
         self.name = self.__class__.__name__.lower()
+        devices = GPUDevices(settings._stats_pid)
         self.metrics: List[Metric] = [
-            GPUMemoryAllocated(settings._stats_pid),
-            GPUMemoryUtilization(settings._stats_pid),
-            GPUUtilization(settings._stats_pid),
-            GPUTemperature(settings._stats_pid),
-            GPUPowerUsageWatts(settings._stats_pid),
-            GPUPowerUsagePercent(settings._stats_pid),
+            devices,
+            GPUMemoryAllocated(devices),
+            GPUMemoryUtilization(devices),
+            GPUUtilization(devices),
+            GPUTemperature(devices),
+            GPUPowerUsageWatts(devices),
+            GPUPowerUsagePercent(devices),
         ]
         self.metrics_monitor = MetricsMonitor(
             self.name,
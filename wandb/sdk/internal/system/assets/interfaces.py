@@ -2,6 +2,7 @@ import datetime
 import logging
 import sys
 import threading
+from collections import deque
 from typing import TYPE_CHECKING, Any, List, Optional, TypeVar
 
 if sys.version_info >= (3, 8):
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
 
     from wandb.proto.wandb_telemetry_pb2 import TelemetryRecord
     from wandb.sdk.interface.interface import FilesDict
+    from wandb.sdk.internal.overhead import OverheadProfiler
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 import psutil
@@ -116,6 +118,7 @@ class MetricsMonitor:
         self._interface = interface
         self._process: Optional[threading.Thread] = None
         self._shutdown_event: threading.Event = shutdown_event
+        self.profiler: Optional["OverheadProfiler"] = None
 
         self.sampling_interval: float = float(
             max(
@@ -129,19 +132,34 @@ class MetricsMonitor:
             30, max(1, settings._stats_samples_to_average)
         )
 
+        # Samples are cleared on every publish, so a ring buffer holding one
+        # aggregation window is all any metric needs.
+        for metric in self.metrics:
+            samples = getattr(metric, "samples", None)
+            if isinstance(samples, deque) and samples.maxlen is None:
+                metric.samples = deque(samples, maxlen=self.samples_to_aggregate)
+
+    def sample(self) -> None:
+        """Take one sample of each metric."""
+        for metric in self.metrics:
+            try:
+                if self.profiler is None:
+                    metric.sample()
+                else:
+                    with self.profiler.measure(f"stats.{metric.name}.sample"):
+                        metric.sample()
+            except psutil.NoSuchProcess:
+                logger.info(f"Process {metric.name} has exited.")
+                self._shutdown_event.set()
+                break
+            except Exception as e:
+                logger.error(f"Failed to sample metric: {e}")
+
     def monitor(self) -> None:
         """Poll the Asset metrics."""
         while not self._shutdown_event.is_set():
             for _ in range(self.samples_to_aggregate):
-                for metric in self.metrics:
-                    try:
-                        metric.sample()
-                    except psutil.NoSuchProcess:
-                        logger.info(f"Process {metric.name} has exited.")
-                        self._shutdown_event.set()
-                        break
-                    except Exception as e:
-                        logger.error(f"Failed to sample metric: {e}")
+                self.sample()
                 self._shutdown_event.wait(self.sampling_interval)
                 if self._shutdown_event.is_set():
                     break
@@ -152,7 +170,11 @@ class MetricsMonitor:
         aggregated_metrics = {}
         for metric in self.metrics:
             try:
-                serialized_metric = metric.aggregate()
+                if self.profiler is None:
+                    serialized_metric = metric.aggregate()
+                else:
+                    with self.profiler.measure(f"stats.{metric.name}.aggregate"):
+                        serialized_metric = metric.aggregate()
                 aggregated_metrics.update(serialized_metric)
                 # aggregated_metrics = wandb.util.merge_dicts(
                 #     aggregated_metrics, metric.serialize()
@@ -172,15 +194,23 @@ class MetricsMonitor:
         except Exception as e:
             logger.error(f"Failed to publish metrics: {e}")
 
+    def setup(self) -> None:
+        for metric in self.metrics:
+            if isinstance(metric, SetupTeardown):
+                metric.setup()
+
+    def teardown(self) -> None:
+        for metric in self.metrics:
+            if isinstance(metric, SetupTeardown):
+                metric.teardown()
+
     def start(self) -> None:
         if (self._process is not None) or self._shutdown_event.is_set():
             return None
 
         thread_name = f"{self.asset_name[:15]}"  # thread names are limited to 15 chars
         try:
-            for metric in self.metrics:
-                if isinstance(metric, SetupTeardown):
-                    metric.setup()
+            self.setup()
             self._process = threading.Thread(
                 target=self.monitor,
                 daemon=True,
@@ -200,9 +230,7 @@ class MetricsMonitor:
         try:
             self._process.join()
             logger.info(f"Joined {thread_name} monitor")
-            for metric in self.metrics:
-                if isinstance(metric, SetupTeardown):
-                    metric.teardown()
+            self.teardown()
         except Exception as e:
             logger.warning(f"Failed to finish {thread_name} monitoring: {e}")
         finally:
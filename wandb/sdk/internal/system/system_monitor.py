@@ -1,16 +1,18 @@
 import logging
 import queue
 import threading
+import time
 from typing import TYPE_CHECKING, List, Optional
 
 from .assets.asset_registry import asset_registry
-from .assets.interfaces import Asset, Interface
+from .assets.interfaces import Asset, Interface, MetricsMonitor
 from .assets.open_metrics import OpenMetrics
 from .system_info import SystemInfo
 
 if TYPE_CHECKING:
     from wandb.proto.wandb_telemetry_pb2 import TelemetryRecord
     from wandb.sdk.interface.interface import FilesDict
+    from wandb.sdk.internal.overhead import OverheadProfiler
     from wandb.sdk.internal.settings_static import SettingsStatic
 
 
@@ -34,14 +36,13 @@ class AssetInterface:
 
 class SystemMonitor:
     # SystemMonitor is responsible for managing system metrics data.
-
-    # if joining assets, wait for publishing_interval times this many seconds
-    PUBLISHING_INTERVAL_DELAY_FACTOR = 2
+    # All assets are sampled on a shared tick by a single thread.
 
     def __init__(
         self,
         settings: "SettingsStatic",
         interface: "Interface",
+        profiler: Optional["OverheadProfiler"] = None,
     ) -> None:
         self._shutdown_event: threading.Event = threading.Event()
         self._process: Optional[threading.Thread] = None
@@ -57,7 +58,7 @@ class SystemMonitor:
         # collect the names of the metrics to be displayed in the UI from the first stats message.
 
         # compute the global publishing interval if _stats_join_assets is requested
-        sampling_interval: float = float(
+        self.sampling_interval: float = float(
             max(
                 0.1,
                 self.settings._stats_sample_rate_seconds,
@@ -65,10 +66,12 @@ class SystemMonitor:
         )  # seconds
         # The number of samples to aggregate (e.g. average or compute max/min etc.)
         # before publishing; defaults to 15; valid range: [1:30]
-        samples_to_aggregate: int = min(
+        self.samples_to_aggregate: int = min(
             30, max(1, self.settings._stats_samples_to_average)
         )
-        self.publishing_interval: float = sampling_interval * samples_to_aggregate
+        self.publishing_interval: float = (
+            self.sampling_interval * self.samples_to_aggregate
+        )
         self.join_assets: bool = self.settings._stats_join_assets
 
         self.backend_interface = interface
@@ -82,6 +85,11 @@ class SystemMonitor:
         # OpenMetrics/Prometheus-compatible endpoints
         self.assets.extend(self._get_open_metrics_assets())
 
+        # self-profiling: time every metric's sample() and aggregate()
+        if profiler is not None:
+            for asset in self.assets:
+                asset.metrics_monitor.profiler = profiler
+
         # static system info, both hardware and software
         self.system_info: SystemInfo = SystemInfo(
             settings=self.settings, interface=interface
@@ -141,39 +149,64 @@ class SystemMonitor:
             telemetry_record = self.asset_interface.telemetry_queue.get()
             self.backend_interface._publish_telemetry(telemetry_record)
 
-    def _start(self) -> None:
-        logger.info("Starting system asset monitoring threads")
+    def _setup_monitors(self) -> List[MetricsMonitor]:
+        monitors = []
         for asset in self.assets:
-            asset.start()
-
-        # compatibility mode: join stats from different assets before publishing
-        if not (self.join_assets and self.asset_interface is not None):
-            return None
+            if not asset.metrics:
+                continue
+            try:
+                asset.metrics_monitor.setup()
+            except Exception as e:
+                logger.warning(f"Failed to start {asset.name} monitoring: {e}")
+                continue
+            monitors.append(asset.metrics_monitor)
+        return monitors
 
-        # give the assets a chance to accumulate and publish their first stats
-        # this will provide a constant offset for the following accumulation events below
-        self._shutdown_event.wait(
-            self.publishing_interval * self.PUBLISHING_INTERVAL_DELAY_FACTOR
-        )
+    def _publish(self, monitors: List[MetricsMonitor]) -> None:
+        for monitor in monitors:
+            monitor.publish()
+        # compatibility mode: join stats from different assets before publishing.
+        # Every asset has just published, so the queue holds one full round.
+        self.publish_telemetry()
+        self.aggregate_and_publish_asset_metrics()
 
-        logger.debug("Starting system metrics aggregation loop")
+    def _start(self) -> None:
+        logger.info("Starting system asset monitoring")
+        monitors = self._setup_monitors()
 
+        num_samples = 0
+        next_tick = time.monotonic()
         while not self._shutdown_event.is_set():
-            self.publish_telemetry()
-            self.aggregate_and_publish_asset_metrics()
-            self._shutdown_event.wait(self.publishing_interval)
-
-        logger.debug("Finished system metrics aggregation loop")
-
-        # try to publish the last batch of metrics + telemetry
+            for monitor in monitors:
+                monitor.sample()
+            num_samples += 1
+            if num_samples == self.samples_to_aggregate:
+                self._publish(monitors)
+                num_samples = 0
+
+            # Keep ticks on a fixed grid so that sampling time doesn't add drift;
+            # if we fell behind, skip the missed ticks rather than bursting.
+            next_tick += self.sampling_interval
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now
+            self._shutdown_event.wait(next_tick - now)
+
+        logger.debug("Finished system metrics sampling loop")
+
+        # try to publish the last (partial) batch of metrics + telemetry
         try:
             logger.debug("Publishing last batch of metrics")
-            # publish telemetry
-            self.publish_telemetry()
-            self.aggregate_and_publish_asset_metrics()
+            self._publish(monitors)
         except Exception as e:
             logger.error(f"Error publishing last batch of metrics: {e}")
 
+        for monitor in monitors:
+            try:
+                monitor.teardown()
+            except Exception as e:
+                logger.warning(f"Failed to finish {monitor.asset_name} monitoring: {e}")
+
     def start(self) -> None:
         self._shutdown_event.clear()
         if self._process is not None:
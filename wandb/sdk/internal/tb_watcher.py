@@ -1,10 +1,13 @@
 """tensorboard watcher."""
 
+import collections
 import glob
+import heapq
 import logging
 import os
 import queue
 import socket
+import struct
 import sys
 import threading
 import time
@@ -37,6 +40,10 @@ if TYPE_CHECKING:
 SHUTDOWN_DELAY = 5
 ERROR_DELAY = 5
 REMOTE_FILE_TOKEN = "://"
+# In bulk mode, the most events a directory watcher queues as one batch
+BULK_BATCH_EVENTS = 10000
+# and the most bytes of a tfevents file it reads at once
+BULK_READ_BYTES = 64 * 1024 * 1024
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +104,56 @@ def is_tfevents_file_created_by(path: str, hostname: str, start_time: float) ->
     return created_time >= int(start_time)
 
 
+class _BulkRecordIterator:
+    """Iterate over the records of a local tfevents file, reading it in bulk.
+
+    Tensorboard's reader issues a few small reads per record and checks CRCs in
+    Python. This reads everything appended since the last call at once and splits
+    it into records using their length headers, without checking the CRCs. It
+    stops at the last complete record and continues from there when next called.
+    """
+
+    # uint64 data length, uint32 masked CRC of the length
+    HEADER_BYTES = 12
+    # uint32 masked CRC of the data
+    FOOTER_BYTES = 4
+
+    def __init__(self, file_path: str) -> None:
+        self._file_path = file_path
+        self._offset = 0
+        self._buffer = b""
+        self._records: "collections.deque[bytes]" = collections.deque()
+
+    def __iter__(self) -> "_BulkRecordIterator":
+        return self
+
+    def __next__(self) -> bytes:
+        if not self._records:
+            self._read()
+            if not self._records:
+                raise StopIteration
+        return self._records.popleft()
+
+    def _read(self) -> None:
+        with open(self._file_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(BULK_READ_BYTES)
+        if not data:
+            return
+        self._offset += len(data)
+        buffer = self._buffer + data if self._buffer else data
+        offset = 0
+        while len(buffer) - offset >= self.HEADER_BYTES:
+            (length,) = struct.unpack_from("<Q", buffer, offset)
+            start = offset + self.HEADER_BYTES
+            end = start + length + self.FOOTER_BYTES
+            if end > len(buffer):
+                break
+            self._records.append(buffer[start : start + length])
+            offset = end
+        self._buffer = buffer[offset:]
+
+
 class TBWatcher:
     _logdirs: "Dict[str, TBDirWatcher]"
     _watcher_queue: "PriorityQueue"
@@ -208,6 +265,8 @@ class TBDirWatcher:
         self._hostname = socket.gethostname()
         self._force = force
         self._process_events_lock = threading.Lock()
+        # read tfevents files in bulk and queue their events in batches
+        self._bulk = bool(tbwatcher._settings._tensorboard_bulk)
 
     def start(self) -> None:
         self._thread.start()
@@ -229,6 +288,7 @@ class TBDirWatcher:
         """Incredibly hacky class generator to optionally save / prefix tfevent files."""
         _loader_interface = self._tbwatcher._interface
         _loader_settings = self._tbwatcher._settings
+        bulk = self._bulk
         try:
             from tensorboard.backend.event_processing import event_file_loader
         except ImportError:
@@ -237,6 +297,13 @@ class TBDirWatcher:
         class EventFileLoader(event_file_loader.EventFileLoader):
             def __init__(self, file_path: str) -> None:
                 super().__init__(file_path)
+                # tensorboard versions that read through a record iterator
+                if (
+                    bulk
+                    and REMOTE_FILE_TOKEN not in file_path
+                    and hasattr(self, "_iterator")
+                ):
+                    self._iterator = _BulkRecordIterator(file_path)
                 if save:
                     if REMOTE_FILE_TOKEN in file_path:
                         logger.warning(
@@ -258,9 +325,16 @@ class TBDirWatcher:
 
         return EventFileLoader
 
-    def _process_events(self, shutdown_call: bool = False) -> None:
+    def _process_events(self, shutdown_call: bool = False) -> bool:
+        """Load the events written since the last call.
+
+        Returns:
+            Whether any events were loaded, only tracked in bulk mode.
+        """
         try:
             with self._process_events_lock:
+                if self._bulk:
+                    return self._process_event_batches()
                 for event in self._generator.Load():
                     self.process_event(event)
         except (
@@ -273,6 +347,22 @@ class TBDirWatcher:
             logger.debug("Encountered tensorboard directory watcher error: %s", e)
             if not self._shutdown.is_set() and not shutdown_call:
                 time.sleep(ERROR_DELAY)
+        return False
+
+    def _process_event_batches(self) -> bool:
+        loaded = False
+        batch: List["ProtoEvent"] = []
+        for event in self._generator.Load():
+            loaded = True
+            if not self._track_event(event):
+                continue
+            batch.append(event)
+            if len(batch) >= BULK_BATCH_EVENTS:
+                self._queue.put(EventBatch(batch, self._namespace))
+                batch = []
+        if batch:
+            self._queue.put(EventBatch(batch, self._namespace))
+        return loaded
 
     def _thread_except_body(self) -> None:
         try:
@@ -282,28 +372,33 @@ class TBDirWatcher:
             raise e
 
     def _thread_body(self) -> None:
-        """Check for new events every second."""
+        """Check for new events every second, or right away in bulk mode if busy."""
         shutdown_time: Optional[float] = None
         while True:
-            self._process_events()
+            loaded = self._process_events()
             if self._shutdown.is_set():
                 now = time.time()
                 if not shutdown_time:
                     shutdown_time = now + SHUTDOWN_DELAY
                 elif now > shutdown_time:
                     break
-            time.sleep(1)
+            if not loaded:
+                time.sleep(1)
 
     def process_event(self, event: "ProtoEvent") -> None:
         # print("\nEVENT:::", self._logdir, self._namespace, event, "\n")
+        if self._track_event(event):
+            self._queue.put(Event(event, self._namespace))
+
+    def _track_event(self, event: "ProtoEvent") -> bool:
+        """Note the event's metadata and return whether it has a summary to log."""
         if self._first_event_timestamp is None:
             self._first_event_timestamp = event.wall_time
 
         if event.HasField("file_version"):
             self._file_version = event.file_version
 
-        if event.HasField("summary"):
-            self._queue.put(Event(event, self._namespace))
+        return event.HasField("summary")
 
     def shutdown(self) -> None:
         self._process_events(shutdown_call=True)
@@ -328,6 +423,18 @@ class Event:
         return False
 
 
+class EventBatch:
+    """Events loaded in bulk from one directory, in the order they were written."""
+
+    def __init__(self, events: List["ProtoEvent"], namespace: Optional[str]):
+        self.events = events
+        self.namespace = namespace
+        self.created_at = time.time()
+
+    def __lt__(self, other: "EventBatch") -> bool:
+        return self.events[0].wall_time < other.events[0].wall_time
+
+
 class TBEventConsumer:
     """Consume tfevents from a priority queue.
 
@@ -350,6 +457,8 @@ class TBEventConsumer:
         self._shutdown = threading.Event()
         self.tb_history = TBHistory()
         self._delay = delay
+        # the queue holds EventBatches, whose rows are published in batches
+        self._bulk = bool(settings._tensorboard_bulk)
 
         # This is a bit of a hack to get file saving to work as it does in the user
         # process. Since we don't have a real run object, we have to define the
@@ -370,6 +479,9 @@ class TBEventConsumer:
         self._delay = 0
         self._shutdown.set()
         self._thread.join()
+        if self._bulk:
+            self._handle_batches(self._drain())
+            return
         while not self._queue.empty():
             event = self._queue.get(True, 1)
             if event:
@@ -403,7 +515,9 @@ class TBEventConsumer:
                 event = None
                 if self._shutdown.is_set():
                     break
-            if event:
+            if event and self._bulk:
+                self._handle_batches([event] + self._drain())
+            elif event:
                 self._handle_event(event, history=self.tb_history)
                 items = self.tb_history._get_and_reset()
                 for item in items:
@@ -413,9 +527,35 @@ class TBEventConsumer:
         # flush uncommitted data
         self.tb_history._flush()
         items = self.tb_history._get_and_reset()
+        if self._bulk:
+            self._save_rows(items)
+            return
         for item in items:
             self._save_row(item)
 
+    def _drain(self) -> List[EventBatch]:
+        batches = []
+        while True:
+            try:
+                batches.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batches
+
+    def _handle_batches(self, batches: List[EventBatch]) -> None:
+        """Log the events of all the batches in wall time order."""
+        events = heapq.merge(
+            *(
+                [(event, batch.namespace) for event in batch.events]
+                for batch in batches
+            ),
+            key=lambda item: item[0].wall_time,
+        )
+        for event, namespace in events:
+            wandb.tensorboard._log(
+                event, step=event.step, namespace=namespace, history=self.tb_history
+            )
+        self._save_rows(self.tb_history._get_and_reset())
+
     def _handle_event(
         self, event: "ProtoEvent", history: Optional["TBHistory"] = None
     ) -> None:
@@ -427,6 +567,17 @@ class TBEventConsumer:
         )
 
     def _save_row(self, row: "HistoryDict") -> None:
+        self._tbwatcher._interface.publish_history(
+            self._prepare_row(row), run=self._internal_run, publish_step=False
+        )
+
+    def _save_rows(self, rows: "List[HistoryDict]") -> None:
+        if rows:
+            self._tbwatcher._interface.publish_history_batch(
+                [self._prepare_row(row) for row in rows], run=self._internal_run
+            )
+
+    def _prepare_row(self, row: "HistoryDict") -> "HistoryDict":
         chart_keys = set()
         for k in row:
             if isinstance(row[k], CustomChart):
@@ -440,10 +591,7 @@ class TBEventConsumer:
 
         for k in chart_keys:
             row[f"{k}_table"] = row.pop(k)
-
-        self._tbwatcher._interface.publish_history(
-            row, run=self._internal_run, publish_step=False
-        )
+        return row
 
 
 class TBHistory:
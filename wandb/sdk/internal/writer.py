@@ -67,7 +67,11 @@ class WriteManager:
         )
 
     def open(self) -> None:
-        self._ds = datastore.DataStore()
+        self._ds = datastore.DataStore(
+            group_commit=bool(self._settings._datastore_group_commit),
+            sync_bytes=self._settings._datastore_sync_bytes,
+            sync_seconds=self._settings._datastore_sync_seconds,
+        )
         self._ds.open_for_write(self._settings.sync_file)
         self._flow_control = flow_control.FlowControl(
             settings=self._settings,
@@ -203,4 +207,5 @@ class WriteManager:
         # self._context_keeper._debug_print_orphans(print_to_stdout=self._settings._debug)
 
     def debounce(self) -> None:
-        pass
+        if self._ds:
+            self._ds.poll()
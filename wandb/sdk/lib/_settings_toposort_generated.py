@@ -19,6 +19,10 @@ _Setting = Literal[
     "_config_dict",
     "_console",
     "_cuda",
+    "_datastore_group_commit",
+    "_datastore_sync_bytes",
+    "_datastore_sync_seconds",
+    "_disable_inotify",
     "_disable_meta",
     "_disable_service",
     "_disable_stats",
@@ -26,9 +30,13 @@ _Setting = Literal[
     "_except_exit",
     "_executable",
     "_extra_http_headers",
+    "_file_stream_adaptive_rate",
+    "_file_stream_compression",
+    "_file_stream_max_bytes",
     "_flow_control_custom",
     "_flow_control_disabled",
     "_internal_check_process",
+    "_internal_profile",
     "_internal_queue_timeout",
     "_ipython",
     "_jupyter",
@@ -49,8 +57,11 @@ _Setting = Literal[
     "_python",
     "_runqueue_item_id",
     "_save_requirements",
+    "_service_coalesce_seconds",
+    "_service_shared",
     "_service_transport",
     "_service_wait",
+    "_service_workers",
     "_start_datetime",
     "_start_time",
     "_stats_pid",
@@ -60,6 +71,7 @@ _Setting = Literal[
     "_stats_neuron_monitor_config_path",
     "_stats_open_metrics_endpoints",
     "_stats_open_metrics_filters",
+    "_tensorboard_bulk",
     "_tmp_code_dir",
     "_tracelog",
     "_unsaved_keys",
@@ -157,7 +169,13 @@ _Setting = Literal[
 
 SETTINGS_TOPOLOGICALLY_SORTED: Final[Tuple[_Setting, ...]] = (
     "_async_upload_concurrency_limit",
+    "_datastore_sync_bytes",
+    "_datastore_sync_seconds",
+    "_file_stream_compression",
+    "_file_stream_max_bytes",
+    "_service_coalesce_seconds",
     "_service_wait",
+    "_service_workers",
     "_stats_sample_rate_seconds",
     "_stats_samples_to_average",
     "anonymous",
@@ -28,6 +28,10 @@ def toggle_button(what="run"):
 
 
 def _get_python_type() -> PythonType:
+    # an IPython shell has always imported IPython already, and importing it
+    # just to find out is slow
+    if "IPython" not in sys.modules:
+        return "python"
     try:
         from IPython import get_ipython  # type: ignore
 
@@ -20,6 +20,25 @@ def dict_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> Dict[st
     return {item.key: json.loads(item.value_json) for item in obj_list}
 
 
+def jsonl_from_proto_list(obj_list: "RepeatedCompositeFieldContainer") -> str:
+    """Assemble a json object from the already encoded values of obj_list.
+
+    Equivalent to `json.dumps(dict_from_proto_list(obj_list))` without decoding
+    and re-encoding every value.
+    """
+    keys = [item.key for item in obj_list]
+    if len(set(keys)) != len(keys):
+        # duplicate keys: the last value wins, same as building a dict
+        return json.dumps(dict_from_proto_list(obj_list))
+    return (
+        "{"
+        + ", ".join(
+            f"{json.dumps(key)}: {item.value_json}" for key, item in zip(keys, obj_list)
+        )
+        + "}"
+    )
+
+
 def _result_from_record(record: "pb.Record") -> "pb.Result":
     result = pb.Result(uuid=record.uuid, control=record.control)
     return result
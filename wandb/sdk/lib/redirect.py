@@ -6,6 +6,7 @@ try:
 except ImportError:  # windows
     pty = tty = termios = fcntl = None  # type: ignore
 
+import bisect
 import itertools
 import logging
 import os
@@ -16,43 +17,9 @@ import struct
 import sys
 import threading
 import time
-from collections import defaultdict
 
 import wandb
 
-
-class _Numpy:  # fallback in case numpy is not available
-    def where(self, x):
-        return ([i for i in range(len(x)) if x[i]],)
-
-    def diff(self, x):
-        return [x[i + 1] - x[i] for i in range(len(x) - 1)]
-
-    def arange(self, x):
-        class Arr(list):
-            def __getitem__(self, s):
-                if isinstance(s, slice):
-                    self._start = s.start
-                    return self
-                return super().__getitem__(s)
-
-            def __getslice__(self, i, j):
-                self._start = i
-                return self
-
-            def __iadd__(self, i):  # type: ignore
-                for j in range(self._start, len(self)):
-                    self[j] += i
-
-        return Arr(range(x))
-
-
-try:
-    import numpy as np  # type: ignore
-except ImportError:
-    np = _Numpy()
-
-
 logger = logging.getLogger("wandb")
 
 _redirects = {"stdout": None, "stderr": None}
@@ -104,7 +71,11 @@ def _get_char(code):
 
 
 class Char:
-    """Class encapsulating a single character, its foreground, background and style attributes."""
+    """Class encapsulating the foreground, background and style attributes of a character.
+
+    Only the cursor holds a `Char`, for the attributes newly written text takes
+    on; the screen buffer keeps them as run-length spans (see `_Line`).
+    """
 
     __slots__ = (
         "data",
@@ -161,6 +132,19 @@ class Char:
                 attrs[k] = self[k]
         return self.__class__(**attrs)
 
+    @property
+    def style(self):
+        return (
+            self.fg,
+            self.bg,
+            self.bold,
+            self.italics,
+            self.underscore,
+            self.blink,
+            self.strikethrough,
+            self.reverse,
+        )
+
     def __eq__(self, other):
         for k in self.__slots__:
             if self[k] != other[k]:
@@ -168,7 +152,117 @@ class Char:
         return True
 
 
-_defchar = Char()
+_DEFAULT_STYLE = Char().style
+_STYLE_ATTRS = Char.__slots__[3:]
+
+
+def _get_style_codes(prev_style, style):
+    """Return the escape codes switching from `prev_style` to `style`."""
+    codes = []
+    if style[0] != prev_style[0]:
+        codes.append(_get_char(style[0]))
+    if style[1] != prev_style[1]:
+        codes.append(_get_char(style[1]))
+    for k, prev, curr in zip(_STYLE_ATTRS, prev_style[2:], style[2:]):
+        if curr != prev:
+            codes.append(_get_char(ANSI_STYLES_REV[k if curr else "/" + k]))
+    return "".join(codes)
+
+
+class _Line:
+    """A line of the screen buffer.
+
+    The characters are kept as a plain string and their colors and styles as
+    run-length spans `(start, end, style)`. Cells with the default style aren't
+    covered by any span, so a line of plain text has no spans at all.
+    """
+
+    __slots__ = ("text", "spans")
+
+    def __init__(self):
+        self.text = ""
+        self.spans = []
+
+    def __len__(self):
+        # Trailing blanks only count if they are styled.
+        n = len(self.text.rstrip(" "))
+        if self.spans and self.spans[-1][1] > n:
+            n = self.spans[-1][1]
+        return n
+
+    def _clear_spans(self, start, end):
+        if not self.spans:
+            return
+        spans = []
+        for s, e, style in self.spans:
+            if e <= start or s >= end:
+                spans.append((s, e, style))
+                continue
+            if s < start:
+                spans.append((s, start, style))
+            if e > end:
+                spans.append((end, e, style))
+        self.spans = spans
+
+    def write(self, x, data, style):
+        if x < 0:
+            # Cells left of the screen are never displayed.
+            data = data[-x:]
+            x = 0
+        if not data:
+            return
+        end = x + len(data)
+        text = self.text
+        if x > len(text):
+            text += " " * (x - len(text))
+        self.text = text[:x] + data + text[end:]
+        self._clear_spans(x, end)
+        if style == _DEFAULT_STYLE:
+            return
+        spans = self.spans
+        ndx = bisect.bisect_left(spans, (x,))
+        # Merge with the neighbouring spans if they have the same style.
+        if ndx > 0 and spans[ndx - 1][1] == x and spans[ndx - 1][2] == style:
+            ndx -= 1
+            x = spans.pop(ndx)[0]
+        if ndx < len(spans) and spans[ndx][0] == end and spans[ndx][2] == style:
+            end = spans.pop(ndx)[1]
+        spans.insert(ndx, (x, end, style))
+
+    def erase(self, start=0, end=None):
+        start = max(start, 0)
+        text = self.text
+        if end is None or end >= len(text):
+            end = len(text)
+            self.text = text[:start]
+        elif end > start:
+            self.text = text[:start] + " " * (end - start) + text[end:]
+        self._clear_spans(start, end)
+
+    def render(self):
+        n = len(self)
+        text = self.text[:n]
+        if not self.spans:
+            return text
+        out = []
+        prev_style = _DEFAULT_STYLE
+        pos = 0
+        for s, e, style in self.spans:
+            if s > pos:
+                out.append(_get_style_codes(prev_style, _DEFAULT_STYLE))
+                out.append(text[pos:s])
+                prev_style = _DEFAULT_STYLE
+            out.append(_get_style_codes(prev_style, style))
+            out.append(text[s:e])
+            prev_style = style
+            pos = e
+        if pos < n:
+            out.append(_get_style_codes(prev_style, _DEFAULT_STYLE))
+            out.append(text[pos:])
+        return "".join(out)
+
+
+_empty_line = _Line()
 
 
 class Cursor:
@@ -193,13 +287,13 @@ class Cursor:
 class TerminalEmulator:
     """An FSM emulating a terminal.
 
-    Characters are stored in a 2D matrix (buffer) indexed by the cursor.
+    The screen buffer maps line numbers to `_Line`s, indexed by the cursor.
     """
 
     _MAX_LINES = 100
 
     def __init__(self):
-        self.buffer = defaultdict(lambda: defaultdict(lambda: _defchar))
+        self.buffer = {}
         self.cursor = Cursor()
         self._num_lines = None  # Cache
 
@@ -239,79 +333,74 @@ class TerminalEmulator:
         self.carriage_return()
 
     def _get_line_len(self, n):
-        if n not in self.buffer:
-            return 0
-        line = self.buffer[n]
-        if not line:
-            return 0
-        n = max(line.keys())
-        for i in range(n, -1, -1):
-            if line[i] != _defchar:
-                return i + 1
-        return 0
+        return len(self.buffer.get(n, _empty_line))
+
+    def _get_cursor_line(self):
+        line = self.buffer.get(self.cursor.y)
+        if line is None:
+            line = self.buffer[self.cursor.y] = _Line()
+        return line
 
     @property
     def num_lines(self):
         if self._num_lines is not None:
             return self._num_lines
         ret = 0
-        if self.buffer:
-            n = max(self.buffer.keys())
-            for i in range(n, -1, -1):
-                if self._get_line_len(i):
-                    ret = i + 1
-                    break
+        for n, line in self.buffer.items():
+            if n >= ret and len(line):
+                ret = n + 1
         self._num_lines = ret
         return ret
 
     def display(self):
         return [
-            [self.buffer[i][j].data for j in range(self._get_line_len(i))]
+            list(self.buffer[i].text[: self._get_line_len(i)])
+            if i in self.buffer
+            else []
             for i in range(self.num_lines)
         ]
 
     def erase_screen(self, mode=0):
         if mode == 0:
             for i in range(self.cursor.y + 1, self.num_lines):
-                if i in self.buffer:
-                    del self.buffer[i]
+                self.buffer.pop(i, None)
             self.erase_line(mode)
         if mode == 1:
             for i in range(self.cursor.y):
-                if i in self.buffer:
-                    del self.buffer[i]
+                self.buffer.pop(i, None)
             self.erase_line(mode)
         elif mode == 2 or mode == 3:
             self.buffer.clear()
+        self._num_lines = None
 
     def erase_line(self, mode=0):
-        curr_line = self.buffer[self.cursor.y]
+        curr_line = self.buffer.get(self.cursor.y)
+        if curr_line is None:
+            return
         if mode == 0:
-            for i in range(self.cursor.x, self._get_line_len(self.cursor.y)):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(self.cursor.x)
         elif mode == 1:
-            for i in range(self.cursor.x + 1):
-                if i in curr_line:
-                    del curr_line[i]
+            curr_line.erase(0, self.cursor.x + 1)
         else:
-            curr_line.clear()
+            del self.buffer[self.cursor.y]
+        self._num_lines = None
 
     def insert_lines(self, n=1):
         for i in range(self.num_lines - 1, self.cursor.y, -1):
-            self.buffer[i + n] = self.buffer[i]
-        for i in range(self.cursor.y + 1, self.cursor.y + 1 + n):
             if i in self.buffer:
-                del self.buffer[i]
+                self.buffer[i + n] = self.buffer.pop(i)
+            else:
+                self.buffer.pop(i + n, None)
+        for i in range(self.cursor.y + 1, self.cursor.y + 1 + n):
+            self.buffer.pop(i, None)
+        self._num_lines = None
 
     def _write_plain_text(self, plain_text):
-        self.buffer[self.cursor.y].update(
-            [
-                (self.cursor.x + i, self.cursor.char.copy(data=c))
-                for i, c in enumerate(plain_text)
-            ]
-        )
-        self.cursor.x += len(plain_text)
+        if plain_text:
+            self._get_cursor_line().write(
+                self.cursor.x, plain_text, self.cursor.char.style
+            )
+            self.cursor.x += len(plain_text)
 
     def _write_text(self, text):
         prev_end = 0
@@ -335,6 +424,10 @@ class TerminalEmulator:
 
     def write(self, data):
         self._num_lines = None  # invalidate cache
+        if "\033" not in data:
+            # Fast path: no escape sequences to parse.
+            self._write_text(data)
+            return
         data = self._remove_osc(data)
         prev_end = 0
         for match in ANSI_CSI_RE.finditer(data):
@@ -398,48 +491,7 @@ class TerminalEmulator:
             pass
 
     def _get_line(self, n):
-        line = self.buffer[n]
-        line_len = self._get_line_len(n)
-        # We have to loop through each character in the line and check if foreground, background and
-        # other attributes (italics, bold, underline, etc) of the ith character are different from those of the
-        # (i-1)th character. If different, the appropriate ascii character for switching the color/attribute
-        # should be appended to the output string before appending the actual character. This loop and subsequent
-        # checks can be expensive, especially because 99% of terminal output use default colors and formatting. Even
-        # in outputs that do contain colors and styles, its unlikely that they will change on a per character basis.
-
-        # So instead we create a character list without any ascii codes (`out`), and a list of all the foregrounds
-        # in the line (`fgs`) on which we call np.diff() and np.where() to find the indices where the foreground change,
-        # and insert the ascii characters in the output list (`out`) on those indices. All of this is the done ony if
-        # there are more than 1 foreground color in the line in the first place (`if len(set(fgs)) > 1 else None`).
-        # Same logic is repeated for background colors and other attributes.
-
-        out = [line[i].data for i in range(line_len)]
-
-        # for dynamic insert using original indices
-        idxs = np.arange(line_len)
-        insert = lambda i, c: (out.insert(idxs[i], c), idxs[i:].__iadd__(1))  # noqa
-
-        fgs = [int(_defchar.fg)] + [int(line[i].fg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].fg)) for i in np.where(np.diff(fgs))[0]
-        ] if len(set(fgs)) > 1 else None
-        bgs = [int(_defchar.bg)] + [int(line[i].bg) for i in range(line_len)]
-        [
-            insert(i, _get_char(line[int(i)].bg)) for i in np.where(np.diff(bgs))[0]
-        ] if len(set(bgs)) > 1 else None
-        attrs = {
-            k: [False] + [line[i][k] for i in range(line_len)]
-            for k in Char.__slots__[3:]
-        }
-        [
-            [
-                insert(i, _get_char(ANSI_STYLES_REV[k if line[int(i)][k] else "/" + k]))
-                for i in np.where(np.diff(v))[0]
-            ]
-            for k, v in attrs.items()
-            if any(v)
-        ]
-        return "".join(out)
+        return self.buffer.get(n, _empty_line).render()
 
     def read(self):
         num_lines = self.num_lines
@@ -470,11 +522,11 @@ class TerminalEmulator:
                 )
         if num_lines > self._MAX_LINES:
             shift = num_lines - self._MAX_LINES
-            for i in range(shift, num_lines):
-                self.buffer[i - shift] = self.buffer[i]
-            for i in range(self._MAX_LINES, max(self.buffer.keys())):
-                if i in self.buffer:
-                    del self.buffer[i]
+            self.buffer = {
+                i - shift: line
+                for i, line in self.buffer.items()
+                if shift <= i < num_lines
+            }
             self.cursor.y -= min(self.cursor.y, shift)
             self._num_lines = num_lines = self._MAX_LINES
         self._prev_num_lines = num_lines
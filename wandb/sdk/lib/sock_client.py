@@ -3,7 +3,7 @@ import struct
 import threading
 import time
 import uuid
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from wandb.proto import wandb_server_pb2 as spb
 
@@ -12,6 +12,22 @@ from . import tracelog
 if TYPE_CHECKING:
     from wandb.proto import wandb_internal_pb2 as pb
 
+# published records that may be held back and written together when coalescing
+COALESCED_RECORD_TYPES = frozenset({"history", "output", "output_raw", "stats"})
+COALESCE_MAX_BYTES = 256 * 1024
+
+# the smallest limit on the number of buffers in one sendmsg call (Linux, macOS)
+_IOV_MAX = 1024
+
+_HEADER = struct.Struct("<BI")
+
+
+def _is_coalesced(record: "pb.Record") -> bool:
+    record_type = record.WhichOneof("record_type")
+    if record_type == "request":
+        return record.request.WhichOneof("request_type") == "partial_history"
+    return record_type in COALESCED_RECORD_TYPES
+
 
 class SockClientClosedError(Exception):
     """Socket has been closed."""
@@ -20,62 +36,38 @@ class SockClientClosedError(Exception):
 
 
 class SockBuffer:
-    _buf_list: List[bytes]
-    _buf_lengths: List[int]
-    _buf_total: int
+    """Bytes received from a socket, consumed from the front as frames are parsed.
+
+    Removing a prefix from a bytearray only moves its start offset, so frames
+    are sliced out without joining the chunks they arrived in.
+    """
+
+    _buf: bytearray
 
     def __init__(self) -> None:
-        self._buf_list = []
-        self._buf_lengths = []
-        self._buf_total = 0
+        self._buf = bytearray()
 
     @property
     def length(self) -> int:
-        return self._buf_total
-
-    def _get(self, start: int, end: int, peek: bool = False) -> bytes:
-        index: Optional[int] = None
-        buffers = []
-        need = end
-
-        # compute buffers needed
-        for i, (buf_len, buf_data) in enumerate(zip(self._buf_lengths, self._buf_list)):
-            buffers.append(buf_data[:need] if need < buf_len else buf_data)
-            if need <= buf_len:
-                index = i
-                break
-            need -= buf_len
-
-        # buffer not large enough, caller should have made sure there was enough data
-        if index is None:
-            raise IndexError("SockBuffer index out of range")
-
-        # advance buffer internals if we are not peeking into the data
-        if not peek:
-            self._buf_total -= end
-            if need < buf_len:
-                # update partially used buffer list
-                self._buf_list = self._buf_list[index:]
-                self._buf_lengths = self._buf_lengths[index:]
-                self._buf_list[0] = self._buf_list[0][need:]
-                self._buf_lengths[0] -= need
-            else:
-                # update fully used buffer list
-                self._buf_list = self._buf_list[index + 1 :]
-                self._buf_lengths = self._buf_lengths[index + 1 :]
-
-        return b"".join(buffers)[start:end]
+        return len(self._buf)
 
     def get(self, start: int, end: int) -> bytes:
-        return self._get(start, end)
+        if end > len(self._buf):
+            raise IndexError("SockBuffer index out of range")
+        data = bytes(self._buf[start:end])
+        del self._buf[:end]
+        return data
 
     def peek(self, start: int, end: int) -> bytes:
-        return self._get(start, end, peek=True)
+        if end > len(self._buf):
+            raise IndexError("SockBuffer index out of range")
+        return bytes(self._buf[start:end])
+
+    def unpack_from(self, fmt: struct.Struct) -> Tuple[Any, ...]:
+        return fmt.unpack_from(self._buf)
 
     def put(self, data: bytes, data_len: int) -> None:
-        self._buf_list.append(data)
-        self._buf_lengths.append(data_len)
-        self._buf_total += data_len
+        self._buf += data
 
 
 class SockClient:
@@ -85,6 +77,8 @@ class SockClient:
     _lock: "threading.Lock"
     _bufsize: int
     _buffer: SockBuffer
+    _coalesce_seconds: Optional[float]
+    _pending: List[bytes]
 
     # current header is magic byte "W" followed by 4 byte length of the message
     HEADLEN = 1 + 4
@@ -96,6 +90,14 @@ class SockClient:
         self._lock = threading.Lock()
         self._bufsize = 4096
         self._buffer = SockBuffer()
+        self._coalesce_seconds = None
+        self._coalesce_max_bytes = COALESCE_MAX_BYTES
+        self._pending = []
+        self._pending_bytes = 0
+        self._pending_deadline = 0.0
+        self._pending_cond = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
 
     def connect(self, port: int) -> None:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -103,12 +105,43 @@ class SockClient:
         self._sock = s
         self._detect_bufsize()
 
+    def connect_unix(self, path: str) -> None:
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(path)
+        self._sock = s
+        self._detect_bufsize()
+
+    def enable_coalescing(
+        self, seconds: float, max_bytes: int = COALESCE_MAX_BYTES
+    ) -> None:
+        """Hold back published history, output and stats records for up to `seconds`.
+
+        The held records are written with one vectored send once `max_bytes`
+        are pending, the window expires, or any other message is sent, so the
+        order of messages on the socket doesn't change.
+        """
+        with self._lock:
+            self._coalesce_seconds = seconds
+            self._coalesce_max_bytes = max_bytes
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="SockFlushThr", daemon=True
+                )
+                self._flusher.start()
+
     def _detect_bufsize(self) -> None:
         sndbuf_size = self._sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
         rcvbuf_size = self._sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
         self._bufsize = min(sndbuf_size, rcvbuf_size, 65536)
 
     def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._pending_cond.notify()
+            try:
+                self._flush_pending()
+            except (OSError, SockClientClosedError):
+                pass
         self._sock.close()
 
     def shutdown(self, val: int) -> None:
@@ -142,14 +175,79 @@ class SockClient:
                 if delta_time < self._retry_delay:
                     time.sleep(self._retry_delay - delta_time)
 
-    def _send_message(self, msg: Any) -> None:
+    def _sendmsg_with_error_handle(self, buffers: List[bytes]) -> None:
+        # Same as _sendall_with_error_handle for the concatenation of buffers,
+        # without copying them into one bytes object first.
+        if not hasattr(self._sock, "sendmsg"):
+            # e.g. on Windows
+            self._sendall_with_error_handle(b"".join(buffers))
+            return
+        views = [memoryview(buf) for buf in buffers]
+        index = 0
+        while index < len(views):
+            start_time = time.monotonic()
+            try:
+                sent = self._sock.sendmsg(views[index : index + _IOV_MAX])
+            except socket.timeout:
+                delta_time = time.monotonic() - start_time
+                if delta_time < self._retry_delay:
+                    time.sleep(self._retry_delay - delta_time)
+                continue
+            if sent == 0:
+                raise SockClientClosedError("socket connection broken")
+            # skip what was written, which may end in the middle of a buffer
+            while sent >= len(views[index]):
+                sent -= len(views[index])
+                index += 1
+                if index == len(views):
+                    return
+            views[index] = views[index][sent:]
+
+    def _flush_pending(self) -> None:
+        # caller holds self._lock
+        buffers, self._pending = self._pending, []
+        self._pending_bytes = 0
+        if buffers:
+            self._sendmsg_with_error_handle(buffers)
+
+    def _flush_loop(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if not self._pending:
+                    self._pending_cond.wait()
+                    continue
+                remaining = self._pending_deadline - time.monotonic()
+                if remaining > 0:
+                    self._pending_cond.wait(remaining)
+                    continue
+                try:
+                    self._flush_pending()
+                except (OSError, SockClientClosedError):
+                    # the next direct send will run into the broken socket
+                    break
+
+    def _send_message(self, msg: Any, coalesce: bool = False) -> None:
         tracelog.log_message_send(msg, self._sockid)
         raw_size = msg.ByteSize()
         data = msg.SerializeToString()
         assert len(data) == raw_size, "invalid serialization"
-        header = struct.pack("<BI", ord("W"), raw_size)
+        header = _HEADER.pack(ord("W"), raw_size)
         with self._lock:
-            self._sendall_with_error_handle(header + data)
+            if coalesce:
+                if not self._pending:
+                    assert self._coalesce_seconds is not None
+                    self._pending_deadline = time.monotonic() + self._coalesce_seconds
+                    self._pending_cond.notify()
+                self._pending += (header, data)
+                self._pending_bytes += self.HEADLEN + raw_size
+                if self._pending_bytes >= self._coalesce_max_bytes:
+                    self._flush_pending()
+            elif self._pending:
+                # keep held records ahead of this message
+                self._pending += (header, data)
+                self._flush_pending()
+            else:
+                self._sendall_with_error_handle(header + data)
 
     def send_server_request(self, msg: Any) -> None:
         self._send_message(msg)
@@ -218,15 +316,14 @@ class SockClient:
     def send_record_publish(self, record: "pb.Record") -> None:
         server_req = spb.ServerRequest()
         server_req.record_publish.CopyFrom(record)
-        self.send_server_request(server_req)
+        coalesce = self._coalesce_seconds is not None and _is_coalesced(record)
+        self._send_message(server_req, coalesce=coalesce)
 
     def _extract_packet_bytes(self) -> Optional[bytes]:
         # Do we have enough data to read the header?
         start_offset = self.HEADLEN
         if self._buffer.length >= start_offset:
-            header = self._buffer.peek(0, start_offset)
-            fields = struct.unpack("<BI", header)
-            magic, dlength = fields
+            magic, dlength = self._buffer.unpack_from(_HEADER)
             assert magic == ord("W")
             # Do we have enough data to read the full record?
             end_offset = self.HEADLEN + dlength
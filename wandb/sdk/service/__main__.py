@@ -0,0 +1,64 @@
+"""Start the wandb service: `python -m wandb.sdk.service`.
+
+This is what `wandb service` runs, without importing the rest of the cli, so
+that the service is up as soon as possible.
+"""
+
+import argparse
+
+from .server import SHARED_IDLE_TIMEOUT, WandbServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m wandb.sdk.service")
+    parser.add_argument("--grpc-port", type=int, help="The host port to bind grpc.")
+    parser.add_argument("--sock-port", type=int, help="The host port to bind socket.")
+    parser.add_argument("--port-filename", help="Save allocated port to file.")
+    parser.add_argument("--address", help="The address to bind service.")
+    parser.add_argument("--pid", type=int, help="The parent process id to monitor.")
+    parser.add_argument("--debug", action="store_true", help="log debug info")
+    parser.add_argument("--serve-sock", action="store_true", help="use socket mode")
+    parser.add_argument("--serve-grpc", action="store_true", help="use grpc mode")
+    parser.add_argument(
+        "--serve-unix", action="store_true", help="use a unix socket in socket mode"
+    )
+    parser.add_argument(
+        "--stream-workers",
+        type=int,
+        default=0,
+        help="Run streams in this many worker processes.",
+    )
+    parser.add_argument(
+        "--ready-fd", type=int, help="Write the port info to this inherited fd."
+    )
+    parser.add_argument(
+        "--shared", action="store_true", help="Serve all processes of this user."
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=SHARED_IDLE_TIMEOUT,
+        help="Seconds a shared service stays up while unused.",
+    )
+    args = parser.parse_args()
+
+    server = WandbServer(
+        grpc_port=args.grpc_port,
+        sock_port=args.sock_port,
+        port_fname=args.port_filename,
+        address=args.address,
+        pid=args.pid,
+        debug=args.debug,
+        serve_sock=args.serve_sock,
+        serve_grpc=args.serve_grpc,
+        serve_unix=args.serve_unix,
+        stream_workers=args.stream_workers,
+        ready_fd=args.ready_fd,
+        shared=args.shared,
+        idle_timeout=args.idle_timeout,
+    )
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,57 @@
 """port_file: write/read file containing port info."""
 
+import contextlib
 import os
+import stat
 import tempfile
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None  # type: ignore
 
 
 class PortFile:
     _grpc_port: Optional[int]
     _sock_port: Optional[int]
+    _sock_path: Optional[str]
     _valid: bool
 
     GRPC_TOKEN = "grpc="
     SOCK_TOKEN = "sock="
+    UNIX_TOKEN = "unix="
     EOF_TOKEN = "EOF"
 
     def __init__(
-        self, grpc_port: Optional[int] = None, sock_port: Optional[int] = None
+        self,
+        grpc_port: Optional[int] = None,
+        sock_port: Optional[int] = None,
+        sock_path: Optional[str] = None,
     ) -> None:
         self._grpc_port = grpc_port
         self._sock_port = sock_port
+        self._sock_path = sock_path
         self._valid = False
 
+    def dumps(self) -> str:
+        data = []
+        if self._grpc_port:
+            data.append(f"{self.GRPC_TOKEN}{self._grpc_port}")
+        if self._sock_port:
+            data.append(f"{self.SOCK_TOKEN}{self._sock_port}")
+        if self._sock_path:
+            data.append(f"{self.UNIX_TOKEN}{self._sock_path}")
+        data.append(self.EOF_TOKEN)
+        return "\n".join(data)
+
     def write(self, fname: str) -> None:
         dname, bname = os.path.split(fname)
         f = tempfile.NamedTemporaryFile(prefix=bname, dir=dname, mode="w", delete=False)
         try:
             tmp_filename = f.name
             with f:
-                data = []
-                if self._grpc_port:
-                    data.append(f"{self.GRPC_TOKEN}{self._grpc_port}")
-                if self._sock_port:
-                    data.append(f"{self.SOCK_TOKEN}{self._sock_port}")
-                data.append(self.EOF_TOKEN)
-                port_str = "\n".join(data)
+                port_str = self.dumps()
                 written = f.write(port_str)
                 assert written == len(port_str)
             os.rename(tmp_filename, fname)
@@ -43,15 +61,20 @@ class PortFile:
 
     def read(self, fname: str) -> None:
         with open(fname) as f:
-            lines = f.readlines()
-            if lines[-1] != self.EOF_TOKEN:
-                return
-            for ln in lines:
-                if ln.startswith(self.GRPC_TOKEN):
-                    self._grpc_port = int(ln[len(self.GRPC_TOKEN) :])
-                elif ln.startswith(self.SOCK_TOKEN):
-                    self._sock_port = int(ln[len(self.SOCK_TOKEN) :])
-            self._valid = True
+            self.loads(f.read())
+
+    def loads(self, data: str) -> None:
+        lines = data.split("\n")
+        if lines[-1] != self.EOF_TOKEN:
+            return
+        for ln in lines:
+            if ln.startswith(self.GRPC_TOKEN):
+                self._grpc_port = int(ln[len(self.GRPC_TOKEN) :])
+            elif ln.startswith(self.SOCK_TOKEN):
+                self._sock_port = int(ln[len(self.SOCK_TOKEN) :])
+            elif ln.startswith(self.UNIX_TOKEN):
+                self._sock_path = ln[len(self.UNIX_TOKEN) :]
+        self._valid = True
 
     @property
     def grpc_port(self) -> Optional[int]:
@@ -61,6 +84,46 @@ class PortFile:
     def sock_port(self) -> Optional[int]:
         return self._sock_port
 
+    @property
+    def sock_path(self) -> Optional[str]:
+        return self._sock_path
+
     @property
     def is_valid(self) -> bool:
         return self._valid
+
+
+def shared_supported() -> bool:
+    return fcntl is not None and hasattr(os, "getuid")
+
+
+def shared_port_fname(key: str) -> str:
+    """Return the port file of the shared service for this user and node.
+
+    The directory is private to the user, a directory we don't own or that
+    other users can write to is never trusted.
+    """
+    dname = os.path.join(tempfile.gettempdir(), f"wandb-service-{os.getuid()}")
+    try:
+        os.mkdir(dname, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(dname)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        raise PermissionError(f"{dname} is not a private directory")
+    return os.path.join(dname, f"port-{key}.txt")
+
+
+@contextlib.contextmanager
+def locked(fname: str) -> Iterator[None]:
+    """Hold an exclusive lock for the port file across processes."""
+    with open(f"{fname}.lock", "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -3,9 +3,14 @@
 Start up grpc or socket transport servers.
 """
 
+import contextlib
 import logging
 import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
 from concurrent import futures
 from typing import Optional
 
@@ -16,6 +21,9 @@ from . import _startup_debug, port_file
 from .server_sock import SocketServer
 from .streams import StreamMux
 
+# how long a shared service stays up without streams or connections
+SHARED_IDLE_TIMEOUT = 600
+
 
 class WandbServer:
     _pid: Optional[int]
@@ -24,6 +32,11 @@ class WandbServer:
     _debug: bool
     _serve_grpc: bool
     _serve_sock: bool
+    _serve_unix: bool
+    _stream_workers: int
+    _ready_fd: Optional[int]
+    _shared: bool
+    _idle_timeout: float
     _sock_server: Optional[SocketServer]
     _startup_debug_enabled: bool
 
@@ -37,6 +50,11 @@ class WandbServer:
         debug: bool = True,
         serve_grpc: bool = False,
         serve_sock: bool = False,
+        serve_unix: bool = False,
+        stream_workers: int = 0,
+        ready_fd: Optional[int] = None,
+        shared: bool = False,
+        idle_timeout: float = SHARED_IDLE_TIMEOUT,
     ) -> None:
         self._grpc_port = grpc_port
         self._sock_port = sock_port
@@ -46,7 +64,15 @@ class WandbServer:
         self._debug = debug
         self._serve_grpc = serve_grpc
         self._serve_sock = serve_sock
+        # a shared service is only reachable through the user's private directory
+        self._serve_unix = serve_unix or shared
+        self._stream_workers = stream_workers
+        self._ready_fd = ready_fd
+        self._shared = shared
+        self._idle_timeout = idle_timeout
+        self._port_str: Optional[str] = None
         self._sock_server = None
+        self._sock_dir: Optional[str] = None
         self._startup_debug_enabled = _startup_debug.is_enabled()
 
         if grpc_port:
@@ -59,12 +85,22 @@ class WandbServer:
             logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
     def _inform_used_ports(
-        self, grpc_port: Optional[int], sock_port: Optional[int]
+        self,
+        grpc_port: Optional[int],
+        sock_port: Optional[int],
+        sock_path: Optional[str] = None,
     ) -> None:
-        if not self._port_fname:
-            return
-        pf = port_file.PortFile(grpc_port=grpc_port, sock_port=sock_port)
-        pf.write(self._port_fname)
+        pf = port_file.PortFile(
+            grpc_port=grpc_port, sock_port=sock_port, sock_path=sock_path
+        )
+        self._port_str = pf.dumps()
+        if self._port_fname:
+            pf.write(self._port_fname)
+        if self._ready_fd is not None:
+            # the launching process waits on this pipe instead of the port file
+            with os.fdopen(self._ready_fd, "w") as f:
+                f.write(self._port_str)
+            self._ready_fd = None
 
     def _start_grpc(self, mux: StreamMux) -> int:
         import grpc
@@ -99,7 +135,19 @@ class WandbServer:
     def _start_sock(self, mux: StreamMux) -> int:
         address: str = self._address or "127.0.0.1"
         port: int = self._sock_port or 0
-        self._sock_server = SocketServer(mux=mux, address=address, port=port)
+        path = None
+        if self._serve_unix and self._shared and self._port_fname:
+            # next to the port file, in the private directory of the user
+            path = os.path.splitext(self._port_fname)[0] + ".sock"
+            # left behind by a service that didn't shut down cleanly, the
+            # launcher holds the port file lock and found nothing listening
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+        elif self._serve_unix:
+            # a private directory, since anyone who can connect can send records
+            self._sock_dir = tempfile.mkdtemp(prefix="wandb-")
+            path = os.path.join(self._sock_dir, "service.sock")
+        self._sock_server = SocketServer(mux=mux, address=address, port=port, path=path)
         try:
             self._sock_server.start()
             port = self._sock_server.port
@@ -116,6 +164,30 @@ class WandbServer:
     def _stop_servers(self) -> None:
         if self._sock_server:
             self._sock_server.stop()
+        if self._sock_dir:
+            shutil.rmtree(self._sock_dir, ignore_errors=True)
+
+    def _watch_idle(self, mux: StreamMux) -> None:
+        """Stop a shared service once no process has used it for a while."""
+        assert self._port_fname
+        stopped = mux._get_stopped_event()
+        while not stopped.wait(timeout=min(self._idle_timeout, 10)):
+            if not mux.is_idle(self._idle_timeout):
+                continue
+            # clients refresh the port file while holding this lock when they pick
+            # this service, so it can't be handed out while we shut down
+            with port_file.locked(self._port_fname):
+                try:
+                    with open(self._port_fname) as f:
+                        ours = f.read() == self._port_str
+                    age = time.time() - os.path.getmtime(self._port_fname)
+                except FileNotFoundError:
+                    ours, age = False, self._idle_timeout
+                if age < self._idle_timeout or not mux.is_idle(self._idle_timeout):
+                    continue
+                if ours:
+                    os.unlink(self._port_fname)
+                stopped.set()
 
     def _setup_tracelog(self) -> None:
         # TODO: remove this temporary hack, need to find a better way to pass settings
@@ -131,24 +203,33 @@ class WandbServer:
 
     def serve(self) -> None:
         self._setup_tracelog()
-        mux = StreamMux()
+        mux = StreamMux(workers=self._stream_workers, shared=self._shared)
         self._startup_debug_print("before_network")
         grpc_port = self._start_grpc(mux=mux) if self._serve_grpc else None
         sock_port = self._start_sock(mux=mux) if self._serve_sock else None
+        sock_path = self._sock_server.path if self._sock_server else None
+        if sock_path:
+            sock_port = None
         self._startup_debug_print("after_network")
-        self._inform_used_ports(grpc_port=grpc_port, sock_port=sock_port)
+        self._inform_used_ports(
+            grpc_port=grpc_port, sock_port=sock_port, sock_path=sock_path
+        )
         self._startup_debug_print("after_inform")
         setproctitle = wandb.util.get_optional_module("setproctitle")
         if setproctitle:
             service_ver = 2
             pid = str(self._pid or 0)
-            transport = "s" if sock_port else "g"
+            transport = "u" if sock_path else "s" if sock_port else "g"
             port = grpc_port or sock_port or 0
             # this format is similar to wandb_manager token but it purely informative now
             # (consider unifying this in the future)
             service_id = f"{service_ver}-{pid}-{transport}-{port}"
             proc_title = f"wandb-service({service_id})"
             setproctitle.setproctitle(proc_title)
+        if self._shared and self._port_fname:
+            threading.Thread(
+                target=self._watch_idle, args=(mux,), name="IdleThr", daemon=True
+            ).start()
         self._startup_debug_print("before_loop")
         mux.loop()
         self._stop_servers()
@@ -1,8 +1,9 @@
+import os
 import queue
 import socket
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
 
 from wandb.proto import wandb_server_pb2 as spb
 
@@ -81,6 +82,7 @@ class SockServerReadThread(threading.Thread):
     _mux: StreamMux
     _stopped: "Event"
     _clients: ClientDict
+    _stream_ids: Set[str]
 
     def __init__(
         self, conn: socket.socket, mux: StreamMux, clients: ClientDict
@@ -93,8 +95,20 @@ class SockServerReadThread(threading.Thread):
         self._sock_client = sock_client
         self._stopped = mux._get_stopped_event()
         self._clients = clients
+        # streams initialized over this connection
+        self._stream_ids = set()
 
     def run(self) -> None:
+        self._mux.add_connection()
+        try:
+            self._read_requests()
+        finally:
+            if self._mux.shared and self._stream_ids and not self._stopped.is_set():
+                # the process went away without finishing its runs
+                self._mux.finish_streams(self._stream_ids, exit_code=1)
+            self._mux.del_connection()
+
+    def _read_requests(self) -> None:
         while not self._stopped.is_set():
             try:
                 sreq = self._sock_client.read_server_request()
@@ -124,6 +138,7 @@ class SockServerReadThread(threading.Thread):
         stream_id = request._info.stream_id
         settings = settings_dict_from_pbmap(request._settings_map)
         self._mux.add_stream(stream_id, settings=settings)
+        self._stream_ids.add(stream_id)
 
         iface = self._mux.get_stream(stream_id).interface
         self._clients.add_client(self._sock_client)
@@ -179,10 +194,16 @@ class SockServerReadThread(threading.Thread):
         request = sreq.inform_finish
         stream_id = request._info.stream_id
         self._mux.drop_stream(stream_id)
+        self._stream_ids.discard(stream_id)
 
     def server_inform_teardown(self, sreq: "spb.ServerRequest") -> None:
         request = sreq.inform_teardown
         exit_code = request.exit_code
+        if self._mux.shared:
+            # other processes are using the service, only finish our own streams
+            self._mux.finish_streams(self._stream_ids, exit_code)
+            self._stream_ids = set()
+            return
         self._mux.teardown(exit_code)
 
 
@@ -237,16 +258,26 @@ class SocketServer:
     _mux: StreamMux
     _address: str
     _port: int
+    _path: Optional[str]
     _sock: socket.socket
 
-    def __init__(self, mux: Any, address: str, port: int) -> None:
+    def __init__(
+        self, mux: Any, address: str, port: int, path: Optional[str] = None
+    ) -> None:
         self._mux = mux
         self._address = address
         self._port = port
+        self._path = path
         # This is the server socket that we accept new connections from
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if path:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
     def _bind(self) -> None:
+        if self._path:
+            self._sock.bind(self._path)
+            return
         self._sock.bind((self._address, self._port))
         self._port = self._sock.getsockname()[1]
 
@@ -254,6 +285,10 @@ class SocketServer:
     def port(self) -> int:
         return self._port
 
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
     def start(self) -> None:
         self._bind()
         self._thread = SockAcceptThread(sock=self._sock, mux=self._mux)
@@ -276,3 +311,8 @@ class SocketServer:
             except OSError:
                 pass
             self._sock.close()
+        if self._path:
+            try:
+                os.unlink(self._path)
+            except OSError:
+                pass
@@ -1,17 +1,21 @@
 """Reliably launch and connect to backend server process (wandb service).
 
-Backend server process can be connected to using tcp sockets or grpc transport.
+Backend server process can be connected to using tcp or unix sockets or grpc transport.
 """
 
+import hashlib
 import os
 import platform
+import selectors
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
 import time
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import wandb
 from wandb import _sentry
 from wandb.errors import Error
 
@@ -45,9 +49,12 @@ class _Service:
     _settings: "Settings"
     _grpc_port: Optional[int]
     _sock_port: Optional[int]
+    _sock_path: Optional[str]
     _service_interface: ServiceInterface
     _internal_proc: Optional[subprocess.Popen]
     _use_grpc: bool
+    _use_unix: bool
+    _use_shared: bool
     _startup_debug_enabled: bool
 
     def __init__(
@@ -58,6 +65,7 @@ class _Service:
         self._stub = None
         self._grpc_port = None
         self._sock_port = None
+        self._sock_path = None
         self._internal_proc = None
         self._startup_debug_enabled = _startup_debug.is_enabled()
 
@@ -66,6 +74,21 @@ class _Service:
         # Temporary setting to allow use of grpc so that we can keep
         # that code from rotting during the transition
         self._use_grpc = self._settings._service_transport == "grpc"
+        # unix domain sockets aren't available on every platform (e.g. older Windows)
+        self._use_unix = self._settings._service_transport == "unix" and hasattr(
+            socket, "AF_UNIX"
+        )
+        # a service shared by all processes of the user. It always listens on a
+        # unix socket in the user's private directory, since any local user can
+        # connect to a loopback port
+        self._use_shared = bool(
+            self._settings._service_shared
+            and not self._use_grpc
+            and hasattr(socket, "AF_UNIX")
+            and port_file.shared_supported()
+        )
+        if self._use_shared:
+            self._use_unix = True
 
         # current code only supports grpc or socket server implementation, in the
         # future we might be able to support both
@@ -81,6 +104,80 @@ class _Service:
             return
         _startup_debug.print_message(message)
 
+    def _process_error(self, proc: subprocess.Popen) -> ServiceStartProcessError:
+        # define these variables for sentry context grab:
+        # command = proc.args
+        # sys_executable = sys.executable
+        # which_python = shutil.which("python3")
+        # proc_out = proc.stdout.read()
+        # proc_err = proc.stderr.read()
+        context = dict(
+            command=proc.args,
+            sys_executable=sys.executable,
+            which_python=shutil.which("python3"),
+            proc_out=proc.stdout.read() if proc.stdout else "",
+            proc_err=proc.stderr.read() if proc.stderr else "",
+        )
+        return ServiceStartProcessError(
+            f"The wandb service process exited with {proc.returncode}. "
+            "Ensure that `sys.executable` is a valid python interpreter. "
+            "You can override it with the `_executable` setting "
+            "or with the `WANDB__EXECUTABLE` environment variable.",
+            context=context,
+        )
+
+    def _timeout_error(self) -> ServiceStartTimeoutError:
+        return ServiceStartTimeoutError(
+            "Timed out waiting for wandb service to start after "
+            f"{self._settings._service_wait} seconds. "
+            "Try increasing the timeout with the `_service_wait` setting."
+        )
+
+    def _set_ports(self, pf: port_file.PortFile) -> None:
+        self._grpc_port = pf.grpc_port
+        self._sock_port = pf.sock_port
+        self._sock_path = pf.sock_path
+
+    def _wait_for_ready(self, fd: int, proc: subprocess.Popen) -> None:
+        """Read the port info the service writes to the ready pipe.
+
+        The service closes the pipe after writing it, or by exiting early.
+
+        Args:
+            fd: The read end of the pipe.
+            proc: The service process.
+
+        Raises:
+            ServiceStartTimeoutError: If the service takes too long to start.
+            ServiceStartPortError: If the service writes invalid port info.
+            ServiceStartProcessError: If the service process exits unexpectedly.
+        """
+        time_max = time.monotonic() + self._settings._service_wait
+        data = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            try:
+                while True:
+                    timeout = time_max - time.monotonic()
+                    if timeout <= 0 or not selector.select(timeout):
+                        raise self._timeout_error()
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    data += chunk
+            finally:
+                os.close(fd)
+        pf = port_file.PortFile()
+        pf.loads(data.decode())
+        if pf.is_valid:
+            self._set_ports(pf)
+            return
+        try:
+            proc.wait(timeout=self._settings._service_wait)
+        except subprocess.TimeoutExpired:
+            raise ServiceStartPortError("Failed to allocate port for wandb service.")
+        raise self._process_error(proc)
+
     def _wait_for_ports(
         self, fname: str, proc: Optional[subprocess.Popen] = None
     ) -> None:
@@ -100,26 +197,7 @@ class _Service:
         while time.monotonic() < time_max:
             if proc and proc.poll():
                 # process finished
-                # define these variables for sentry context grab:
-                # command = proc.args
-                # sys_executable = sys.executable
-                # which_python = shutil.which("python3")
-                # proc_out = proc.stdout.read()
-                # proc_err = proc.stderr.read()
-                context = dict(
-                    command=proc.args,
-                    sys_executable=sys.executable,
-                    which_python=shutil.which("python3"),
-                    proc_out=proc.stdout.read() if proc.stdout else "",
-                    proc_err=proc.stderr.read() if proc.stderr else "",
-                )
-                raise ServiceStartProcessError(
-                    f"The wandb service process exited with {proc.returncode}. "
-                    "Ensure that `sys.executable` is a valid python interpreter. "
-                    "You can override it with the `_executable` setting "
-                    "or with the `WANDB__EXECUTABLE` environment variable.",
-                    context=context,
-                )
+                raise self._process_error(proc)
             if not os.path.isfile(fname):
                 time.sleep(0.2)
                 continue
@@ -129,8 +207,7 @@ class _Service:
                 if not pf.is_valid:
                     time.sleep(0.2)
                     continue
-                self._grpc_port = pf.grpc_port
-                self._sock_port = pf.sock_port
+                self._set_ports(pf)
             except Exception as e:
                 # todo: point at the docs. this could be due to a number of reasons,
                 #  for example, being unable to write to the port file etc.
@@ -138,13 +215,9 @@ class _Service:
                     f"Failed to allocate port for wandb service: {e}."
                 )
             return
-        raise ServiceStartTimeoutError(
-            "Timed out waiting for wandb service to start after "
-            f"{self._settings._service_wait} seconds. "
-            "Try increasing the timeout with the `_service_wait` setting."
-        )
+        raise self._timeout_error()
 
-    def _launch_server(self) -> None:
+    def _launch_server(self, shared_fname: Optional[str] = None) -> None:
         """Launch server and set ports."""
         # References for starting processes
         # - https://github.com/wandb/wandb/blob/archive/old-cli/wandb/__init__.py
@@ -168,34 +241,115 @@ class _Service:
             # Add coverage collection if needed
             if os.environ.get("YEA_RUN_COVERAGE") and os.environ.get("COVERAGE_RCFILE"):
                 exec_cmd_list += ["coverage", "run", "-m"]
-            service_args = [
-                "wandb",
-                "service",
-                "--port-filename",
-                fname,
-                "--pid",
-                pid,
-                "--debug",
-            ]
+            # same as `wandb service`, without importing the cli
+            service_args = ["wandb.sdk.service"]
+            if shared_fname:
+                # outlives this process, other processes find it by its port file.
+                # No debug logging, its log file is kept for as long as it runs
+                service_args += ["--shared", "--port-filename", shared_fname]
+                log_fname = os.path.splitext(shared_fname)[0] + ".log"
+                log_file = open(log_fname, "a")
+                kwargs.update(
+                    stdin=subprocess.DEVNULL, stdout=log_file, stderr=log_file
+                )
+            else:
+                service_args += ["--debug", "--pid", pid]
             if self._use_grpc:
                 service_args.append("--serve-grpc")
             else:
                 service_args.append("--serve-sock")
-            internal_proc = subprocess.Popen(
-                exec_cmd_list + service_args,
-                env=os.environ,
-                **kwargs,
-            )
+                if self._use_unix:
+                    service_args.append("--serve-unix")
+            if self._settings._service_workers:
+                service_args += [
+                    "--stream-workers",
+                    str(self._settings._service_workers),
+                ]
+            ready_r = ready_w = None
+            if platform.system() == "Windows":
+                # file descriptors can't be passed on, poll for the port file
+                service_args += ["--port-filename", fname]
+            else:
+                ready_r, ready_w = os.pipe()
+                kwargs.update(pass_fds=(ready_w,))
+                service_args += ["--ready-fd", str(ready_w)]
+            try:
+                internal_proc = subprocess.Popen(
+                    exec_cmd_list + service_args,
+                    env=os.environ,
+                    **kwargs,
+                )
+            except Exception:
+                if ready_r is not None:
+                    os.close(ready_r)
+                raise
+            finally:
+                if ready_w is not None:
+                    os.close(ready_w)
+                if shared_fname:
+                    log_file.close()
             self._startup_debug_print("wait_ports")
             try:
-                self._wait_for_ports(fname, proc=internal_proc)
+                if ready_r is not None:
+                    self._wait_for_ready(ready_r, proc=internal_proc)
+                else:
+                    self._wait_for_ports(fname, proc=internal_proc)
             except Exception as e:
                 _sentry.reraise(e)
             self._startup_debug_print("wait_ports_done")
             self._internal_proc = internal_proc
         self._startup_debug_print("launch_done")
 
+    def _shared_key(self) -> str:
+        # only reuse a service that was started the same way
+        ident = ":".join(
+            [
+                wandb.__version__,
+                self._settings._executable,
+                "unix" if self._use_unix else "tcp",
+                str(self._settings._service_workers or 0),
+            ]
+        )
+        return hashlib.sha1(ident.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _is_listening(pf: port_file.PortFile) -> bool:
+        try:
+            if pf.sock_path:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(1)
+                sock.connect(pf.sock_path)
+            else:
+                sock = socket.create_connection(("localhost", pf.sock_port), 1)
+        except OSError:
+            return False
+        sock.close()
+        return True
+
+    def _start_shared(self) -> None:
+        """Connect to the shared service of this user, starting it if needed."""
+        try:
+            fname = port_file.shared_port_fname(self._shared_key())
+        except OSError as e:
+            wandb.termwarn(f"Not using a shared wandb service: {e}", repeat=False)
+            self._use_shared = False
+            self._launch_server()
+            return
+        with port_file.locked(fname):
+            pf = port_file.PortFile()
+            if os.path.isfile(fname):
+                pf.read(fname)
+            if pf.is_valid and self._is_listening(pf):
+                # keeps the service from shutting down as idle before we connect
+                os.utime(fname)
+                self._set_ports(pf)
+                return
+            self._launch_server(shared_fname=fname)
+
     def start(self) -> None:
+        if self._use_shared:
+            self._start_shared()
+            return
         self._launch_server()
 
     @property
@@ -206,12 +360,17 @@ class _Service:
     def sock_port(self) -> Optional[int]:
         return self._sock_port
 
+    @property
+    def sock_path(self) -> Optional[str]:
+        return self._sock_path
+
     @property
     def service_interface(self) -> ServiceInterface:
         return self._service_interface
 
     def join(self) -> int:
         ret = 0
-        if self._internal_proc:
+        # a shared service keeps running for other processes
+        if self._internal_proc and not self._use_shared:
             ret = self._internal_proc.wait()
         return ret
@@ -87,3 +87,6 @@ class ServiceInterface:
     @abstractmethod
     def _svc_connect(self, port: int) -> None:
         raise NotImplementedError
+
+    def _svc_connect_unix(self, path: str) -> None:
+        raise NotImplementedError
@@ -29,6 +29,9 @@ class ServiceSockInterface(ServiceInterface):
     def _svc_connect(self, port: int) -> None:
         self._sock_client.connect(port=port)
 
+    def _svc_connect_unix(self, path: str) -> None:
+        self._sock_client.connect_unix(path=path)
+
     def _svc_inform_init(self, settings: "Settings", run_id: str) -> None:
         inform_init = spb.ServerInformInitRequest()
         settings_dict = settings.make_static()
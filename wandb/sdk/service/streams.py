@@ -1,6 +1,7 @@
 """streams: class that manages internal threads for each run.
 
 StreamThread: Thread that runs internal.wandb_internal()
+StreamWorker: Process that runs the stream threads for a share of the streams
 StreamRecord: All the external state for the internal thread (queues, etc)
 StreamAction: Lightweight record for stream ops for thread safety with grpc
 StreamMux: Container for dictionary of stream threads per runid
@@ -8,11 +9,12 @@ StreamMux: Container for dictionary of stream threads per runid
 import functools
 import logging
 import multiprocessing
+import os
 import queue
 import threading
 import time
 from threading import Event
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import psutil
 
@@ -49,19 +51,224 @@ class StreamThread(threading.Thread):
         self._target(**self._kwargs)
 
 
+def _stream_worker_main(
+    inbox: "multiprocessing.Queue[Any]",
+    outbox: "multiprocessing.Queue[Any]",
+    port: Optional[int],
+    user_pid: Optional[int],
+) -> None:
+    """Run the internal threads of the streams assigned to a StreamWorker."""
+    parent_pid = os.getppid()
+    outbox.put(("ready", "", None))
+    record_qs: Dict[str, "queue.Queue[pb.Record]"] = {}
+    threads: Dict[str, threading.Thread] = {}
+
+    def forward_results(
+        stream_id: str, thread: StreamThread, result_q: "queue.Queue[pb.Result]"
+    ) -> None:
+        while thread.is_alive() or not result_q.empty():
+            try:
+                result = result_q.get(timeout=1)
+            except queue.Empty:
+                continue
+            outbox.put(("result", stream_id, result.SerializeToString()))
+
+    def join_stream(stream_id: str, thread: threading.Thread) -> None:
+        thread.join()
+        outbox.put(("joined", stream_id, None))
+
+    while True:
+        try:
+            msg = inbox.get(timeout=1)
+        except queue.Empty:
+            if os.getppid() != parent_pid:
+                # the service is gone, nobody is left to read our results
+                return
+            continue
+        if msg is None:
+            return
+        kind, stream_id, data = msg
+        if kind == "record":
+            record = pb.Record()
+            record.ParseFromString(data)
+            record_qs[stream_id].put(record)
+        elif kind == "add":
+            record_q: "queue.Queue[pb.Record]" = queue.Queue()
+            result_q: "queue.Queue[pb.Result]" = queue.Queue()
+            thread = StreamThread(
+                target=wandb.wandb_sdk.internal.internal.wandb_internal,
+                kwargs=dict(
+                    settings=data,
+                    record_q=record_q,
+                    result_q=result_q,
+                    port=port,
+                    user_pid=user_pid,
+                ),
+            )
+            thread.start()
+            forwarder = threading.Thread(
+                target=forward_results,
+                args=(stream_id, thread, result_q),
+                name="StreamFwd",
+                daemon=True,
+            )
+            forwarder.start()
+            record_qs[stream_id] = record_q
+            threads[stream_id] = forwarder
+        elif kind == "join":
+            # the forwarder outlives the stream thread, wait for the last result
+            record_qs.pop(stream_id)
+            threading.Thread(
+                target=join_stream,
+                args=(stream_id, threads.pop(stream_id)),
+                name="StreamJoin",
+                daemon=True,
+            ).start()
+        else:
+            raise AssertionError(f"Unsupported worker message: {kind}")
+
+
+class StreamWorker:
+    """Process that runs the internal threads for a share of the streams.
+
+    Records are passed to the worker tagged with their stream id and results
+    come back the same way, to be routed into the result queue of the stream.
+    """
+
+    _inbox: "multiprocessing.Queue[Any]"
+    _outbox: "multiprocessing.Queue[Any]"
+    _result_qs: Dict[str, "queue.Queue[pb.Result]"]
+    _joined: Dict[str, Event]
+
+    def __init__(self, port: Optional[int], user_pid: Optional[int]) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self._inbox = ctx.Queue()
+        self._outbox = ctx.Queue()
+        self._lock = threading.Lock()
+        self._result_qs = {}
+        self._joined = {}
+        self._process = ctx.Process(
+            target=_stream_worker_main,
+            kwargs=dict(
+                inbox=self._inbox, outbox=self._outbox, port=port, user_pid=user_pid
+            ),
+            name="StreamWorker",
+            daemon=True,
+        )
+        self._process.start()
+        self._wait_ready()
+        self._reader = threading.Thread(
+            target=self._read_results, name="StreamWorkerRead", daemon=True
+        )
+        self._reader.start()
+
+    def _wait_ready(self) -> None:
+        # a spawned worker imports wandb from scratch, which shouldn't count
+        # against the status check of its first stream
+        while True:
+            try:
+                kind, _, _ = self._outbox.get(timeout=1)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    raise AssertionError("Stream worker exited during startup")
+                continue
+            if kind == "ready":
+                return
+
+    def _read_results(self) -> None:
+        while True:
+            try:
+                kind, stream_id, data = self._outbox.get(timeout=1)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    break
+                continue
+            with self._lock:
+                if kind == "result":
+                    result = pb.Result()
+                    result.ParseFromString(data)
+                    self._result_qs[stream_id].put(result)
+                elif kind == "joined":
+                    del self._result_qs[stream_id]
+                    self._joined.pop(stream_id).set()
+        # the worker exited, don't leave anyone waiting on its streams
+        with self._lock:
+            for joined in self._joined.values():
+                joined.set()
+            self._joined = {}
+
+    def add(
+        self,
+        stream_id: str,
+        settings: Dict[str, Any],
+        result_q: "queue.Queue[pb.Result]",
+    ) -> None:
+        with self._lock:
+            self._result_qs[stream_id] = result_q
+            self._joined[stream_id] = Event()
+        self._inbox.put(("add", stream_id, settings))
+
+    def put(self, stream_id: str, record: "pb.Record") -> None:
+        # protobuf bytes are cheaper to send than a pickled message
+        self._inbox.put(("record", stream_id, record.SerializeToString()))
+
+    def join(self, stream_id: str) -> None:
+        with self._lock:
+            joined = self._joined.get(stream_id)
+        if not joined:
+            return
+        self._inbox.put(("join", stream_id, None))
+        joined.wait()
+
+    def stop(self) -> None:
+        self._inbox.put(None)
+        self._process.join()
+        self._reader.join()
+
+    @property
+    def num_streams(self) -> int:
+        with self._lock:
+            return len(self._joined)
+
+
+class _WorkerRecordQueue:
+    """Stand-in for the record queue of a stream that runs in a StreamWorker."""
+
+    def __init__(self, worker: StreamWorker, stream_id: str) -> None:
+        self._worker = worker
+        self._stream_id = stream_id
+
+    def put(self, record: "pb.Record") -> None:
+        self._worker.put(self._stream_id, record)
+
+
 class StreamRecord:
     _record_q: "queue.Queue[pb.Record]"
     _result_q: "queue.Queue[pb.Result]"
     _relay_q: "queue.Queue[pb.Result]"
     _iface: InterfaceRelay
-    _thread: StreamThread
+    _thread: Optional[StreamThread]
+    _worker: Optional[StreamWorker]
     _settings: SettingsStatic  # TODO(settings) replace SettingsStatic with Setting
     _started: bool
 
-    def __init__(self, settings: Dict[str, Any], mailbox: Mailbox) -> None:
+    def __init__(
+        self,
+        settings: Dict[str, Any],
+        mailbox: Mailbox,
+        worker: Optional[StreamWorker] = None,
+        stream_id: Optional[str] = None,
+    ) -> None:
         self._started = False
         self._mailbox = mailbox
-        self._record_q = queue.Queue()
+        self._thread = None
+        self._worker = worker
+        self._stream_id = stream_id
+        if worker:
+            assert stream_id
+            self._record_q = _WorkerRecordQueue(worker, stream_id)  # type: ignore
+        else:
+            self._record_q = queue.Queue()
         self._result_q = queue.Queue()
         self._relay_q = queue.Queue()
         process = multiprocessing.current_process()
@@ -80,6 +287,11 @@ class StreamRecord:
         thread.start()
         self._wait_thread_active()
 
+    def start_worker(self, settings: Dict[str, Any]) -> None:
+        assert self._worker and self._stream_id
+        self._worker.add(self._stream_id, settings, self._result_q)
+        self._wait_thread_active()
+
     def _wait_thread_active(self) -> None:
         result = self._iface.communicate_status()
         # TODO: using the default communicate timeout, is that enough? retries?
@@ -87,7 +299,10 @@ class StreamRecord:
 
     def join(self) -> None:
         self._iface.join()
-        if self._thread:
+        if self._worker:
+            assert self._stream_id
+            self._worker.join(self._stream_id)
+        elif self._thread:
             self._thread.join()
 
     def drop(self) -> None:
@@ -141,8 +356,18 @@ class StreamMux:
     _stopped: Event
     _pid_checked_ts: Optional[float]
     _mailbox: Mailbox
-
-    def __init__(self) -> None:
+    _num_workers: int
+    _workers: List[StreamWorker]
+    _shared: bool
+    _connections: int
+    _active_ts: float
+
+    def __init__(self, workers: int = 0, shared: bool = False) -> None:
+        self._num_workers = workers
+        self._workers = []
+        self._shared = shared
+        self._connections = 0
+        self._active_ts = time.monotonic()
         self._streams_lock = threading.Lock()
         self._streams = dict()
         self._port = None
@@ -193,6 +418,36 @@ class StreamMux:
         self._action_q.put(action)
         action.wait_handled()
 
+    def finish_streams(self, stream_ids: Iterable[str], exit_code: int) -> None:
+        action = StreamAction(
+            action="finish", stream_id="na", data=(exit_code, set(stream_ids))
+        )
+        self._action_q.put(action)
+        action.wait_handled()
+
+    @property
+    def shared(self) -> bool:
+        return self._shared
+
+    def add_connection(self) -> None:
+        with self._streams_lock:
+            self._connections += 1
+            self._active_ts = time.monotonic()
+
+    def del_connection(self) -> None:
+        with self._streams_lock:
+            self._connections -= 1
+            self._active_ts = time.monotonic()
+
+    def is_idle(self, seconds: float) -> bool:
+        """Return True if nothing has used the mux in the last `seconds`."""
+        with self._streams_lock:
+            return (
+                not self._streams
+                and not self._connections
+                and time.monotonic() - self._active_ts >= seconds
+            )
+
     def stream_names(self) -> List[str]:
         with self._streams_lock:
             names = list(self._streams.keys())
@@ -207,8 +462,26 @@ class StreamMux:
             stream = self._streams[stream_id]
             return stream
 
+    def _get_worker(self) -> StreamWorker:
+        if len(self._workers) < self._num_workers:
+            worker = StreamWorker(port=self._port, user_pid=self._pid)
+            self._workers.append(worker)
+            return worker
+        return min(self._workers, key=lambda worker: worker.num_streams)
+
+    def _stop_workers(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
     def _process_add(self, action: StreamAction) -> None:
-        stream = StreamRecord(action._data, mailbox=self._mailbox)
+        worker = self._get_worker() if self._num_workers else None
+        stream = StreamRecord(
+            action._data,
+            mailbox=self._mailbox,
+            worker=worker,
+            stream_id=action._stream_id,
+        )
         # run_id = action.stream_id  # will want to fix if a streamid != runid
         settings_dict = action._data
         settings_dict[
@@ -216,6 +489,11 @@ class StreamMux:
         ] = (
             logging.DEBUG
         )  # Note: not including this in the stream's settings to try and keep only Settings arguments
+        if worker:
+            stream.start_worker(settings_dict)
+            with self._streams_lock:
+                self._streams[action._stream_id] = stream
+            return
         thread = StreamThread(
             target=wandb.wandb_sdk.internal.internal.wandb_internal,
             kwargs=dict(
@@ -368,9 +646,22 @@ class StreamMux:
         self._finish_all(streams_copy, exit_code)
         with self._streams_lock:
             self._streams = dict()
+        self._stop_workers()
         self._stopped.set()
 
+    def _process_finish(self, action: StreamAction) -> None:
+        exit_code, stream_ids = action._data
+        with self._streams_lock:
+            streams = {
+                stream_id: self._streams.pop(stream_id)
+                for stream_id in stream_ids
+                if stream_id in self._streams
+            }
+        self._finish_all(streams, exit_code)
+
     def _process_action(self, action: StreamAction) -> None:
+        with self._streams_lock:
+            self._active_ts = time.monotonic()
         if action._action == "add":
             self._process_add(action)
             return
@@ -389,6 +680,9 @@ class StreamMux:
         if action._action == "teardown":
             self._process_teardown(action)
             return
+        if action._action == "finish":
+            self._process_finish(action)
+            return
         raise AssertionError(f"Unsupported action: {action._action}")
 
     def _check_orphaned(self) -> bool:
@@ -420,6 +714,8 @@ class StreamMux:
             self._loop()
         except Exception as e:
             raise e
+        finally:
+            self._stop_workers()
 
     def cleanup(self) -> None:
         pass
@@ -7,7 +7,9 @@ import os
 import re
 import shutil
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePosixPath
 from types import ModuleType
 from typing import (
@@ -45,6 +47,7 @@ from wandb.sdk.interface.artifacts import (
     ArtifactManifestEntry,
     ArtifactNotLoggedError,
     ArtifactsCache,
+    FileDigestCache,
     StorageHandler,
     StorageLayout,
     StoragePolicy,
@@ -95,12 +98,47 @@ _REQUEST_POOL_CONNECTIONS = 64
 
 _REQUEST_POOL_MAXSIZE = 64
 
+# Files at least this large are downloaded as parallel HTTP range requests,
+# each fetching one part straight into its offset of the cache file.
+_DOWNLOAD_RANGE_THRESHOLD = 256 * 1024 * 1024
+
+_DOWNLOAD_RANGE_PART_SIZE = 64 * 1024 * 1024
+
+_DOWNLOAD_RANGE_CONCURRENCY = 8
+
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_download_range_slots: Optional[threading.BoundedSemaphore] = None
+_download_range_slots_pid: Optional[int] = None
+_download_range_slots_lock = threading.Lock()
+
+
+def _get_download_range_slots() -> threading.BoundedSemaphore:
+    """Return the process-wide limit on range requests beyond a file's first part.
+
+    The first part of a file is fetched by the download worker itself, which is
+    already bounded by the shared download pool. The other parts of all files
+    share `WANDB_ARTIFACT_DOWNLOAD_CONCURRENCY` slots between them.
+    """
+    global _download_range_slots, _download_range_slots_pid
+    with _download_range_slots_lock:
+        # A forked child would inherit slots held by the parent's threads.
+        if _download_range_slots is None or _download_range_slots_pid != os.getpid():
+            _download_range_slots = threading.BoundedSemaphore(
+                env.get_artifact_download_concurrency()
+            )
+            _download_range_slots_pid = os.getpid()
+        return _download_range_slots
+
+
 ARTIFACT_TMP = tempfile.TemporaryDirectory("wandb-artifacts")
 
 # AWS S3 max upload parts without having to make additional requests for extra parts
 S3_MAX_PART_NUMBERS = 1000
 S3_MIN_MULTI_UPLOAD_SIZE = 2 * 1024**3
 S3_MAX_MULTI_UPLOAD_SIZE = 5 * 1024**4
+# Number of multipart upload parts in flight at once. Each holds one part in memory.
+S3_MULTIPART_UPLOAD_CONCURRENCY = 4
 
 
 class _AddedObj:
@@ -460,17 +498,21 @@ class Artifact(ArtifactInterface):
                     logical_path = os.path.join(name, logical_path)
                 paths.append((logical_path, physical_path))
 
+        # Unchanged files aren't hashed again, but they're still copied to the
+        # staging dir, which freezes their contents until they're uploaded.
+        digest_cache = get_artifacts_cache().file_digests
+
         def add_manifest_file(log_phy_path: Tuple[str, str]) -> None:
             logical_path, physical_path = log_phy_path
-            self._add_local_file(logical_path, physical_path)
+            self._add_local_file(logical_path, physical_path, digest_cache=digest_cache)
 
-        import multiprocessing.dummy  # this uses threads
-
-        num_threads = 8
-        pool = multiprocessing.dummy.Pool(num_threads)
-        pool.map(add_manifest_file, paths)
-        pool.close()
-        pool.join()
+        # Hashing and copying are mostly IO bound, so use more threads than cores.
+        num_threads = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            # Consume the results so that worker exceptions are raised here.
+            for _ in pool.map(add_manifest_file, paths):
+                pass
+        digest_cache.commit()
 
         termlog("Done. %.1fs" % (time.time() - start_time), prefix=False)
 
@@ -733,13 +775,28 @@ class Artifact(ArtifactInterface):
             raise ArtifactFinalizedError(artifact=self)
 
     def _add_local_file(
-        self, name: StrPath, path: StrPath, digest: Optional[B64MD5] = None
+        self,
+        name: StrPath,
+        path: StrPath,
+        digest: Optional[B64MD5] = None,
+        digest_cache: Optional[FileDigestCache] = None,
     ) -> ArtifactManifestEntry:
+        stat = os.stat(path) if digest is None and digest_cache is not None else None
         with tempfile.NamedTemporaryFile(dir=get_staging_dir(), delete=False) as f:
             staging_path = f.name
             shutil.copyfile(path, staging_path)
             os.chmod(staging_path, 0o400)
 
+        if stat is not None and digest_cache is not None:
+            # The cached digest (or the one we compute now) only describes the
+            # staged copy if the source didn't change while we were copying it.
+            unchanged = digest_cache.is_unchanged(stat, os.stat(path))
+            digest = digest_cache.get(path, stat) if unchanged else None
+            if digest is None:
+                digest = md5_file_b64(staging_path)
+                if unchanged:
+                    digest_cache.put(path, stat, digest)
+
         entry = ArtifactManifestEntry(
             path=name,
             digest=digest or md5_file_b64(staging_path),
@@ -899,17 +956,90 @@ class WandbStoragePolicy(StoragePolicy):
         if hit:
             return path
 
+        url = self._file_url(self._api, artifact.entity, manifest_entry)
+        size = manifest_entry.size if manifest_entry.size is not None else 0
+        if size >= _DOWNLOAD_RANGE_THRESHOLD:
+            first_part = self._get_range(url, 0, _DOWNLOAD_RANGE_PART_SIZE)
+            if first_part.status_code == 206:
+                with cache_open(mode="wb") as file:
+                    self._download_ranges(url, size, first_part, file)
+                return path
+            # The server ignored the Range header and is sending the whole
+            # file, so fall back to a single stream.
+            response = first_part
+        else:
+            response = self._session.get(
+                url, auth=("api", self._api.api_key), stream=True
+            )
+        response.raise_for_status()
+
+        with cache_open(mode="wb") as file:
+            for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                file.write(data)
+        return path
+
+    def _get_range(self, url: str, start: int, end: int) -> requests.Response:
+        """Request bytes [start, end) of `url`, streaming the response."""
         response = self._session.get(
-            self._file_url(self._api, artifact.entity, manifest_entry),
+            url,
             auth=("api", self._api.api_key),
+            headers={"Range": f"bytes={start}-{end - 1}"},
             stream=True,
         )
         response.raise_for_status()
+        return response
 
-        with cache_open(mode="wb") as file:
-            for data in response.iter_content(chunk_size=16 * 1024):
-                file.write(data)
-        return path
+    def _download_ranges(
+        self,
+        url: str,
+        size: int,
+        first_part: requests.Response,
+        file: IO,
+    ) -> None:
+        """Download `url` into `file` as concurrent range requests.
+
+        `first_part` is the already-started response for the first part. The
+        remaining parts are fetched on a small pool sharing this policy's
+        session, and every part is written at its own offset, so memory use is
+        bounded by the chunk size rather than the file size.
+        """
+        lock = threading.Lock()
+        slots = _get_download_range_slots()
+
+        def write_part(start: int, response: requests.Response) -> None:
+            offset = start
+            with response:
+                for data in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    with lock:
+                        file.seek(offset)
+                        file.write(data)
+                    offset += len(data)
+            if offset != min(start + _DOWNLOAD_RANGE_PART_SIZE, size):
+                raise CommError(
+                    f"Incomplete range download of {url}: "
+                    f"got bytes {start}-{offset}"
+                )
+
+        def download_part(start: int) -> None:
+            end = min(start + _DOWNLOAD_RANGE_PART_SIZE, size)
+            with slots:
+                response = self._get_range(url, start, end)
+                if response.status_code != 206:
+                    response.close()
+                    raise CommError(f"Range request for {url} was not honored")
+                write_part(start, response)
+
+        starts = range(_DOWNLOAD_RANGE_PART_SIZE, size, _DOWNLOAD_RANGE_PART_SIZE)
+        with ThreadPoolExecutor(max_workers=_DOWNLOAD_RANGE_CONCURRENCY) as pool:
+            futures = [pool.submit(download_part, start) for start in starts]
+            try:
+                write_part(0, first_part)
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def store_reference(
         self,
@@ -963,30 +1093,43 @@ class WandbStoragePolicy(StoragePolicy):
         hex_digests: Dict[int, str],
         multipart_urls: Dict[int, str],
         extra_headers: Dict[str, str],
+        progress_callback: Optional["progress.ProgressFn"] = None,
+        chunks: Optional[Dict[int, bytes]] = None,
     ) -> List[Dict[str, Any]]:
-        etags = []
-        part_number = 1
-
-        with open(file_path, "rb") as f:
-            while True:
-                data = f.read(chunk_size)
-                if not data:
-                    break
-                md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
-                upload_resp = self._api.upload_multipart_file_chunk_retry(
-                    multipart_urls[part_number],
-                    data,
-                    extra_headers={
-                        "content-md5": md5_b64_str,
-                        "content-length": str(len(data)),
-                        "content-type": extra_headers.get("Content-Type"),
-                    },
-                )
-                etags.append(
-                    {"partNumber": part_number, "hexMD5": upload_resp.headers["ETag"]}
-                )
-                part_number += 1
-        return etags
+        """Upload the parts of a file concurrently.
+
+        Parts in `chunks` (already read, e.g. while hashing the file) are
+        uploaded first, straight from memory, and removed from `chunks` once
+        sent. Every other part is read from disk by the worker uploading it, so
+        at most one part per worker is held in memory.
+        """
+        file_size = os.path.getsize(file_path)
+        chunks = chunks if chunks is not None else {}
+        part_numbers = sorted(hex_digests, key=lambda n: (n not in chunks, n))
+
+        def upload_part(part_number: int) -> Dict[str, Any]:
+            data = chunks.pop(part_number, None)
+            if data is None:
+                with open(file_path, "rb") as f:
+                    f.seek((part_number - 1) * chunk_size)
+                    data = f.read(chunk_size)
+            md5_b64_str = str(hex_to_b64_id(hex_digests[part_number]))
+            upload_resp = self._api.upload_multipart_file_chunk_retry(
+                multipart_urls[part_number],
+                data,
+                extra_headers={
+                    "content-md5": md5_b64_str,
+                    "content-length": str(len(data)),
+                    "content-type": extra_headers.get("Content-Type"),
+                },
+            )
+            if progress_callback is not None:
+                progress_callback(len(data), file_size)
+            return {"partNumber": part_number, "hexMD5": upload_resp.headers["ETag"]}
+
+        with ThreadPoolExecutor(max_workers=S3_MULTIPART_UPLOAD_CONCURRENCY) as pool:
+            etags = list(pool.map(upload_part, part_numbers))
+        return sorted(etags, key=lambda etag: etag["partNumber"])
 
     def default_file_upload(
         self,
@@ -1031,6 +1174,8 @@ class WandbStoragePolicy(StoragePolicy):
         chunk_size = self.calc_chunk_size(file_size)
         upload_parts = []
         hex_digests = {}
+        # The last few parts read while hashing, kept so they needn't be re-read.
+        chunks: Dict[int, bytes] = {}
         file_path = entry.local_path if entry.local_path is not None else ""
         # Logic for AWS s3 multipart upload.
         # Only chunk files if larger than 2 GiB. Currently can only support up to 5TiB.
@@ -1049,6 +1194,8 @@ class WandbStoragePolicy(StoragePolicy):
                         {"hexMD5": hex_digest, "partNumber": part_number}
                     )
                     hex_digests[part_number] = hex_digest
+                    chunks[part_number] = data
+                    chunks.pop(part_number - S3_MULTIPART_UPLOAD_CONCURRENCY, None)
                     part_number += 1
 
         resp = preparer.prepare_sync(
@@ -1068,6 +1215,8 @@ class WandbStoragePolicy(StoragePolicy):
             return True
         if entry.local_path is None:
             return False
+        if multipart_urls is None:
+            chunks.clear()
 
         extra_headers = {
             header.split(":", 1)[0]: header.split(":", 1)[1]
@@ -1089,6 +1238,8 @@ class WandbStoragePolicy(StoragePolicy):
                 hex_digests,
                 multipart_urls,
                 extra_headers,
+                progress_callback=progress_callback,
+                chunks=chunks,
             )
             self._api.complete_multipart_upload_artifact(
                 artifact_id, resp.storage_path, etags, resp.upload_id
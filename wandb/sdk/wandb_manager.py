@@ -36,12 +36,13 @@ class ManagerConnectionRefusedError(ManagerConnectionError):
 
 class _ManagerToken:
     _version = "2"
-    _supported_transports = {"grpc", "tcp"}
+    _supported_transports = {"grpc", "tcp", "unix"}
     _token_str: str
     _pid: int
     _transport: str
     _host: str
     _port: int
+    _path: Optional[str]
 
     def __init__(self, token: str) -> None:
         self._token_str = token
@@ -55,10 +56,15 @@ class _ManagerToken:
         return cls(token=token)
 
     @classmethod
-    def from_params(cls, transport: str, host: str, port: int) -> "_ManagerToken":
+    def from_params(
+        cls, transport: str, host: str, port: int = 0, path: Optional[str] = None
+    ) -> "_ManagerToken":
         version = cls._version
         pid = os.getpid()
-        token = "-".join([version, str(pid), transport, host, str(port)])
+        # a unix socket is addressed by its path, which takes the place of the port
+        address = path if transport == "unix" else str(port)
+        assert address
+        token = "-".join([version, str(pid), transport, host, address])
         return cls(token=token)
 
     def set_environment(self) -> None:
@@ -66,7 +72,8 @@ class _ManagerToken:
 
     def _parse(self) -> None:
         assert self._token_str
-        parts = self._token_str.split("-")
+        # the last part may be a socket path, which can contain dashes
+        parts = self._token_str.split("-", 4)
         assert len(parts) == 5, f"token must have 5 parts: {parts}"
         # TODO: make more robust?
         version, pid_str, transport, host, port_str = parts
@@ -75,7 +82,12 @@ class _ManagerToken:
         self._pid = int(pid_str)
         self._transport = transport
         self._host = host
-        self._port = int(port_str)
+        if transport == "unix":
+            self._port = 0
+            self._path = port_str
+        else:
+            self._port = int(port_str)
+            self._path = None
 
     def reset_environment(self) -> None:
         os.environ.pop(env.SERVICE, None)
@@ -100,6 +112,10 @@ class _ManagerToken:
     def port(self) -> int:
         return self._port
 
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
 
 class _Manager:
     _token: _ManagerToken
@@ -113,8 +129,11 @@ class _Manager:
         svc_iface = self._get_service_interface()
 
         try:
-            svc_iface._svc_connect(port=port)
-        except ConnectionRefusedError as e:
+            if self._token.path:
+                svc_iface._svc_connect_unix(path=self._token.path)
+            else:
+                svc_iface._svc_connect(port=port)
+        except (ConnectionRefusedError, FileNotFoundError) as e:
             if not psutil.pid_exists(self._token.pid):
                 message = (
                     "Connection to wandb service failed "
@@ -144,14 +163,21 @@ class _Manager:
         if not token:
             self._service.start()
             host = "localhost"
+            path = None
             if use_grpc:
                 transport = "grpc"
                 port = self._service.grpc_port
+            elif self._service.sock_path:
+                transport = "unix"
+                port = 0
+                path = self._service.sock_path
             else:
                 transport = "tcp"
                 port = self._service.sock_port
-            assert port
-            token = _ManagerToken.from_params(transport=transport, host=host, port=port)
+            assert port or path
+            token = _ManagerToken.from_params(
+                transport=transport, host=host, port=port or 0, path=path
+            )
             token.set_environment()
             self._atexit_setup()
 
@@ -182,6 +208,10 @@ class _Manager:
             self._atexit_lambda = None
 
         try:
+            if self._settings._service_shared and wandb.run:
+                # a shared service prints to its own log, so finish the run here
+                # for its summary to be shown
+                wandb.run.finish(exit_code=exit_code)
             self._inform_teardown(exit_code)
             result = self._service.join()
             if result and not self._settings._notebook:
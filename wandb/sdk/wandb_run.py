@@ -68,7 +68,7 @@ from . import wandb_artifacts, wandb_config, wandb_metric, wandb_summary
 from .data_types._dtypes import TypeRegistry
 from .interface.artifacts import Artifact as ArtifactInterface
 from .interface.artifacts import ArtifactNotLoggedError
-from .interface.interface import GlobStr, InterfaceBase
+from .interface.interface import HISTORY_BATCH_KEY, GlobStr, InterfaceBase
 from .interface.summary_record import SummaryRecord
 from .lib import (
     config_util,
@@ -98,6 +98,8 @@ if TYPE_CHECKING:
     else:
         from typing_extensions import TypedDict
 
+    import pandas as pd
+
     import wandb.apis.public
     import wandb.sdk.backend.backend
     import wandb.sdk.interface.interface_grpc
@@ -1749,6 +1751,90 @@ class Run:
             )
         self._log(data=data, step=step, commit=commit)
 
+    @_run_decorator._noop
+    @_run_decorator._noop_on_finish()
+    @_run_decorator._attach
+    def log_batch(
+        self,
+        data: Union[Mapping[str, Any], "pd.DataFrame"],
+        step: Optional[str] = None,
+    ) -> None:
+        """Log many steps of metrics at once.
+
+        `data` holds one column per metric, either as a dict of equal-length
+        sequences (e.g. numpy arrays) or as a pandas DataFrame.  Every position
+        becomes a history row, as if `wandb.log` had been called once per step,
+        with summary and `define_metric` settings applied to each row.  The
+        whole batch is sent to the internal process as a single request.
+
+        Metrics logged with `commit=False` for the first step of the batch
+        are saved in the same row.
+
+        Arguments:
+            data: (dict or DataFrame) Columns of numbers, booleans or strings.
+            step: (string, optional) The column holding each row's step.  Steps
+                must be increasing and start at or after `run.step`.  By default
+                the rows take consecutive steps starting at `run.step`.
+
+        Examples:
+            ```python
+            import numpy as np
+            import wandb
+
+            run = wandb.init()
+            run.log_batch({"loss": np.random.rand(1000), "acc": np.random.rand(1000)})
+            ```
+
+        Raises:
+            ValueError: if invalid data is passed
+        """
+        np = wandb.util.get_module("numpy", required="run.log_batch requires numpy")
+        if wandb.util.is_pandas_data_frame(data):
+            data = {k: data[k].to_numpy() for k in data.columns}
+        if not isinstance(data, Mapping):
+            raise ValueError("run.log_batch must be passed a dictionary or a DataFrame")
+        if any(not isinstance(key, str) for key in data.keys()):
+            raise ValueError("Column names passed to `run.log_batch` must be strings.")
+
+        columns = {k: np.asarray(v) for k, v in data.items()}
+        for k, values in columns.items():
+            if values.ndim != 1:
+                raise ValueError(f"Column {k!r} passed to `run.log_batch` is not 1-d.")
+            if values.dtype.kind not in "biufUO" or (
+                values.dtype.kind == "O" and not all(isinstance(v, str) for v in values)
+            ):
+                raise ValueError(
+                    f"Column {k!r} passed to `run.log_batch` must hold numbers, "
+                    "booleans or strings; use `wandb.log` for other values."
+                )
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("Columns passed to `run.log_batch` differ in length.")
+        for k in ("_step", HISTORY_BATCH_KEY):
+            if k in columns and k != step:
+                raise ValueError(
+                    f"Column name {k!r} passed to `run.log_batch` is reserved."
+                )
+
+        if step is not None:
+            steps = columns.pop(step, None)
+            if steps is None or steps.dtype.kind not in "iu":
+                raise ValueError(f"Step column {step!r} must hold integers.")
+            if len(steps) and (steps[0] < self._step or (np.diff(steps) <= 0).any()):
+                raise ValueError(
+                    f"Step column {step!r} must increase, starting at or after "
+                    f"the current step {self._step}."
+                )
+            step_list = steps.tolist()
+        else:
+            num_rows = len(next(iter(columns.values()), []))
+            step_list = list(range(self._step, self._step + num_rows))
+        if not step_list:
+            return
+
+        if self._backend and self._backend.interface:
+            self._backend.interface.publish_partial_history_batch(columns, step_list)
+        self._step = step_list[-1] + 1
+
     @_run_decorator._noop_on_finish()
     @_run_decorator._attach
     def save(
@@ -2540,8 +2626,9 @@ class Run:
         log_freq=100,
         idx=None,
         log_graph=False,
+        batch_histograms=False,
     ) -> None:
-        wandb.watch(models, criterion, log, log_freq, idx, log_graph)
+        wandb.watch(models, criterion, log, log_freq, idx, log_graph, batch_histograms)
 
     # TODO(jhr): annotate this
     @_run_decorator._attach
@@ -13,7 +13,6 @@ import sys
 import tempfile
 import time
 from datetime import datetime
-from distutils.util import strtobool
 from functools import reduce
 from typing import (
     Any,
@@ -36,6 +35,7 @@ import wandb
 import wandb.env
 from wandb import util
 from wandb.apis.internal import Api
+from wandb.env import strtobool
 from wandb.errors import UsageError
 from wandb.sdk.internal.system.env_probe_helpers import is_aws_lambda
 from wandb.sdk.lib import filesystem
@@ -457,6 +457,10 @@ class Settings:
     _config_dict: Config
     _console: SettingsConsole
     _cuda: str
+    _datastore_group_commit: bool  # batch transaction log writes into whole blocks
+    _datastore_sync_bytes: int
+    _datastore_sync_seconds: float
+    _disable_inotify: bool  # always scan the run directory for file changes
     _disable_meta: bool
     _disable_service: bool
     _disable_stats: bool
@@ -464,9 +468,13 @@ class Settings:
     _except_exit: bool
     _executable: str
     _extra_http_headers: Mapping[str, str]
+    _file_stream_adaptive_rate: bool  # adapt posting interval to latency and 429s
+    _file_stream_compression: str  # "gzip" or "zstd"
+    _file_stream_max_bytes: int  # size file stream batches by bytes
     _flow_control_custom: bool
     _flow_control_disabled: bool
     _internal_check_process: Union[int, float]
+    _internal_profile: bool  # report internal process overhead as _wandb/internal/* stats
     _internal_queue_timeout: Union[int, float]
     _ipython: bool
     _jupyter: bool
@@ -487,8 +495,11 @@ class Settings:
     _python: str
     _runqueue_item_id: str
     _save_requirements: bool
-    _service_transport: str
+    _service_coalesce_seconds: float  # batch published records on the socket
+    _service_shared: bool  # reuse one service for all processes of the user on a node
+    _service_transport: str  # "tcp" (default), "unix" or "grpc"
     _service_wait: float
+    _service_workers: int  # run streams in this many worker processes
     _start_datetime: datetime
     _start_time: float
     _stats_pid: int  # (internal) base pid for system stats
@@ -501,6 +512,7 @@ class Settings:
     # - {"metric regex pattern, including endpoint name as prefix": {"label": "label value regex pattern"}}
     # - ("metric regex pattern 1", "metric regex pattern 2", ...)
     _stats_open_metrics_filters: Union[Sequence[str], Mapping[str, Mapping[str, str]]]
+    _tensorboard_bulk: bool  # read tfevents files in bulk, publish history in batches
     _tmp_code_dir: str
     _tracelog: str
     _unsaved_keys: Sequence[str]
@@ -610,6 +622,16 @@ class Settings:
                 "preprocessor": int,
                 "validator": self._validate__async_upload_concurrency_limit,
             },
+            _datastore_group_commit={"value": False, "preprocessor": _str_as_bool},
+            _datastore_sync_bytes={
+                "preprocessor": int,
+                "validator": self._validate__datastore_sync_bytes,
+            },
+            _datastore_sync_seconds={
+                "preprocessor": float,
+                "validator": self._validate__datastore_sync_seconds,
+            },
+            _disable_inotify={"value": False, "preprocessor": _str_as_bool},
             _disable_meta={"preprocessor": _str_as_bool},
             _disable_service={
                 "value": False,
@@ -619,6 +641,14 @@ class Settings:
             _disable_stats={"preprocessor": _str_as_bool},
             _disable_viewer={"preprocessor": _str_as_bool},
             _extra_http_headers={"preprocessor": _str_as_json},
+            _file_stream_adaptive_rate={"value": False, "preprocessor": _str_as_bool},
+            _file_stream_compression={
+                "validator": self._validate__file_stream_compression,
+            },
+            _file_stream_max_bytes={
+                "preprocessor": int,
+                "validator": self._validate__file_stream_max_bytes,
+            },
             _network_buffer={"preprocessor": int},
             _colab={
                 "hook": lambda _: "google.colab" in sys.modules,
@@ -626,6 +656,7 @@ class Settings:
             },
             _console={"hook": lambda _: self._convert_console(), "auto_hook": True},
             _internal_check_process={"value": 8},
+            _internal_profile={"value": False, "preprocessor": _str_as_bool},
             _internal_queue_timeout={"value": 2},
             _ipython={
                 "hook": lambda _: _get_python_type() == "ipython",
@@ -663,11 +694,20 @@ class Settings:
             _sync={"value": False},
             _platform={"value": util.get_platform_name()},
             _save_requirements={"value": True, "preprocessor": _str_as_bool},
+            _service_coalesce_seconds={
+                "preprocessor": float,
+                "validator": self._validate__service_coalesce_seconds,
+            },
+            _service_shared={"value": False, "preprocessor": _str_as_bool},
             _service_wait={
                 "value": 30,
                 "preprocessor": float,
                 "validator": self._validate__service_wait,
             },
+            _service_workers={
+                "preprocessor": int,
+                "validator": self._validate__service_workers,
+            },
             _stats_sample_rate_seconds={
                 "value": 2.0,
                 "preprocessor": float,
@@ -690,6 +730,7 @@ class Settings:
                 "value": (".*",),
                 "preprocessor": _str_as_json,
             },
+            _tensorboard_bulk={"value": False, "preprocessor": _str_as_bool},
             _tmp_code_dir={
                 "value": "code",
                 "hook": lambda x: self._path_convert(self.tmp_dir, x),
@@ -1074,12 +1115,49 @@ class Settings:
 
         return True
 
+    @staticmethod
+    def _validate__datastore_sync_bytes(value: int) -> bool:
+        if value <= 0:
+            raise UsageError("_datastore_sync_bytes must be positive")
+        return True
+
+    @staticmethod
+    def _validate__datastore_sync_seconds(value: float) -> bool:
+        if value < 0:
+            raise UsageError("_datastore_sync_seconds must be >= 0")
+        return True
+
+    @staticmethod
+    def _validate__file_stream_compression(value: str) -> bool:
+        choices = {"gzip", "zstd"}
+        if value not in choices:
+            raise UsageError(f"_file_stream_compression must be one of {choices}")
+        return True
+
+    @staticmethod
+    def _validate__file_stream_max_bytes(value: int) -> bool:
+        if value <= 0:
+            raise UsageError("_file_stream_max_bytes must be positive")
+        return True
+
+    @staticmethod
+    def _validate__service_coalesce_seconds(value: float) -> bool:
+        if value <= 0:
+            raise UsageError("_service_coalesce_seconds must be a positive number")
+        return True
+
     @staticmethod
     def _validate__service_wait(value: float) -> bool:
         if value <= 0:
             raise UsageError("_service_wait must be a positive number")
         return True
 
+    @staticmethod
+    def _validate__service_workers(value: int) -> bool:
+        if value < 0:
+            raise UsageError("_service_workers must not be negative")
+        return True
+
     @staticmethod
     def _validate__stats_sample_rate_seconds(value: float) -> bool:
         if value < 0.1:
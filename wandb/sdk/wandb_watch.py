@@ -24,6 +24,7 @@ def watch(
     log_freq: int = 1000,
     idx: Optional[int] = None,
     log_graph: bool = False,
+    batch_histograms: bool = False,
 ):
     """Hook into the torch model to collect gradients and the topology.
 
@@ -36,6 +37,9 @@ def watch(
         log_freq: (int) log gradients and parameters every N batches
         idx: (int) an index to be used when calling wandb.watch on multiple models
         log_graph: (boolean) log graph topology
+        batch_histograms: (boolean) compute gradient and parameter histograms on the
+            device they live on and copy them to the host once per logged step,
+            instead of syncing with the device for every tensor
 
     Returns:
         `wandb.Graph`: The graph object that will populate after the first backward pass
@@ -90,6 +94,7 @@ def watch(
                 model,
                 prefix=prefix,
                 log_freq=log_freq,
+                batched=batch_histograms,
             )
 
         if log_gradients:
@@ -97,6 +102,7 @@ def watch(
                 model,
                 prefix=prefix,
                 log_freq=log_freq,
+                batched=batch_histograms,
             )
 
         if log_graph:
@@ -2,6 +2,7 @@
 
 import datetime
 import fnmatch
+import json
 import os
 import queue
 import sys
@@ -19,6 +20,9 @@ from wandb.util import check_and_warn_old
 
 WANDB_SUFFIX = ".wandb"
 SYNCED_SUFFIX = ".synced"
+CHECKPOINT_SUFFIX = ".sync-checkpoint"
+# how often the offset of the last record the server has is saved
+CHECKPOINT_INTERVAL_SECONDS = 30
 TFEVENT_SUBSTRING = ".tfevents."
 TMPDIR = tempfile.TemporaryDirectory()
 
@@ -50,6 +54,7 @@ class SyncThread(threading.Thread):
         sync_tensorboard=None,
         log_path=None,
         append=None,
+        concurrent=None,
     ):
         threading.Thread.__init__(self)
         # mark this process as internal
@@ -65,6 +70,8 @@ class SyncThread(threading.Thread):
         self._sync_tensorboard = sync_tensorboard
         self._log_path = log_path
         self._append = append
+        # other threads are syncing at the same time, print whole lines only
+        self._concurrent = concurrent
 
     def _parse_pb(self, data, exit_pb=None):
         pb = wandb_internal_pb2.Record()
@@ -168,10 +175,12 @@ class SyncThread(threading.Thread):
         )
         record = send_manager._interface._make_record(run=proto_run)
         settings = wandb.Settings(
-            root_dir=TMPDIR.name,
+            root_dir=send_manager._settings.root_dir,
             run_id=proto_run.run_id,
             _start_datetime=datetime.datetime.now(),
             _start_time=time.time(),
+            # the tfevents files are complete, read them in bulk
+            _tensorboard_bulk=True,
         )
 
         handle_manager = handler.HandleManager(
@@ -231,6 +240,121 @@ class SyncThread(threading.Thread):
             else:
                 raise e
 
+    def _show_run(self, r):
+        # TODO(jhr): hardcode until we have settings in sync
+        url = "{}/{}/{}/runs/{}".format(
+            self._app_url,
+            url_quote(r.entity),
+            url_quote(r.project),
+            url_quote(r.run_id),
+        )
+        if self._concurrent:
+            print("Syncing: %s ..." % url)
+        else:
+            print("Syncing: %s ... " % url, end="")
+        sys.stdout.flush()
+        return url
+
+    def _skip_sent(self, ds, offset):
+        """Skip the records sent before a previous sync was interrupted."""
+        if offset <= ds.get_offset():
+            return
+        ds.seek(offset)
+        if self._verbose:
+            print(f"Resuming from checkpoint at offset {offset}")
+
+    @staticmethod
+    def _load_checkpoint(sync_item):
+        try:
+            with open(f"{sync_item}{CHECKPOINT_SUFFIX}") as f:
+                checkpoint = json.load(f)
+            return {"run": str(checkpoint["run"]), "offset": int(checkpoint["offset"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _save_checkpoint(sm, sync_item, run_path, offset):
+        """Record that every record before `offset` has reached the server."""
+        # History, events and console output are posted by the file stream
+        # thread; only checkpoint once it has caught up with what was sent.
+        # After `finish` the file stream is gone and everything was posted.
+        if sm._fs is not None and not sm._fs.wait_flushed(
+            timeout=CHECKPOINT_INTERVAL_SECONDS
+        ):
+            return
+        checkpoint_file = f"{sync_item}{CHECKPOINT_SUFFIX}"
+        tmp_file = f"{checkpoint_file}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump({"run": run_path, "offset": offset}, f)
+            os.replace(tmp_file, checkpoint_file)
+        except OSError as e:
+            wandb.termwarn(f"Unable to save sync checkpoint {checkpoint_file}: {e}")
+
+    @staticmethod
+    def _remove_checkpoint(sync_item):
+        try:
+            os.remove(f"{sync_item}{CHECKPOINT_SUFFIX}")
+        except OSError:
+            pass
+
+    def _sync_run(self, sm, ds, sync_item, checkpoint):
+        # save exit for final send
+        exit_pb = None
+        finished = False
+        shown = False
+        url = None
+        run_path = None
+        # offset of the record following the last one sent
+        sent_offset = None
+        checkpoint_time = time.monotonic()
+        while True:
+            data = self._robust_scan(ds)
+            if data is None:
+                break
+            pb, exit_pb, cont = self._parse_pb(data, exit_pb)
+            if exit_pb is not None:
+                finished = True
+            if cont:
+                continue
+            sm.send(pb)
+            # send any records that were added in previous send
+            while not sm._record_q.empty():
+                data = sm._record_q.get(block=True)
+                sm.send(data)
+
+            if pb.control.req_resp:
+                result = sm._result_q.get(block=True)
+                result_type = result.WhichOneof("result_type")
+                if not shown and result_type == "run_result":
+                    r = result.run_result.run
+                    run_path = f"{r.entity}/{r.project}/{r.run_id}"
+                    url = self._show_run(r)
+                    shown = True
+                    if checkpoint is not None and checkpoint["run"] == run_path:
+                        self._skip_sent(ds, checkpoint["offset"])
+
+            if exit_pb is None and not self._view:
+                sent_offset = ds.get_offset()
+                if (
+                    run_path is not None
+                    and time.monotonic() - checkpoint_time > CHECKPOINT_INTERVAL_SECONDS
+                ):
+                    self._save_checkpoint(sm, sync_item, run_path, sent_offset)
+                    checkpoint_time = time.monotonic()
+        sm.finish()
+        # Only mark synced if the run actually finished
+        if self._mark_synced and not self._view and finished:
+            synced_file = f"{sync_item}{SYNCED_SUFFIX}"
+            with open(synced_file, "w"):
+                pass
+        if finished:
+            self._remove_checkpoint(sync_item)
+        elif run_path is not None and sent_offset is not None:
+            # the run is still being written, the next sync continues from here
+            self._save_checkpoint(sm, sync_item, run_path, sent_offset)
+        return url
+
     def run(self):
         if self._log_path is not None:
             print(f"Find logs at: {self._log_path}")
@@ -250,11 +374,20 @@ class SyncThread(threading.Thread):
                 tb_root, tb_logdirs, tb_event_files, sync_item
             )
             # If we're syncing tensorboard, let's use a tmp dir for images etc.
-            root_dir = TMPDIR.name if sync_tb else os.path.dirname(sync_item)
+            root_dir = (
+                tempfile.mkdtemp(dir=TMPDIR.name)
+                if sync_tb
+                else os.path.dirname(sync_item)
+            )
+
+            checkpoint = None
+            if not sync_tb and not self._view:
+                checkpoint = self._load_checkpoint(sync_item)
 
             # When appending we are allowing a possible resume, ie the run
-            # doesnt have to exist already
-            resume = "allow" if self._append else None
+            # doesnt have to exist already. Continuing from a checkpoint
+            # resumes the run so the file streams pick up where they left off.
+            resume = "allow" if self._append or checkpoint else None
 
             sm = sender.SendManager.setup(root_dir, resume=resume)
             if sync_tb:
@@ -268,47 +401,8 @@ class SyncThread(threading.Thread):
                 print(f".wandb file is empty ({e}), skipping: {sync_item}")
                 continue
 
-            # save exit for final send
-            exit_pb = None
-            finished = False
-            shown = False
-            while True:
-                data = self._robust_scan(ds)
-                if data is None:
-                    break
-                pb, exit_pb, cont = self._parse_pb(data, exit_pb)
-                if exit_pb is not None:
-                    finished = True
-                if cont:
-                    continue
-                sm.send(pb)
-                # send any records that were added in previous send
-                while not sm._record_q.empty():
-                    data = sm._record_q.get(block=True)
-                    sm.send(data)
-
-                if pb.control.req_resp:
-                    result = sm._result_q.get(block=True)
-                    result_type = result.WhichOneof("result_type")
-                    if not shown and result_type == "run_result":
-                        r = result.run_result.run
-                        # TODO(jhr): hardcode until we have settings in sync
-                        url = "{}/{}/{}/runs/{}".format(
-                            self._app_url,
-                            url_quote(r.entity),
-                            url_quote(r.project),
-                            url_quote(r.run_id),
-                        )
-                        print("Syncing: %s ... " % url, end="")
-                        sys.stdout.flush()
-                        shown = True
-            sm.finish()
-            # Only mark synced if the run actually finished
-            if self._mark_synced and not self._view and finished:
-                synced_file = f"{sync_item}{SYNCED_SUFFIX}"
-                with open(synced_file, "w"):
-                    pass
-            print("done.")
+            url = self._sync_run(sm, ds, sync_item, checkpoint)
+            print(f"done: {url or sync_item}" if self._concurrent else "done.")
 
 
 class SyncManager:
@@ -324,9 +418,10 @@ class SyncManager:
         sync_tensorboard=None,
         log_path=None,
         append=None,
+        workers=None,
     ):
         self._sync_list = []
-        self._thread = None
+        self._threads = []
         self._project = project
         self._entity = entity
         self._run_id = run_id
@@ -337,6 +432,7 @@ class SyncManager:
         self._sync_tensorboard = sync_tensorboard
         self._log_path = log_path
         self._append = append
+        self._workers = max(1, workers or 1)
 
     def status(self):
         pass
@@ -345,30 +441,47 @@ class SyncManager:
         self._sync_list.append(os.path.abspath(str(p)))
 
     def start(self):
-        # create a thread for each file?
-        self._thread = SyncThread(
-            sync_list=self._sync_list,
-            project=self._project,
-            entity=self._entity,
-            run_id=self._run_id,
-            view=self._view,
-            verbose=self._verbose,
-            mark_synced=self._mark_synced,
-            app_url=self._app_url,
-            sync_tensorboard=self._sync_tensorboard,
-            log_path=self._log_path,
-            append=self._append,
-        )
-        self._thread.start()
+        num_threads = min(self._workers, len(self._sync_list)) or 1
+        # the threads take their next item from a shared queue as they finish
+        # the previous one, so one large run doesn't hold up the others
+        sync_q = queue.Queue()
+        for sync_item in self._sync_list:
+            sync_q.put(sync_item)
+        for ndx in range(num_threads):
+            thread = SyncThread(
+                sync_list=_drain(sync_q),
+                project=self._project,
+                entity=self._entity,
+                run_id=self._run_id,
+                view=self._view,
+                verbose=self._verbose,
+                mark_synced=self._mark_synced,
+                app_url=self._app_url,
+                sync_tensorboard=self._sync_tensorboard,
+                # print it once
+                log_path=self._log_path if ndx == 0 else None,
+                append=self._append,
+                concurrent=num_threads > 1,
+            )
+            thread.start()
+            self._threads.append(thread)
 
     def is_done(self):
-        return not self._thread.is_alive()
+        return not any(thread.is_alive() for thread in self._threads)
 
     def poll(self):
         time.sleep(1)
         return False
 
 
+def _drain(q):
+    while True:
+        try:
+            yield q.get_nowait()
+        except queue.Empty:
+            return
+
+
 def get_runs(
     include_offline=None,
     include_online=None,
@@ -1,4 +1,5 @@
 import dataclasses
+import gzip
 import json
 import logging
 import socket
@@ -489,6 +490,17 @@ class RelayControlProtocol(Protocol):
         ...  # pragma: no cover
 
 
+def _request_json(request: "flask.Request") -> Any:
+    """Parse the json body of a request, decompressing it if needed."""
+    encoding = request.headers.get("Content-Encoding")
+    if encoding == "gzip":
+        return json.loads(gzip.decompress(request.get_data()))
+    if encoding == "zstd":
+        zstandard = wandb.util.get_module("zstandard", required="zstd compression")
+        return json.loads(zstandard.ZstdDecompressor().decompress(request.get_data()))
+    return request.get_json()
+
+
 class RelayServer:
     def __init__(
         self,
@@ -598,7 +610,7 @@ class RelayServer:
             url=url,
             headers=headers,
             data=request.get_data(),
-            json=request.get_json(),
+            json=_request_json(request),
         ).prepare()
 
         for injected_response in self.inject:
@@ -627,7 +639,7 @@ class RelayServer:
         time_elapsed: float,
         **kwargs: Any,
     ) -> None:
-        request_data = request.get_json()
+        request_data = _request_json(request)
         response_data = response.json() or {}
 
         if self.relay_control:
@@ -4,6 +4,8 @@
 """
 
 import itertools
+import math
+import threading
 from functools import reduce
 from operator import mul
 from typing import List
@@ -65,6 +67,15 @@ def log_track_update(log_track: int) -> bool:
     return True
 
 
+class _GradientBatch:
+    """The gradients of one watched model whose stats are logged together."""
+
+    def __init__(self):
+        self.names = set()
+        # device-side stats waiting for the rest of the backward pass, by name
+        self.stats = {}
+
+
 class TorchHistory:
     """History methods specific to PyTorch"""
 
@@ -75,6 +86,10 @@ class TorchHistory:
         self._num_bins = 64
         self._is_cuda_histc_supported = None
         self.hook_torch = TorchGraph.hook_torch
+        # batched mode: the pending gradient stats of each model, keyed by the
+        # name of each of its gradients
+        self._gradient_batches = {}
+        self._pending_stats_lock = threading.Lock()
 
     def add_log_parameters_hook(
         self,
@@ -82,10 +97,12 @@ class TorchHistory:
         name: str = "",
         prefix: str = "",
         log_freq: int = 0,
+        batched: bool = False,
     ) -> None:
         """This instruments hooks into the pytorch module
         log parameters after a forward pass
         log_freq - log gradients/parameters every N batches
+        batched - compute the stats of all parameters on their device and log them together
         """
         # if name is not None:
         prefix = prefix + name
@@ -96,6 +113,17 @@ class TorchHistory:
         def parameter_log_hook(module, input_, output, log_track):
             if not log_track_update(log_track):
                 return
+            if batched:
+                stats = {}
+                for name, parameter in module.named_parameters():
+                    name = "parameters/" + prefix + name
+                    row = self._tensor_stats_row(parameter.detach())
+                    if row is not None:
+                        stats[name] = row
+                    elif parameter.is_sparse:
+                        self.log_tensor_stats(parameter.detach(), name)
+                self._log_tensor_stats_rows(stats)
+                return
             for name, parameter in module.named_parameters():
                 # for pytorch 0.3 Variables
                 if isinstance(parameter, torch.autograd.Variable):
@@ -124,10 +152,13 @@ class TorchHistory:
         name: str = "",
         prefix: str = "",
         log_freq: int = 0,
+        batched: bool = False,
     ) -> None:
         """This instruments hooks into the pytorch module
         log gradients after a backward pass
         log_freq - log gradients/parameters every N batches
+        batched - compute the stats of all gradients on their device and log them
+            together once the whole backward pass has been seen
         """
 
         # if name is not None:
@@ -136,12 +167,13 @@ class TorchHistory:
         if not hasattr(module, "_wandb_hook_names"):
             module._wandb_hook_names = []
 
+        batch = _GradientBatch() if batched else None
         for name, parameter in module.named_parameters():
             if parameter.requires_grad:
                 log_track_grad = log_track_init(log_freq)
                 module._wandb_hook_names.append("gradients/" + prefix + name)
                 self._hook_variable_gradient_stats(
-                    parameter, "gradients/" + prefix + name, log_track_grad
+                    parameter, "gradients/" + prefix + name, log_track_grad, batch
                 )
 
     def log_tensor_stats(self, tensor, name):
@@ -258,7 +290,94 @@ class TorchHistory:
             commit=False,
         )
 
-    def _hook_variable_gradient_stats(self, var, name, log_track):
+    def _tensor_stats_row(self, tensor):
+        """Compute a tensor's stats on its own device, without syncing with the host.
+
+        Returns a float64 tensor holding the finite min, the finite max, the number
+        of finite values and the histogram counts, in that order. Returns None for
+        empty tensors and for sparse tensors, which go through `log_tensor_stats`.
+        """
+        if tensor.is_sparse or tensor.numel() == 0:
+            return None
+        flat = tensor.reshape(-1)
+        if flat.dtype not in (torch.float32, torch.float64):
+            flat = flat.float()
+
+        finite = torch.isfinite(flat)
+        tmin = torch.where(finite, flat, flat.new_full((), math.inf)).min()
+        tmax = torch.where(finite, flat, flat.new_full((), -math.inf)).max()
+
+        # match histc, which widens the range of constant tensors by one each way
+        constant = tmin == tmax
+        lo = torch.where(constant, tmin - 1, tmin)
+        hi = torch.where(constant, tmax + 1, tmax)
+        scaled = ((flat - lo) * self._num_bins / (hi - lo)).clamp(0, self._num_bins - 1)
+        # non-finite values are counted in an extra bin that is dropped
+        bin_idx = torch.where(finite, scaled, flat.new_full((), self._num_bins)).long()
+        counts = torch.bincount(bin_idx, minlength=self._num_bins + 1)
+
+        return torch.cat(
+            [
+                torch.stack([tmin.double(), tmax.double(), finite.sum().double()]),
+                counts[: self._num_bins].double(),
+            ]
+        )
+
+    def _log_tensor_stats_rows(self, stats):
+        """Copy stats computed by `_tensor_stats_row` to the host and log them as one update."""
+        if not stats:
+            return
+        by_device = {}
+        for name, row in stats.items():
+            by_device.setdefault(row.device, []).append(name)
+
+        histograms = {}
+        for names in by_device.values():
+            # one transfer per device
+            rows = torch.stack([stats[name] for name in names]).cpu()
+            for name, row in zip(names, rows.tolist()):
+                tmin, tmax, num_finite = row[:3]
+                # skip logging if all values are nan or inf
+                if num_finite == 0:
+                    continue
+                bins = torch.linspace(tmin, tmax, steps=self._num_bins + 1)
+                histograms[name] = wandb.Histogram(
+                    np_histogram=(row[3:], bins.tolist())
+                )
+        if histograms:
+            wandb.run._log(histograms, commit=False)
+
+    def _add_pending_gradient_stats(self, batch, name, grad):
+        row = self._tensor_stats_row(grad.detach())
+        if row is None:
+            if grad.is_sparse:
+                self.log_tensor_stats(grad.data, name)
+            return
+        flush = []
+        with self._pending_stats_lock:
+            if name in batch.stats:
+                # a new backward pass started before the previous one was complete,
+                # e.g. because some parameters didn't receive a gradient
+                flush.append(batch.stats)
+                batch.stats = {}
+            batch.stats[name] = row
+            if len(batch.stats) >= len(batch.names):
+                flush.append(batch.stats)
+                batch.stats = {}
+        for stats in flush:
+            self._log_tensor_stats_rows(stats)
+
+    def _flush_gradient_batch(self, batch):
+        with self._pending_stats_lock:
+            stats, batch.stats = batch.stats, {}
+        self._log_tensor_stats_rows(stats)
+
+    def flush_pending_stats(self):
+        batches = {id(batch): batch for batch in self._gradient_batches.values()}
+        for batch in batches.values():
+            self._flush_gradient_batch(batch)
+
+    def _hook_variable_gradient_stats(self, var, name, log_track, batch=None):
         """Logs a Variable's gradient's distribution statistics next time backward()
         is called on it.
         """
@@ -277,18 +396,30 @@ class TorchHistory:
         def _callback(grad, log_track):
             if not log_track_update(log_track):
                 return
-            self.log_tensor_stats(grad.data, name)
+            if batch is not None:
+                self._add_pending_gradient_stats(batch, name, grad)
+            else:
+                self.log_tensor_stats(grad.data, name)
 
         handle = var.register_hook(lambda grad: _callback(grad, log_track))
         self._hook_handles[name] = handle
+        if batch is not None:
+            batch.names.add(name)
+            self._gradient_batches[name] = batch
         return handle
 
     def unhook_all(self):
+        self.flush_pending_stats()
         for handle in self._hook_handles.values():
             handle.remove()
         self._hook_handles = []
+        self._gradient_batches.clear()
 
     def unhook(self, name):
+        batch = self._gradient_batches.pop(name, None)
+        if batch is not None:
+            self._flush_gradient_batch(batch)
+            batch.names.discard(name)
         handle = self._hook_handles.pop(name)
         handle.remove()
 